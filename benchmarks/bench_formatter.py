@@ -0,0 +1,87 @@
+"""Micro-benchmark: format_response_text + split_text_for_streaming vs iter_stream_chunks.
+
+The old pair formats a complete reply once; iter_stream_chunks is timed both
+on the complete reply and fed the reply in 4-character deltas, as it is when
+streaming.
+
+Run from the repository root:
+
+    python benchmarks/bench_formatter.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support")
+)
+
+from Functions import (  # noqa: E402
+    format_response_text,
+    iter_stream_chunks,
+    split_text_for_streaming,
+)
+
+
+WORDS = (
+    "the support agent can help you reset your password configure the printer "
+    "and check the status of an order 1) first step - bullet point"
+).split()
+
+
+def make_response(size: int, seed: int = 0) -> str:
+    """Build a response of roughly `size` characters with escaped and real newlines."""
+    rnd = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        word = rnd.choice(WORDS)
+        sep = rnd.choice((" ", " ", " ", " ", " ", "\n", "\\n"))
+        parts.append(word + sep)
+        length += len(word) + len(sep)
+    return "".join(parts)
+
+
+def make_deltas(text: str, size: int = 4):
+    """Slice text the way a streaming API would deliver it."""
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def old_pair(text: str) -> list:
+    return split_text_for_streaming(format_response_text(text))
+
+
+def new_generator(text) -> list:
+    return list(iter_stream_chunks(text))
+
+
+def bench(label: str, func, arg, repeat: int = 5, number: int = 50) -> float:
+    best = min(timeit.repeat(lambda: func(arg), repeat=repeat, number=number))
+    per_call = best / number * 1e6
+    print(f"  {label:<28} {per_call:10.1f} us/call")
+    return per_call
+
+
+def main():
+    for size in (2_000, 8_000, 32_000):
+        text = make_response(size)
+        deltas = make_deltas(text)
+        assert new_generator(text) == old_pair(text)
+        assert new_generator(deltas) == old_pair(text)
+
+        print(f"{size} chars ({len(deltas)} deltas):")
+        old = bench("format + split", old_pair, text)
+        new = bench("iter_stream_chunks(text)", new_generator, text)
+        fed = bench("iter_stream_chunks(deltas)", new_generator, deltas)
+        print(f"  speedup (text):   {old / new:.2f}x")
+        # the GUI feeds API deltas, so this is the number that matters there
+        print(
+            f"  speedup (deltas): {old / fed:.2f}x, "
+            f"{fed / len(deltas):.2f} us per delta"
+        )
+
+
+if __name__ == "__main__":
+    main()
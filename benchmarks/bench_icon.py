@@ -0,0 +1,111 @@
+"""Cold-start cost of the window icon: import of Gui and icon decoding.
+
+Compares the original path (a 700x700 PNG embedded as a base64 literal in
+Gui.py, decoded with PIL on every window) with the lazy, pre-scaled icon in
+icon_data.py. Window construction is timed as well when a display is available.
+
+Run from the repository root:
+
+    python benchmarks/bench_icon.py
+"""
+
+import base64
+import io
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+APP = ROOT / "usr" / "lib" / "Arxis-AI-Support"
+FULL_ICON = ROOT / "usr" / "share" / "pixmaps" / "arxis.png"
+sys.path.insert(0, str(APP))
+
+from PIL import Image  # noqa: E402
+
+
+def import_self_time(module: str, runs: int = 7) -> float:
+    """Median self time (ms) of importing `module` in a fresh interpreter."""
+    times = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=APP,
+            capture_output=True,
+            text=True,
+        )
+        for line in result.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                times.append(int(fields[0].split()[-1]) / 1000)
+    return statistics.median(times)
+
+
+def parse_literal_ms(source: str, number: int = 50) -> float:
+    """Time to compile a module holding `source` as a string literal."""
+    code = f"def iconImage():\n    return {source!r}\n"
+    return (
+        min(
+            timeit.repeat(lambda: compile(code, "Gui", "exec"), number=number, repeat=5)
+        )
+        / number
+        * 1000
+    )
+
+
+def main():
+    full_png = FULL_ICON.read_bytes()
+    full_b64 = base64.b64encode(full_png).decode()
+
+    from icon_data import ICON_PNG
+
+    def old_decode():
+        image = Image.open(io.BytesIO(base64.b64decode(full_b64)), mode="r")
+        return image.convert("RGBA")  # what ImageTk.PhotoImage does first
+
+    def new_decode():
+        image = Image.open(io.BytesIO(base64.b64decode(ICON_PNG)))
+        return image.convert("RGBA")
+
+    print(
+        f"embedded literal: {len(full_b64):>7} chars before, {len(ICON_PNG):>6} after"
+    )
+    print(
+        f"compile literal:  {parse_literal_ms(full_b64):7.3f} ms before, {parse_literal_ms(ICON_PNG):6.3f} ms after"
+    )
+    print(
+        f"decode icon:      {min(timeit.repeat(old_decode, number=20, repeat=5)) / 20 * 1000:7.3f} ms before, "
+        f"{min(timeit.repeat(new_decode, number=20, repeat=5)) / 20 * 1000:6.3f} ms after"
+    )
+    print(f"import Gui (self): {import_self_time('Gui'):6.3f} ms now")
+
+    if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+        print("window construction: skipped (no display)")
+        return
+
+    import tkinter as tk
+    from PIL import ImageTk
+    from icon import load_icon
+
+    root = tk.Tk()
+    root.withdraw()
+
+    def old_window_icon():
+        photo = ImageTk.PhotoImage(image=old_decode(), master=root)
+        root.wm_iconphoto(False, photo)
+
+    def new_window_icon():
+        root.wm_iconphoto(False, load_icon(root))
+
+    print(
+        f"set window icon:  {min(timeit.repeat(old_window_icon, number=5, repeat=3)) / 5 * 1000:7.3f} ms before, "
+        f"{min(timeit.repeat(new_window_icon, number=5, repeat=3)) / 5 * 1000:6.3f} ms after (cached)"
+    )
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""Offline benchmark of the GUI turn pipeline: process_chat -> format -> chunk -> render.
+
+Drives ConversationController.process_chat, as the GUI runs it, with a
+deterministic streaming backend (seeded latency and response sizes, served to
+the real completion layer and OpenAI SDK by an in-process transport, no API)
+and a stand-in for the Tk main loop that runs every `after` callback,
+including the TkAsyncBridge poller, on this thread and times it. Reports throughput, time to the first rendered
+chunk and main-thread frame stalls:
+
+    python benchmarks/bench_pipeline.py --turns 100 --ttfb 0.05 0.3 --size 200 4000
+
+The transcript goes to a fake Text widget by default, so the numbers are our
+own overhead. With `--tk` (needs a display, e.g. under xvfb-run) a real Text
+widget is used and Tk's own redraw time counts towards the main thread.
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Literal
+
+import openai
+from fsm_llm.state_models import DefaultResponse
+from pydantic import BaseModel
+
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support")
+)
+
+from bench_formatter import make_response  # noqa: E402
+from bot import BotRunner  # noqa: E402
+from bridge import TkAsyncBridge  # noqa: E402
+from completions import SupportLLMUtilities  # noqa: E402
+from controller import ChatView, ConversationController  # noqa: E402
+from metrics import metrics  # noqa: E402
+from pacing import create_pacer  # noqa: E402
+from stub_server import StubTransport  # noqa: E402
+from transcript import TranscriptView  # noqa: E402
+
+FRAME_BUDGET = 1 / 60
+
+
+class BenchResponse(BaseModel):
+    response: DefaultResponse
+    next_state_key: Literal["IDENTIFIED", "END"]
+
+
+class ScriptedTransport(StubTransport):
+    """Answers every completion with the backend's next generated response."""
+
+    def __init__(self, backend):
+        super().__init__(delta_delay=backend.gap, delta_chars=backend.delta)
+        self.backend = backend
+
+    def respond(self, request):
+        self.ttfb, text = self.backend.next_turn()
+        return json.dumps(
+            {"response": {"content": text}, "next_state_key": "IDENTIFIED"}
+        )
+
+
+class ScriptedBackend:
+    """Deterministic stand-in for SupportBot that streams through the real completion layer.
+
+    Each turn goes through SupportLLMUtilities and the OpenAI SDK to a
+    ScriptedTransport, which waits a time-to-first-byte drawn from `ttfb`, then
+    streams a generated response of `size` characters as the API does, in
+    `delta`-character events `gap` seconds apart.
+    """
+
+    class Run:
+        def __init__(self, response):
+            self.response = response
+
+    class FSM:
+        def __init__(self, backend):
+            self.backend = backend
+
+        async def run_state_machine(self, client, user_input, model=None):
+            data = await self.backend.llm.get_completion(
+                client,
+                [{"role": "user", "content": user_input}],
+                BenchResponse,
+                model or "bench",
+            )
+            return ScriptedBackend.Run(data["response"]["content"])
+
+        def is_completed(self):
+            return False
+
+        def get_curr_state(self):
+            return "IDENTIFIED"
+
+    def __init__(self, ttfb, size, delta=4, gap=0.0, seed=0):
+        self.random = random.Random(seed)
+        self.ttfb = ttfb
+        self.size = size
+        self.delta = delta
+        self.gap = gap
+        self.llm = SupportLLMUtilities()
+        self.fsm = self.FSM(self)
+        self.ai_client = openai.AsyncOpenAI(
+            api_key="sk-bench",
+            base_url="http://bench.invalid/v1",
+            http_client=openai.DefaultAsyncHttpxClient(
+                transport=ScriptedTransport(self)
+            ),
+            max_retries=0,
+        )
+        self.turns = 0
+        self.generated = 0
+
+    def next_turn(self):
+        self.turns += 1
+        text = make_response(self.random.randint(*self.size), seed=self.turns)
+        self.generated += len(text)
+        return self.random.uniform(*self.ttfb), text
+
+
+class FakeText:
+    """Just enough of tkinter.Text for TranscriptView: text, marks and indices.
+
+    Tags, images and scrolling are no-ops; an image takes one character.
+    """
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.text = "\n"
+        self.marks = {}
+
+    def _offset(self, index) -> int:
+        index = str(index)
+        if index in self.marks:
+            return self.marks[index][0]
+        if index == "end":
+            return len(self.text)
+        if index == "end-1c":
+            return len(self.text) - 1
+        if index in ("@0,0", "current"):
+            return 0
+        line, column = map(int, index.split("."))
+        offset = 0
+        for _ in range(line - 1):
+            offset = self.text.find("\n", offset) + 1
+            if offset == 0:
+                return len(self.text) - 1
+        return min(offset + column, len(self.text) - 1)
+
+    def index(self, index) -> str:
+        before = self.text[: self._offset(index)]
+        return f"{before.count(chr(10)) + 1}.{len(before) - before.rfind(chr(10)) - 1}"
+
+    def insert(self, index, text, tags=None):
+        # like Tk, nothing goes after the final newline
+        position = min(self._offset(index), len(self.text) - 1)
+        self.text = self.text[:position] + text + self.text[position:]
+        for name, (offset, gravity) in self.marks.items():
+            if offset > position or (offset == position and gravity == "right"):
+                self.marks[name] = (offset + len(text), gravity)
+
+    def image_create(self, index, image=None):
+        self.insert(index, "￼")
+
+    def delete(self, first, last=None):
+        start = self._offset(first)
+        end = self._offset(last) if last is not None else start + 1
+        end = min(end, len(self.text) - 1)
+        if end <= start:
+            return
+        self.text = self.text[:start] + self.text[end:]
+        for name, (offset, gravity) in self.marks.items():
+            if offset >= end:
+                self.marks[name] = (offset - (end - start), gravity)
+            elif offset > start:
+                self.marks[name] = (start, gravity)
+
+    def mark_set(self, name, index):
+        gravity = self.marks.get(name, (0, "right"))[1]
+        self.marks[name] = (self._offset(index), gravity)
+
+    def mark_gravity(self, name, gravity):
+        self.marks[name] = (self.marks[name][0], gravity)
+
+    def mark_unset(self, name):
+        self.marks.pop(name, None)
+
+    def tag_names(self, index=None):
+        return ()
+
+    def after_idle(self, func, *args):
+        self.frames.after(0, func, *args)
+
+    def tag_add(self, *args, **kwargs):
+        pass
+
+    tag_delete = tag_bind = config = see = yview = tag_add
+
+
+class FrameLoop:
+    """Stand-in for the Tk main loop, run on the calling thread.
+
+    Callbacks scheduled with `after` (from any thread) run in due order; each
+    one's duration and how late it started are recorded. With a Tk `root`,
+    its pending events and redraws are processed and timed between callbacks.
+    """
+
+    def __init__(self, root=None):
+        self.root = root
+        self._heap = []
+        self._lock = threading.Lock()
+        self._order = itertools.count()
+        self.durations = []
+        self.lateness = []
+
+    def after(self, ms, func, *args):
+        due = time.perf_counter() + ms / 1000
+        order = next(self._order)
+        with self._lock:
+            heapq.heappush(self._heap, (due, order, func, args))
+        return order
+
+    def after_cancel(self, order):
+        with self._lock:
+            self._heap = [item for item in self._heap if item[1] != order]
+            heapq.heapify(self._heap)
+
+    def _timed(self, func, *args):
+        started = time.perf_counter()
+        func(*args)
+        self.durations.append(time.perf_counter() - started)
+
+    def run_until(self, done):
+        while not done():
+            now = time.perf_counter()
+            item = None
+            with self._lock:
+                if self._heap and self._heap[0][0] <= now:
+                    item = heapq.heappop(self._heap)
+            if item is not None:
+                due, _, func, args = item
+                self.lateness.append(now - due)
+                self._timed(func, *args)
+            elif self.root is not None:
+                self._timed(self.root.update)
+            else:
+                time.sleep(0.0002)
+
+
+class HeadlessView(ChatView):
+    """A ChatView without a window: the transcript on `display`, no status bar."""
+
+    def __init__(self, display):
+        self.transcript = TranscriptView(display)
+
+    def update_status(self, status_text, show_progress=False):
+        pass
+
+    def enable_input(self):
+        pass
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def make_display(frames, use_tk):
+    if not use_tk:
+        return FakeText(frames), None
+    import tkinter
+
+    root = tkinter.Tk()
+    root.geometry("600x700")
+    display = tkinter.Text(root, wrap="word")
+    display.pack(fill="both", expand=True)
+    root.update()
+    return display, root
+
+
+def run(args):
+    frames = FrameLoop()
+    display, frames.root = make_display(frames, args.tk)
+
+    backend = ScriptedBackend(
+        tuple(args.ttfb), tuple(args.size), args.delta, args.gap, args.seed
+    )
+    view = HeadlessView(display)
+    bridge = TkAsyncBridge(frames)
+    app = ConversationController(
+        view, bridge, BotRunner(backend), create_pacer("instant")
+    )
+
+    first_chunk = []
+    submitted = [0.0]
+    write = view.transcript.write
+
+    def timed_write(text, tag):
+        if submitted[0]:
+            first_chunk.append(time.perf_counter() - submitted[0])
+            submitted[0] = 0.0
+        write(text, tag)
+
+    view.transcript.write = timed_write
+
+    started = time.perf_counter()
+    for turn in range(args.turns):
+        submitted[0] = time.perf_counter()
+        future = bridge.submit(
+            app.process_chat(f"question {turn}", submitted=submitted[0])
+        )
+        frames.run_until(lambda: future.done() and not bridge.pending)
+        future.result()
+    elapsed = time.perf_counter() - started
+
+    bridge.close()
+    if frames.root is not None:
+        frames.root.destroy()
+    return backend, elapsed, first_chunk, frames
+
+
+def report(args, backend, elapsed, first_chunk, frames):
+    chars = backend.generated
+    durations = frames.durations
+    stalls = [d for d in durations if d > FRAME_BUDGET]
+    busy = sum(durations)
+
+    print(f"widget:          {'Tk Text' if args.tk else 'fake Text'}")
+    print(f"turns:           {args.turns} in {elapsed:.2f}s")
+    print(
+        f"throughput:      {args.turns / elapsed:.2f} turns/s, "
+        f"{chars / elapsed / 1000:.1f} k chars/s generated"
+    )
+    print(
+        f"first chunk:     p50 {percentile(first_chunk, 50) * 1000:.1f} ms, "
+        f"p95 {percentile(first_chunk, 95) * 1000:.1f} ms "
+        f"(backend ttfb {args.ttfb[0] * 1000:.0f}-{args.ttfb[1] * 1000:.0f} ms)"
+    )
+    print(
+        f"main thread:     {len(durations)} callbacks, busy {busy / elapsed:.1%}, "
+        f"p99 {percentile(durations, 99) * 1000:.2f} ms, "
+        f"max {max(durations) * 1000:.2f} ms"
+    )
+    print(
+        f"frame stalls:    {len(stalls)} callbacks over {FRAME_BUDGET * 1000:.1f} ms, "
+        f"start lateness p99 {percentile(frames.lateness, 99) * 1000:.2f} ms"
+    )
+    for name, values in metrics.snapshot().items():
+        if values["p50"] is None:
+            continue
+        print(
+            f"span {name:<11} n={values['count']:<6} "
+            f"p50 {values['p50'] * 1000:8.2f} ms  p99 {values['p99'] * 1000:8.2f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument(
+        "--ttfb", type=float, nargs=2, default=(0.05, 0.2), metavar=("MIN", "MAX")
+    )
+    parser.add_argument(
+        "--size", type=int, nargs=2, default=(200, 3000), metavar=("MIN", "MAX")
+    )
+    parser.add_argument("--delta", type=int, default=4, help="characters per delta")
+    parser.add_argument(
+        "--gap", type=float, default=0.001, help="seconds between deltas"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--tk", action="store_true", help="render into a real Tk Text widget"
+    )
+    args = parser.parse_args()
+    report(args, *run(args))
+
+
+if __name__ == "__main__":
+    main()
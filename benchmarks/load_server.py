@@ -0,0 +1,89 @@
+"""Offline load test for the headless chat server using the mock backend.
+
+Starts server.ChatServer in-process with MockSupportBot sessions, opens many
+concurrent client connections and reports turn throughput and latency:
+
+    python benchmarks/load_server.py --sessions 500 --latency 0.05 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support")
+)
+
+from server import ChatServer, SessionPool, build_factory  # noqa: E402
+
+
+SCRIPT = ("Alice", "My printer is not working", "Thanks, goodbye")
+
+
+async def run_session(host, port, session_id, latencies, first_delta):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for message in SCRIPT:
+            started = time.perf_counter()
+            request = {"session": session_id, "message": message}
+            writer.write((json.dumps(request) + "\n").encode("utf-8"))
+            await writer.drain()
+
+            seen_delta = False
+            while True:
+                reply = json.loads(await reader.readline())
+                if "delta" in reply and not seen_delta:
+                    first_delta.append(time.perf_counter() - started)
+                    seen_delta = True
+                if reply.get("done") or "error" in reply:
+                    break
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def main(args):
+    pool = SessionPool(build_factory(True, tuple(args.latency)))
+    server = ChatServer(pool)
+    listener = await server.start("127.0.0.1", 0)
+    host, port = listener.sockets[0].getsockname()[:2]
+
+    latencies, first_delta = [], []
+    started = time.perf_counter()
+    async with listener:
+        await asyncio.gather(
+            *(
+                run_session(host, port, f"load-{i}", latencies, first_delta)
+                for i in range(args.sessions)
+            )
+        )
+    elapsed = time.perf_counter() - started
+
+    print(f"sessions:        {args.sessions}")
+    print(f"turns:           {len(latencies)} in {elapsed:.2f}s")
+    print(f"throughput:      {len(latencies) / elapsed:.1f} turns/s")
+    print(
+        f"turn latency:    p50 {percentile(latencies, 50) * 1000:.1f} ms, "
+        f"p95 {percentile(latencies, 95) * 1000:.1f} ms"
+    )
+    if first_delta:
+        print(f"first delta:     mean {statistics.mean(first_delta) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument(
+        "--latency", type=float, nargs=2, default=(0.05, 0.2), metavar=("MIN", "MAX")
+    )
+    asyncio.run(main(parser.parse_args()))
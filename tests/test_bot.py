@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sys
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+import openai
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# bot.py imports its siblings support.py, metrics.py...
+sys.path.insert(0, str(lib_path))
+# every turn must reach the stub
+os.environ["ARXIS_CACHE"] = "off"
+os.environ["ARXIS_FAST_PATH"] = "off"
+
+
+def load(name):
+    spec = spec_from_file_location(name, str(lib_path / f"{name}.py"))
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bot = load("bot")
+mock_bot = load("mock_bot")
+stub_server = load("stub_server")
+support = load("support")
+
+
+async def interrupted_turns():
+    """A timed out or cancelled turn leaves the conversation as it was."""
+    transport = stub_server.StubTransport(advance=True)
+    client = openai.AsyncOpenAI(
+        api_key="sk-test",
+        base_url="http://stub.invalid/v1",
+        http_client=openai.DefaultAsyncHttpxClient(transport=transport),
+        max_retries=0,
+    )
+    runner = bot.BotRunner(support.SupportBot(ai_client=client), turn_timeout=0.05)
+    await runner.process("I'm Alice")
+    fsm = runner.support_bot.fsm
+    history = list(fsm._session_history)
+    # the next turn prepends the pinned user name to the history it sends
+    transport.ttfb = 1.0
+
+    try:
+        await runner.process("my printer is broken")
+    except bot.TurnTimeout:
+        pass
+    else:
+        raise AssertionError("the turn did not time out")
+    assert fsm._session_history == history
+    assert runner.get_state() == "IDENTIFIED" and fsm._next_state is None
+
+    runner.turn_timeout = 5.0
+    task = asyncio.ensure_future(runner.process("my printer is broken"))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    assert fsm._session_history == history
+    await client.close()
+
+
+async def end_real_conversation():
+    client = openai.AsyncOpenAI(
+        api_key="sk-test",
+        base_url="http://stub.invalid/v1",
+        http_client=openai.DefaultAsyncHttpxClient(
+            transport=stub_server.StubTransport(advance=True)
+        ),
+        max_retries=0,
+    )
+    runner = bot.BotRunner(support.SupportBot(ai_client=client))
+    await runner.process("I'm Alice")
+    assert runner.get_state() == "IDENTIFIED"
+    assert not runner.is_completed()
+
+    runner.end()
+    assert runner.get_state() == "END"
+    assert runner.is_completed()
+    info = runner.turn_info()
+    assert info["state"] == "END" and info["completed"]
+
+    # a message after "quit" gets the END state's farewell, not the conversation
+    run = await runner.process("and another thing")
+    assert "Goodbye" in run.response
+    assert runner.is_completed()
+    await client.close()
+
+
+def run_tests():
+    asyncio.run(end_real_conversation())
+    asyncio.run(interrupted_turns())
+
+    runner = bot.BotRunner(mock_bot.MockSupportBot(latency=(0.0, 0.0)))
+    asyncio.run(runner.process("Hi, I'm Alice"))
+    runner.end()
+    assert runner.get_state() == "END" and runner.is_completed()
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,75 @@
+import threading
+import time
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+bridge_path = (
+    Path(__file__).resolve().parents[1]
+    / "usr"
+    / "lib"
+    / "Arxis-AI-Support"
+    / "bridge.py"
+)
+spec = spec_from_file_location("bridge", str(bridge_path))
+bridge = module_from_spec(spec)
+spec.loader.exec_module(bridge)
+
+
+class FakeRoot:
+    """Keeps the poller scheduled by the bridge so the test can run it."""
+
+    def __init__(self):
+        self.poller = None
+
+    def after(self, ms, func):
+        self.poller = func
+        return "after#1"
+
+    def after_cancel(self, after_id):
+        self.poller = None
+
+
+def run_tests():
+    root = FakeRoot()
+    tk_bridge = bridge.TkAsyncBridge(root)
+    calls = []
+
+    async def work():
+        assert threading.current_thread() is tk_bridge.thread
+        tk_bridge.call_soon(calls.append, "from loop")
+        return "done"
+
+    assert tk_bridge.submit(work()).result(timeout=2) == "done"
+
+    # keyed calls queued in the same frame collapse to the latest one
+    tk_bridge.call_soon(calls.append, "status 1", key="status")
+    tk_bridge.call_soon(calls.append, "plain")
+    tk_bridge.call_soon(calls.append, "status 2", key="status")
+    tk_bridge.after(50, calls.append, "later")
+    assert tk_bridge.pending == 5
+
+    root.poller()
+    assert calls == ["from loop", "plain", "status 2"]
+    assert tk_bridge.pending == 1
+
+    time.sleep(0.06)
+    root.poller()
+    assert calls[-1] == "later"
+    assert tk_bridge.pending == 0
+
+    # a failing callback does not stop the batch
+    tk_bridge.call_soon(lambda: 1 / 0)
+    tk_bridge.call_soon(calls.append, "after error")
+    root.poller()
+    assert calls[-1] == "after error"
+
+    tk_bridge.close()
+    assert root.poller is None
+    assert not tk_bridge.thread.is_alive()
+    assert not tk_bridge.loop.is_running()
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import time
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+cache_path = (
+    Path(__file__).resolve().parents[1]
+    / "usr"
+    / "lib"
+    / "Arxis-AI-Support"
+    / "cache.py"
+)
+spec = spec_from_file_location("cache", str(cache_path))
+cache = module_from_spec(spec)
+spec.loader.exec_module(cache)
+
+
+def run_tests():
+    key = cache.cache_key("START", "  My name is   Alice! ", "gpt")
+    assert key == cache.cache_key("START", "My name is Alice", "gpt")
+    assert key != cache.cache_key("END", "My name is Alice", "gpt")
+    assert key != cache.cache_key("START", "My name is Alice", "other-model")
+    assert cache.cache_key("END", "Bye!", "gpt") == cache.cache_key("END", "bye", "gpt")
+
+    # START replies carry the name as typed, so each casing keeps its own entry
+    names = cache.MemoryCache(ttl=None)
+    for name in ("alice", "Alice", "ALICE"):
+        name_key = cache.cache_key("START", f"my name is {name}", "gpt")
+        names.set(name_key, {"response": {"user_name": name}})
+    for name in ("alice", "Alice", "ALICE"):
+        name_key = cache.cache_key("START", f"my name is {name}", "gpt")
+        assert names.get(name_key) == {"response": {"user_name": name}}
+
+    value = {"response": {"user_name": "Alice"}, "next_state_key": "IDENTIFIED"}
+
+    memory = cache.MemoryCache(maxsize=2, ttl=None)
+    assert memory.get(key) is None
+    memory.set(key, value)
+    hit = memory.get(key)
+    assert hit == value
+    hit["response"]["user_name"] = "changed"
+    assert memory.get(key) == value
+
+    memory.set("b", value)
+    memory.set("c", value)
+    assert len(memory) == 2
+    assert memory.get(key) is None
+    assert memory.stats()["hits"] == 2
+    assert memory.stats()["misses"] == 2
+
+    expiring = cache.MemoryCache(ttl=0.01)
+    expiring.set(key, value)
+    time.sleep(0.02)
+    assert expiring.get(key) is None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "responses.sqlite3")
+        disk = cache.DiskCache(path, maxsize=2)
+        disk.set(key, value)
+        disk.set("b", value)
+        disk.set("c", value)
+        assert len(disk) == 2
+        disk.close()
+
+        reopened = cache.DiskCache(path, maxsize=2)
+        assert reopened.get("c") == value
+        reopened.close()
+
+    assert cache.create_cache("off") is None
+    assert isinstance(cache.create_cache("memory"), cache.MemoryCache)
+
+    # the base class cannot be used as a cache itself
+    try:
+        cache.ResponseCache()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("ResponseCache without _get and _set was created")
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
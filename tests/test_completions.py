@@ -0,0 +1,147 @@
+import asyncio
+import json
+import sys
+import time
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+import openai
+from fsm_llm.utils import _generate_response_schema
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# completions.py imports its siblings cache.py, intent.py...; stub_server.py logconfig.py
+sys.path.insert(0, str(lib_path))
+
+
+def load(name):
+    spec = spec_from_file_location(name, str(lib_path / f"{name}.py"))
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+completions = load("completions")
+stub_server = load("stub_server")
+
+MESSAGE = "my printer prints blank pages since this morning"
+
+
+async def stream_through_stub():
+    stub = stub_server.StubServer(delta_delay=0.02, delta_chars=4)
+    server = await stub.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = openai.AsyncOpenAI(
+        base_url=f"http://127.0.0.1:{port}/v1", api_key="sk-test", max_retries=0
+    )
+    response_model = _generate_response_schema(None, {"END": "bye"}, "IDENTIFIED")
+    utils = completions.SupportLLMUtilities()
+    deltas = []
+    utils.on_delta = lambda text: deltas.append((time.perf_counter(), text))
+
+    started = time.perf_counter()
+    result = await utils._stream(
+        client, [{"role": "user", "content": MESSAGE}], response_model, "m"
+    )
+    finished = time.perf_counter()
+    await client.close()
+    server.close()
+    await server.wait_closed()
+    return result, deltas, started, finished
+
+
+class CountingUtilities(completions.SupportLLMUtilities):
+    built = 0
+
+    def build_messages(self, chat_history, current_state):
+        CountingUtilities.built += 1
+        return super().build_messages(chat_history, current_state)
+
+
+class RecordingTransport(stub_server.StubTransport):
+    sent = None
+
+    def respond(self, request):
+        self.sent = request["messages"]
+        return super().respond(request)
+
+
+async def prompt_built_once():
+    """The state prompt is rendered once per turn, streamed or not."""
+    support = load("support")
+    state = support.state_definitions()["IDENTIFIED"]
+    response_model = _generate_response_schema(
+        state.response_model, state.transitions, state.key
+    )
+    transport = RecordingTransport()
+    client = openai.AsyncOpenAI(
+        base_url="http://stub.invalid/v1",
+        api_key="sk-test",
+        http_client=openai.DefaultAsyncHttpxClient(transport=transport),
+        max_retries=0,
+    )
+    for on_delta in (None, lambda text: None):
+        CountingUtilities.built = 0
+        utils = CountingUtilities()
+        utils.on_delta = on_delta
+        result = await utils.get_completion(
+            client, [{"role": "user", "content": MESSAGE}], response_model, "m", state
+        )
+        assert result["response"]["content"] == f"Stub reply to: {MESSAGE}"
+        assert CountingUtilities.built == 1
+        assert utils.last_prompt_tokens > 0
+        sent = transport.sent
+        assert sent[0]["role"] == "system" and sent[-1]["content"] == MESSAGE
+        assert sum(message["role"] == "system" for message in sent) == 1
+    await client.close()
+
+
+def content_stream():
+    reply = json.dumps(
+        {
+            "next_state_key": "IDENTIFIED",
+            "response": {
+                "note": {"content": "not this"},
+                "content": 'Line 1\n\t"quoted" \\ caf\u00e9 \U0001f600 end',
+                "tags": ["content", {"content": "nor this"}],
+            },
+        }
+    )
+    expected = json.loads(reply)["response"]["content"]
+    # every split of the raw JSON gives the same text
+    for size in range(1, len(reply) + 1):
+        stream = completions._ContentStream()
+        pieces = [stream.feed(reply[i : i + size]) for i in range(0, len(reply), size)]
+        assert "".join(pieces) == expected, size
+
+    stream = completions._ContentStream()
+    assert stream.feed('{"response": {"content": "Hello wor') == "Hello wor"
+    # a half-sent escape is held back rather than shown
+    assert stream.feed("ld \\u00") == "ld "
+    assert stream.feed('e9!"}}') == "\u00e9!"
+
+    # each delta is scanned once: a long reply costs linear time
+    stream = completions._ContentStream()
+    started = time.perf_counter()
+    stream.feed('{"response": {"content": "')
+    total = sum(len(stream.feed("word " * 2)) for _ in range(50_000))
+    assert total == 500_000
+    assert time.perf_counter() - started < 2
+
+
+def run_tests():
+    content_stream()
+    asyncio.run(prompt_built_once())
+
+    result, deltas, started, finished = asyncio.run(stream_through_stub())
+    content = result["response"]["content"]
+    assert content == f"Stub reply to: {MESSAGE}"
+    assert "".join(text for _, text in deltas) == content
+    # the reply arrives in pieces, the first well before the stream ends
+    assert len(deltas) > 5
+    assert deltas[0][0] - started < (finished - started) / 2
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,66 @@
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+from types import SimpleNamespace
+
+
+context_path = (
+    Path(__file__).resolve().parents[1]
+    / "usr"
+    / "lib"
+    / "Arxis-AI-Support"
+    / "context.py"
+)
+spec = spec_from_file_location("context", str(context_path))
+context = module_from_spec(spec)
+spec.loader.exec_module(context)
+
+
+def _history(turns):
+    history = []
+    for i in range(turns):
+        history.append({"role": "user", "content": f"question {i} " * 20})
+        history.append({"role": "assistant", "content": f"answer {i} " * 20})
+    return history
+
+
+def run_tests():
+    history = _history(10)
+    total = context.message_tokens(history)
+
+    assert context.FullHistory(max_tokens=10).apply(history) == history
+
+    window = context.SlidingWindow(max_tokens=total // 2, keep_last=2).apply(history)
+    assert context.message_tokens(window) <= total // 2
+    assert window == history[-len(window) :]
+    assert (
+        context.SlidingWindow(max_tokens=1, keep_last=2).apply(history) == history[-2:]
+    )
+
+    summary = context.RollingSummary(max_tokens=total // 2, keep_last=2)
+    kept = summary.apply(history)
+    assert kept[0]["content"].startswith(context.SUMMARY_PREFIX)
+    last_folded = history[len(history) - len(kept)]
+    assert last_folded["content"][:10] in kept[0]["content"]
+
+    fsm = SimpleNamespace(
+        _session_history=list(history),
+        user_defined_context={"verified_user": {"user_name": "Alice"}, "other": 1},
+    )
+    manager = context.ContextManager(
+        context.SlidingWindow(max_tokens=200, keep_last=2), pinned=["verified_user"]
+    )
+    manager.prepare(fsm)
+    manager.prepare(fsm)
+    notes = [m for m in fsm._session_history if m["role"] == "system"]
+    assert len(notes) == 1
+    assert "Alice" in notes[0]["content"] and "other" not in notes[0]["content"]
+    assert manager.last_history_tokens == context.message_tokens(fsm._session_history)
+
+    assert isinstance(
+        context.create_context_manager("summary").policy, context.RollingSummary
+    )
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
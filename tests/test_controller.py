@@ -0,0 +1,199 @@
+import asyncio
+import sys
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+from types import SimpleNamespace
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# controller.py imports its siblings bridge.py, render.py, pacing.py...
+sys.path.insert(0, str(lib_path))
+spec = spec_from_file_location("controller", str(lib_path / "controller.py"))
+controller = module_from_spec(spec)
+spec.loader.exec_module(controller)
+
+from bridge import TkAsyncBridge  # noqa: E402
+from pacing import create_pacer  # noqa: E402
+
+
+class FakeRoot:
+    def __init__(self):
+        self.poller = None
+
+    def after(self, ms, func):
+        self.poller = func
+        return "after#1"
+
+    def after_cancel(self, after_id):
+        self.poller = None
+
+
+class FakeTranscript:
+    """Records what the renderer and the controller do to the transcript."""
+
+    def __init__(self):
+        self.display = SimpleNamespace(config=lambda **kw: None, see=lambda i: None)
+        self.ops = []
+
+    def add(self, segments):
+        self.ops.append(("add", "".join(text for text, _ in segments)))
+
+    def begin(self, label, tag):
+        self.ops.append(("begin", label))
+
+    def write(self, text, tag):
+        self.ops.append(("write", text))
+
+    def replace(self, text, tag):
+        self.ops.append(("replace", text))
+
+    def end(self):
+        self.ops.append(("end",))
+
+    def attach_copy(self):
+        self.ops.append(("copy",))
+
+    def agent_text(self):
+        return "".join(op[1] for op in self.ops if op[0] == "write")
+
+
+class FakeView(controller.ChatView):
+    def __init__(self):
+        self.transcript = FakeTranscript()
+        self.statuses = []
+        self.enabled = 0
+
+    def update_status(self, status_text, show_progress=False):
+        self.statuses.append(status_text)
+
+    def enable_input(self):
+        self.enabled += 1
+
+
+class FakeRunner:
+    def __init__(self, deltas=("Hello ", "there"), error=None):
+        self.deltas = deltas
+        self.error = error
+        self.ended = False
+
+    async def stream(self, user_input):
+        for text in self.deltas:
+            await asyncio.sleep(0)
+            yield SimpleNamespace(text=text, replace=False)
+        if self.error is not None:
+            raise self.error
+
+    async def process(self, user_input):
+        return SimpleNamespace(response="".join(self.deltas))
+
+    def end(self):
+        self.ended = True
+
+    def is_completed(self):
+        return self.ended
+
+    def get_state(self):
+        return "IDENTIFIED"
+
+    def turn_info(self):
+        return {"state": self.get_state(), "completed": self.ended, "model": "test"}
+
+
+class FakeJournal:
+    def __init__(self):
+        self.entries = []
+        self.closed = False
+
+    def record(self, entry):
+        self.entries.append(entry)
+
+    def close(self):
+        self.closed = True
+
+
+def make(runner, streaming=True):
+    root = FakeRoot()
+    view = FakeView()
+    chat = controller.ConversationController(
+        view,
+        TkAsyncBridge(root, poll_ms=1),
+        runner,
+        create_pacer("instant"),
+        streaming=streaming,
+        journal=FakeJournal(),
+    )
+    return root, view, chat
+
+
+def turn(root, chat, text):
+    future = chat.submit(text)
+    try:
+        future.result(timeout=2)
+    except BaseException:
+        pass
+    # the poller runs the queued UI work, which may queue a render flush
+    while chat.bridge.pending:
+        root.poller()
+
+
+def run_tests():
+    root, view, chat = make(FakeRunner())
+    turn(root, chat, "hi")
+    assert view.transcript.ops[0] == ("add", "You: hi\n")
+    assert view.transcript.agent_text() == "Hello there"
+    assert view.transcript.ops[-2:] == [("end",), ("copy",)]
+    assert view.last_agent_response == "Hello there"
+    assert view.statuses[-1] == "Waiting for your response..."
+    assert view.enabled == 1
+    entry = chat.journal.entries[-1]
+    assert entry["user"] == "hi" and entry["reply"] == "Hello there"
+    assert entry["outcome"] == "ok" and entry["state"] == "IDENTIFIED"
+    assert entry["turn"] == 1 and entry["session"] == chat.session_id
+    assert set(entry["latency"]) == {"queue", "first_delta", "turn"}
+
+    # end commands never reach the backend
+    turn(root, chat, "quit")
+    assert chat.backend.ended
+    assert view.transcript.ops[-1] == ("add", "Agent: Conversation ended. Thank you!\n")
+    assert view.statuses[-1] == "Conversation ended"
+    assert chat.journal.entries[-1]["outcome"] == "ended"
+
+    # without streaming the whole reply is played through the pacer
+    root, view, chat = make(FakeRunner(("One reply",)), streaming=False)
+    turn(root, chat, "hi")
+    assert view.transcript.agent_text() == "One reply"
+
+    # a failing backend ends the turn with an apology instead of raising
+    root, view, chat = make(FakeRunner(error=RuntimeError("boom")))
+    turn(root, chat, "hi")
+    assert view.statuses[-1] == "Error occurred"
+    assert "Sorry, I encountered an error: boom" in view.transcript.agent_text()
+    assert view.enabled == 1
+    assert chat.journal.entries[-1]["error"] == "boom"
+
+    # the backend may still be loading when the turn is submitted
+    loading = chat.bridge.submit(asyncio.sleep(0.01, result=FakeRunner(("late",))))
+    root, view, chat = make(loading)
+    turn(root, chat, "hi")
+    assert view.transcript.agent_text() == "late"
+
+    chat.close()
+    assert chat.journal.closed
+    chat.bridge.close()
+
+    # a view missing part of ChatView fails when it is created, not mid-turn
+    class PartialView(controller.ChatView):
+        def enable_input(self):
+            pass
+
+    try:
+        PartialView()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("ChatView without update_status was created")
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
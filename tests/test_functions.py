@@ -1,3 +1,5 @@
+import random
+import time
 from importlib.util import spec_from_file_location, module_from_spec
 from pathlib import Path
 
@@ -15,6 +17,7 @@ spec.loader.exec_module(functions)
 
 format_response_text = functions.format_response_text
 split_text_for_streaming = functions.split_text_for_streaming
+iter_stream_chunks = functions.iter_stream_chunks
 
 
 def run_tests():
@@ -33,6 +36,53 @@ def run_tests():
     reconstructed = "".join([c if c != "\n" else "\n" for c in chunks])
     assert "This is a test line" in reconstructed
 
+    samples = [
+        "",
+        "Line1\\nLine2",
+        "1) Item one\\n- bullet item\\nNormal paragraph",
+        "This is a test line that will be chunked.\nNext line",
+        "  indented   words\t and tabs \n\n\nblank lines above\n",
+        "averyveryverylongwordthatexceedsthechunksize short\\\\n end",
+    ]
+    for text in samples:
+        expected = split_text_for_streaming(format_response_text(text))
+        assert list(iter_stream_chunks(text)) == expected
+        longest = max(map(len, format_response_text(text).split()), default=0)
+
+        # the same text split into arbitrary deltas, including inside "\\n"
+        for size in (1, 2, 3, 7):
+            deltas = [text[i : i + size] for i in range(0, len(text), size)]
+            chunks = list(iter_stream_chunks(deltas))
+            assert "".join(chunks) == "".join(expected)
+            # only a word of chunk_size or more may be sent in pieces
+            if longest < 20:
+                assert chunks == expected
+
+    # random texts and delta sizes, as the API slices them
+    rnd = random.Random(0)
+    parts = ("a", "word", "\\", "n", "\\n", "\n", " ", "  ", "\t", "x" * 25)
+    for _ in range(2000):
+        text = "".join(rnd.choice(parts) for _ in range(rnd.randint(0, 40)))
+        deltas, i = [], 0
+        while i < len(text):
+            size = rnd.randint(1, 8)
+            deltas.append(text[i : i + size])
+            i += size
+        expected = split_text_for_streaming(format_response_text(text))
+        assert "".join(iter_stream_chunks(deltas)) == "".join(expected), text
+
+    # text without whitespace streams in bounded pieces instead of all at close()
+    text = "長" * 32000
+    formatter = functions.StreamFormatter()
+    started = time.perf_counter()
+    chunks = []
+    for i in range(0, len(text), 2):
+        chunks.extend(formatter.feed(text[i : i + 2]))
+    assert len(chunks) > 1000 and max(map(len, chunks)) <= 21
+    chunks.extend(formatter.close())
+    assert "".join(chunks) == text
+    assert time.perf_counter() - started < 2.0
+
 
 if __name__ == "__main__":
     run_tests()
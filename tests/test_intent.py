@@ -0,0 +1,62 @@
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+intent_path = (
+    Path(__file__).resolve().parents[1]
+    / "usr"
+    / "lib"
+    / "Arxis-AI-Support"
+    / "intent.py"
+)
+spec = spec_from_file_location("intent", str(intent_path))
+intent = module_from_spec(spec)
+spec.loader.exec_module(intent)
+
+
+def run_tests():
+    classifier = intent.TransitionClassifier()
+
+    decision = classifier.classify("START", "Hi, my name is Alice Smith!")
+    assert decision.response_data == {
+        "response": {"user_name": "Alice Smith"},
+        "next_state_key": "IDENTIFIED",
+    }
+    # names keep the user's casing
+    for name in ("Anne-Marie", "DeShawn", "o'brien"):
+        decision = classifier.classify("START", f"my name is {name}")
+        assert decision.response_data["response"]["user_name"] == name
+    assert classifier.classify("START", "I need help with my order") is None
+    decision = classifier.classify("START", "Hi, call me Bob")
+    assert decision.response_data["response"]["user_name"] == "Bob"
+    # "call me" may ask for a phone call: only a capitalised name is taken
+    for text in ("call me back", "Call me later!", "call me Back asap", "call me bob"):
+        assert classifier.classify("START", text) is None, text
+
+    for text in ("quit", "Thanks, that's all!", "ok bye", "No thanks, I'm done."):
+        decision = classifier.classify("IDENTIFIED", text)
+        assert decision is not None, text
+        assert decision.response_data["next_state_key"] == "END"
+
+    # "done" also answers "tell me when you're done", so the model decides
+    for text in ("done", "ok done", "Finished.", "that's it", "all done", "I'm done"):
+        decision = classifier.score("IDENTIFIED", text)
+        assert decision is not None and decision.confidence < 0.9, text
+        assert classifier.classify("IDENTIFIED", text) is None, text
+
+    for text in (
+        "I'm done with the setup but it still fails",
+        "Can I exit the app without losing data?",
+        "My printer is not working",
+    ):
+        assert classifier.classify("IDENTIFIED", text) is None, text
+
+    assert classifier.stats() == {"resolved": 9, "deferred": 14}
+
+    assert intent.is_end_command("  EXIT ")
+    assert not intent.is_end_command("exit please")
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
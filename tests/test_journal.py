@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import time
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+journal_path = (
+    Path(__file__).resolve().parents[1]
+    / "usr"
+    / "lib"
+    / "Arxis-AI-Support"
+    / "journal.py"
+)
+spec = spec_from_file_location("journal", str(journal_path))
+journal = module_from_spec(spec)
+spec.loader.exec_module(journal)
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def run_tests():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "nested", "journal.jsonl")
+        log = journal.Journal(path, sync_interval=0.01)
+        for turn in range(3):
+            log.record({"turn": turn, "user": f"message {turn}"})
+        log.close()
+        log.close()
+        entries = read(path)
+        assert [entry["turn"] for entry in entries] == [0, 1, 2]
+        assert all("ts" in entry for entry in entries)
+        assert log.written == 3
+
+        # entries recorded after close are dropped, not written to a closed file
+        log.record({"turn": 3})
+        assert len(read(path)) == 3
+
+        # appending keeps what is already there
+        log = journal.Journal(path)
+        log.record({"turn": 3})
+        log.close()
+        assert len(read(path)) == 4
+
+        # size-based rotation keeps `backups` older files
+        path = os.path.join(tmp, "rotating.jsonl")
+        log = journal.Journal(path, max_bytes=200, backups=2, sync_interval=0.001)
+        for turn in range(20):
+            log.record({"turn": turn, "user": "x" * 50})
+            # one entry per batch, as when turns are seconds apart
+            time.sleep(0.005)
+        log.close()
+        assert os.path.exists(path + ".1")
+        assert not os.path.exists(path + ".3")
+        assert os.path.getsize(path) <= 200
+        assert read(path)[-1]["turn"] == 19
+
+        os.environ["ARXIS_JOURNAL"] = "off"
+        assert journal.create_journal() is None
+        os.environ["ARXIS_JOURNAL"] = os.path.join(tmp, "env.jsonl")
+        log = journal.create_journal()
+        assert log is not None and log.path.endswith("env.jsonl")
+        log.close()
+
+        # mock turns never go to the real journal
+        os.environ["ARXIS_DEMO_JOURNAL"] = os.path.join(tmp, "demo.jsonl")
+        log = journal.create_journal(demo=True)
+        assert log is not None and log.path.endswith("demo.jsonl")
+        log.close()
+        os.environ["ARXIS_JOURNAL"] = "off"
+        assert journal.create_journal(demo=True) is None
+        del os.environ["ARXIS_JOURNAL"], os.environ["ARXIS_DEMO_JOURNAL"]
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,62 @@
+import json
+import logging
+import sys
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# logconfig.py reads the DEBUG flag from its sibling Functions.py
+sys.path.insert(0, str(lib_path))
+spec = spec_from_file_location("logconfig", str(lib_path / "logconfig.py"))
+logconfig = module_from_spec(spec)
+spec.loader.exec_module(logconfig)
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def handle(self, record):
+        self.records.append(record)
+
+
+def run_tests():
+    assert logconfig._level("warning") == logging.WARNING
+    assert logconfig._level(logging.ERROR) == logging.ERROR
+    assert logconfig._level(None) == logging.INFO
+
+    logconfig.configure_logging("info")
+    root = logging.getLogger()
+    assert len(root.handlers) == 1
+    assert isinstance(root.handlers[0], logconfig.QueueHandler)
+
+    collect = _Collect()
+    logconfig._listener.handlers += (collect,)
+
+    class Expensive:
+        def __str__(self):
+            raise AssertionError("formatted a record below the level")
+
+    logging.debug("dropped: %s", Expensive())
+    logging.info("kept %d", 1)
+    logconfig.set_level("debug")
+    logging.debug("now kept %s", "too")
+
+    # calling again only changes the level, it does not add handlers
+    logconfig.configure_logging("warning")
+    assert len(root.handlers) == 1
+    assert root.level == logging.WARNING
+
+    logconfig.stop_logging()
+    messages = [record.getMessage() for record in collect.records]
+    assert messages == ["kept 1", "now kept too"]
+
+    line = logconfig.JsonFormatter().format(collect.records[0])
+    assert json.loads(line)["message"] == "kept 1"
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,55 @@
+import asyncio
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+metrics_path = (
+    Path(__file__).resolve().parents[1]
+    / "usr"
+    / "lib"
+    / "Arxis-AI-Support"
+    / "metrics.py"
+)
+spec = spec_from_file_location("metrics", str(metrics_path))
+metrics = module_from_spec(spec)
+spec.loader.exec_module(metrics)
+
+
+def run_tests():
+    registry = metrics.Metrics(window=10)
+    for value in range(1, 21):
+        registry.observe("api", value / 10)
+
+    snapshot = registry.snapshot()["api"]
+    # totals cover every sample, percentiles only the rolling window (1.1 .. 2.0)
+    assert snapshot["count"] == 20
+    assert abs(snapshot["sum"] - 21.0) < 1e-9
+    assert snapshot["p50"] == 1.6
+    assert snapshot["p99"] == 2.0
+
+    with registry.span("render"):
+        pass
+
+    @registry.timed("fsm_handler")
+    async def handler():
+        return "done"
+
+    assert asyncio.run(handler()) == "done"
+    assert registry.snapshot()["fsm_handler"]["count"] == 1
+
+    lines = registry.to_jsonl().splitlines()
+    assert [line.split('"span": "')[1].split('"')[0] for line in lines] == [
+        "api",
+        "fsm_handler",
+        "render",
+    ]
+
+    text = registry.to_prometheus()
+    assert "# TYPE arxis_api_seconds summary" in text
+    assert 'arxis_api_seconds{quantile="0.5"} 1.600000' in text
+    assert "arxis_api_seconds_count 20" in text
+    assert metrics.Metrics().to_prometheus() == ""
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,51 @@
+import asyncio
+import os
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+pacing_path = (
+    Path(__file__).resolve().parents[1]
+    / "usr"
+    / "lib"
+    / "Arxis-AI-Support"
+    / "pacing.py"
+)
+spec = spec_from_file_location("pacing", str(pacing_path))
+pacing = module_from_spec(spec)
+spec.loader.exec_module(pacing)
+
+
+def run_tests():
+    instant = pacing.create_pacer("instant")
+    assert isinstance(instant, pacing.InstantPacer)
+    assert instant.delay("some text", 1000) == 0.0
+
+    fixed = pacing.create_pacer("fixed", cps=100)
+    assert abs(fixed.delay("x" * 10, 0) - 0.1) < 1e-9
+
+    adaptive = pacing.AdaptivePacer(cps=100, catch_up_chars=100, max_delay=1.0)
+    # a large backlog speeds the reveal up, a small one keeps the base rate
+    assert adaptive.delay("x" * 10, 1000) < adaptive.delay("x" * 10, 10)
+    assert abs(adaptive.delay("x" * 10, 10) - 0.1) < 1e-9
+
+    os.environ["ARXIS_PACING"] = "fixed"
+    os.environ["ARXIS_PACING_CPS"] = "250"
+    try:
+        configured = pacing.create_pacer()
+        assert isinstance(configured, pacing.FixedRatePacer)
+        assert configured.cps == 250
+    finally:
+        del os.environ["ARXIS_PACING"]
+        del os.environ["ARXIS_PACING_CPS"]
+
+    assert isinstance(pacing.create_pacer("bogus"), pacing.AdaptivePacer)
+
+    emitted = []
+    asyncio.run(instant.play(["Hello ", "world", "\n"], emitted.append))
+    assert emitted == ["Hello ", "world", "\n"]
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# replay.py imports its siblings bot.py, support.py...
+sys.path.insert(0, str(lib_path))
+# every turn must reach the stand-in client
+os.environ["ARXIS_CACHE"] = "off"
+os.environ["ARXIS_FAST_PATH"] = "off"
+spec = spec_from_file_location("replay", str(lib_path / "replay.py"))
+replay = module_from_spec(spec)
+spec.loader.exec_module(replay)
+
+
+def entry(turn, user, completion=None, reply=None, outcome="ok"):
+    return {
+        "session": "s1",
+        "turn": turn,
+        "user": user,
+        "outcome": outcome,
+        "completion": completion,
+        "reply": reply,
+        "latency": {"queue": 0.0, "first_delta": 0.01, "turn": 0.02},
+        "api_latency": {"ttfb": 0.004, "total": 0.008},
+    }
+
+
+TRANSCRIPT = [
+    entry(
+        2,
+        "I need help with my printer",
+        {"next_state_key": "IDENTIFIED", "response": {"content": "Is it plugged in?"}},
+        "Is it plugged in?",
+    ),
+    entry(
+        1,
+        "I'm Alice",
+        {"next_state_key": "IDENTIFIED", "response": {"user_name": "Alice"}},
+        "Thank you! You provided your name as: Alice.\nHow can I help you today?",
+    ),
+    entry(3, "hello?", outcome="cancelled"),
+    entry(
+        4,
+        "it is now",
+        {"next_state_key": "IDENTIFIED", "response": {"content": "Great, it works."}},
+        "Something the old handler said",
+    ),
+    entry(5, "quit"),
+]
+
+
+def run_tests():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for item in TRANSCRIPT:
+                f.write(json.dumps(item) + "\n")
+            f.write("not json\n")
+        sessions = replay.load_sessions([path])
+
+    assert list(sessions) == ["s1"]
+    assert [item["turn"] for item in sessions["s1"]] == [1, 2, 3, 4, 5]
+
+    stats = asyncio.run(replay.replay(sessions, repeat=3, latency_scale=1.0))
+    assert stats.sessions == 3 and stats.errors == 0
+    # the cancelled turn and "quit" are not sent
+    assert stats.turns == 9
+    assert stats.mismatches == 3
+    assert len(stats.first_delta) == 9
+    assert min(stats.latencies) >= 0.008
+
+    stats = asyncio.run(replay.replay(sessions, latency_scale=0, stream=False))
+    assert stats.turns == 3 and stats.mismatches == 1
+
+    # a turn without a recorded completion fails the session, not the run
+    broken = {"s2": [dict(entry(1, "I'm Bob"), session="s2")]}
+    stats = asyncio.run(replay.replay(broken, latency_scale=0))
+    assert stats.errors == 1 and stats.turns == 0
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,75 @@
+import asyncio
+import sys
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# retry.py imports its sibling metrics.py
+sys.path.insert(0, str(lib_path))
+retry_path = lib_path / "retry.py"
+spec = spec_from_file_location("retry", str(retry_path))
+retry = module_from_spec(spec)
+spec.loader.exec_module(retry)
+
+
+async def _check_policy():
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise asyncio.TimeoutError()
+        return "ok"
+
+    policy = retry.RetryPolicy(attempts=3, base_delay=0.001)
+    assert await policy.run(flaky) == "ok"
+    assert policy.stats()["retries"] == 2
+
+    calls.clear()
+    try:
+        await policy.run(flaky, retryable=lambda: False)
+        raise AssertionError("expected a timeout")
+    except asyncio.TimeoutError:
+        assert len(calls) == 1
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    try:
+        await retry.RetryPolicy(attempts=1, timeout=0.01).run(slow)
+        raise AssertionError("expected a timeout")
+    except asyncio.TimeoutError:
+        pass
+
+    hedging = retry.RetryPolicy(attempts=1, timeout=None, hedge=True)
+    for _ in range(hedging.hedge_min_samples):
+        hedging.latency.record(0.01)
+    started = []
+
+    async def tail():
+        started.append(1)
+        await asyncio.sleep(1 if len(started) == 1 else 0)
+        return len(started)
+
+    assert await hedging.run(tail, hedge=True) == 2
+    assert hedging.hedged == 1
+
+
+def run_tests():
+    policy = retry.RetryPolicy(base_delay=0.5, max_delay=2.0)
+    for attempt in range(6):
+        assert 0 <= policy.backoff(attempt) <= min(2.0, 0.5 * 2**attempt)
+
+    tracker = retry.LatencyTracker(window=100)
+    assert tracker.percentile(0.95) is None
+    for i in range(100):
+        tracker.record(i / 100)
+    assert tracker.percentile(0.95) == 0.95
+
+    asyncio.run(_check_policy())
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
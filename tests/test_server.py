@@ -0,0 +1,170 @@
+import asyncio
+import json
+import sys
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# server.py imports its siblings bot.py, journal.py...
+sys.path.insert(0, str(lib_path))
+spec = spec_from_file_location("server", str(lib_path / "server.py"))
+server = module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+class FakeBot:
+    """Answers "<message>!" after a delay taken from the message, and logs the order."""
+
+    class FSM:
+        def __init__(self, bot):
+            self.bot = bot
+            self.state = "IDENTIFIED"
+
+        async def run_state_machine(self, client, user_input, model=None):
+            self.bot.started.append(user_input)
+            await asyncio.sleep(float(user_input.split()[-1]))
+            self.bot.finished.append(user_input)
+            return FakeRun(f"{user_input}!")
+
+        def is_completed(self):
+            return self.state == "END"
+
+        def get_curr_state(self):
+            return self.state
+
+    def __init__(self):
+        self.fsm = self.FSM(self)
+        self.ai_client = None
+        self.started = []
+        self.finished = []
+
+    def end(self):
+        self.fsm.state = "END"
+
+
+class FakeRun:
+    def __init__(self, response):
+        self.response = response
+
+
+def pool_eviction_and_pruning():
+    pool = server.SessionPool(lambda: server.BotRunner(FakeBot()), max_sessions=2)
+    a = pool.get("a")
+    pool.get("b")
+
+    async def evict_while_a_is_mid_turn():
+        async with a.lock:
+            # "a" is least recently used, but busy, so "b" goes
+            pool.get("c")
+
+    asyncio.run(evict_while_a_is_mid_turn())
+    assert len(pool) == 2
+    assert pool.get("a") is a
+    # now "c" is least recently used and nothing is busy
+    pool.get("d")
+    assert sorted(pool._sessions) == ["a", "d"]
+
+    pool.idle_timeout = 60.0
+    a.last_used -= 120.0
+
+    async def prune_while_a_is_mid_turn():
+        async with a.lock:
+            return pool.prune()
+
+    assert asyncio.run(prune_while_a_is_mid_turn()) == 0
+    assert pool.prune() == 1
+    assert list(pool._sessions) == ["d"]
+    pool.drop("d")
+    pool.drop("missing")
+    assert len(pool) == 0
+
+
+async def exchange(port, lines, replies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for line in lines:
+        writer.write(line if isinstance(line, bytes) else (line + "\n").encode())
+    await writer.drain()
+    received = []
+    while len(received) < replies:
+        line = await asyncio.wait_for(reader.readline(), 5)
+        if not line:
+            break
+        received.append(json.loads(line))
+    writer.close()
+    return received
+
+
+async def chat_server_requests():
+    bots = []
+
+    def factory():
+        bots.append(FakeBot())
+        return server.BotRunner(bots[-1])
+
+    pool = server.SessionPool(factory)
+    chat = server.ChatServer(pool)
+    tcp = await chat.start("127.0.0.1", 0)
+    port = tcp.sockets[0].getsockname()[1]
+
+    # turns of one session run in order, even when the first is the slowest
+    replies = await exchange(
+        port,
+        [
+            json.dumps({"session": "s", "message": "first 0.05"}),
+            json.dumps({"session": "s", "message": "second 0"}),
+            json.dumps({"session": "t", "message": "other 0"}),
+        ],
+        6,
+    )
+    assert bots[0].finished == ["first 0.05", "second 0"]
+    s_done = [r for r in replies if r.get("session") == "s" and r.get("done")]
+    assert len(s_done) == 2 and s_done[0]["state"] == "IDENTIFIED"
+    s_text = [r["delta"] for r in replies if r.get("session") == "s" and "delta" in r]
+    assert s_text == ["first 0.05!", "second 0!"]
+
+    # the end command ends the conversation and frees the session
+    replies = await exchange(port, [json.dumps({"session": "s", "message": "quit"})], 2)
+    assert replies[-1] == {
+        "session": "s",
+        "done": True,
+        "state": "END",
+        "completed": True,
+    }
+    assert bots[0].fsm.state == "END"
+    assert "s" not in pool._sessions
+
+    # bad and empty requests get an error, not a dropped connection
+    replies = await exchange(
+        port,
+        [
+            "not json",
+            json.dumps({"message": "no session"}),
+            json.dumps({"session": "u", "message": "   "}),
+            "",
+            json.dumps({"metrics": "json"}),
+        ],
+        4,
+    )
+    assert replies[0]["error"].startswith("Bad request")
+    assert replies[1]["error"].startswith("Bad request")
+    assert replies[2] == {"session": "u", "error": "Empty message"}
+    assert "metrics" in replies[3]
+
+    # an overlong line is refused and the connection closed
+    line = b'{"session": "v", "message": "' + b"x" * server.MAX_REQUEST_BYTES + b'"}\n'
+    replies = await exchange(port, [line], 2)
+    assert replies == [{"session": None, "error": "Request line too long"}]
+
+    tcp.close()
+    await tcp.wait_closed()
+
+
+def run_tests():
+    pool_eviction_and_pruning()
+    asyncio.run(chat_server_requests())
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,109 @@
+import logging
+import sys
+import time
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# tkwatchdog.py records into its sibling metrics.py
+sys.path.insert(0, str(lib_path))
+spec = spec_from_file_location("tkwatchdog", str(lib_path / "tkwatchdog.py"))
+tkwatchdog = module_from_spec(spec)
+spec.loader.exec_module(tkwatchdog)
+spec = spec_from_file_location("bridge", str(lib_path / "bridge.py"))
+bridge = module_from_spec(spec)
+spec.loader.exec_module(bridge)
+
+
+class FakeRoot:
+    """Records `after` calls instead of running a Tk event loop."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+        return f"after#{len(self.scheduled)}"
+
+    def after_cancel(self, after_id):
+        pass
+
+
+def slow_callback():
+    time.sleep(0.03)
+
+
+class Warnings(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def bridged_stall():
+    """A slow call run by the bridge's poller is blamed by its own name."""
+    root = FakeRoot()
+    watchdog = tkwatchdog.TkWatchdog(root, interval_ms=1, threshold_ms=20)
+    watchdog.start()
+    tk_bridge = bridge.TkAsyncBridge(root, watchdog=watchdog)
+    poller = root.scheduled.pop()
+    warnings = Warnings()
+    logging.getLogger().addHandler(warnings)
+    try:
+        tk_bridge.call_soon(slow_callback)
+        tk_bridge.call_soon(lambda: None)
+        # as Tk runs the poller: through the timed CallWrapper
+        tkwatchdog._TimedCallWrapper(poller, None, None)()
+    finally:
+        logging.getLogger().removeHandler(warnings)
+        tk_bridge.close()
+        watchdog.stop()
+    assert watchdog.stalls == 1, warnings.messages
+    assert len(warnings.messages) == 1
+    assert "slow_callback (test_tkwatchdog.py:" in warnings.messages[0]
+    assert watchdog._slowest[0] is slow_callback
+
+
+def run_tests():
+    def callit():
+        func()
+
+    func = slow_callback
+    name = tkwatchdog.describe(callit)
+    assert name.startswith("slow_callback (test_tkwatchdog.py:"), name
+
+    root = FakeRoot()
+    original = tkwatchdog.tkinter.CallWrapper
+    watchdog = tkwatchdog.TkWatchdog(root, interval_ms=1, threshold_ms=20)
+    watchdog.start()
+    assert tkwatchdog.tkinter.CallWrapper is tkwatchdog._TimedCallWrapper
+
+    # a callback over the threshold is a stall
+    wrapper = tkwatchdog._TimedCallWrapper(slow_callback, None, None)
+    wrapper()
+    assert watchdog.stalls == 1
+
+    # the heartbeat measures lag; the slow callback was already reported
+    root.scheduled.pop()()
+    assert watchdog.ticks == 1
+    assert watchdog.max_lag >= 0.02
+    assert watchdog.stalls == 1
+
+    # lag without a slow callback is reported too
+    time.sleep(0.03)
+    root.scheduled.pop()()
+    assert watchdog.stalls == 2
+
+    watchdog.stop()
+    assert tkwatchdog.tkinter.CallWrapper is original
+    assert watchdog.stats()["ticks"] == 2
+
+    bridged_stall()
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,245 @@
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+
+transcript_path = (
+    Path(__file__).resolve().parents[1]
+    / "usr"
+    / "lib"
+    / "Arxis-AI-Support"
+    / "transcript.py"
+)
+spec = spec_from_file_location("transcript", str(transcript_path))
+transcript = module_from_spec(spec)
+spec.loader.exec_module(transcript)
+
+IMAGE = "<img>"
+
+
+class FakeText:
+    """Enough of tk.Text for TranscriptView: characters with tags, marks, images.
+
+    Indices are "1.0", "end", "end-1c", "@0,0", mark names or the character
+    offsets `index` returns. The widget's implicit trailing newline is left out.
+    """
+
+    def __init__(self):
+        self.cells = []  # [character or IMAGE, set of tags]
+        self.marks = {}  # name -> [offset, gravity]
+        self.bindings = {}
+        self.current = 0
+        self.idle = []
+        self.config_calls = []
+
+    def _offset(self, index) -> int:
+        index = str(index)
+        if index in ("1.0", "@0,0"):
+            return 0
+        if index in ("end", "end-1c"):
+            return len(self.cells)
+        if index in self.marks:
+            return self.marks[index][0]
+        return int(index)
+
+    def text(self) -> str:
+        return "".join(char for char, _ in self.cells)
+
+    def index(self, index) -> str:
+        return str(self._offset(index))
+
+    def _insert_cells(self, index, cells):
+        at = self._offset(index)
+        self.cells[at:at] = cells
+        for mark in self.marks.values():
+            if mark[0] > at or (mark[0] == at and mark[1] == "right"):
+                mark[0] += len(cells)
+
+    def insert(self, index, text, tags=""):
+        tags = {tags} if isinstance(tags, str) else set(tags)
+        tags.discard("")
+        self._insert_cells(index, [[char, set(tags)] for char in text])
+
+    def image_create(self, index, image=None):
+        self._insert_cells(index, [[IMAGE, set()]])
+
+    def delete(self, first, last=None):
+        start = self._offset(first)
+        end = self._offset(last) if last is not None else start + 1
+        del self.cells[start:end]
+        for mark in self.marks.values():
+            if mark[0] > end:
+                mark[0] -= end - start
+            elif mark[0] > start:
+                mark[0] = start
+
+    def mark_set(self, name, index):
+        gravity = self.marks.get(name, [0, "right"])[1]
+        self.marks[name] = [self._offset(index), gravity]
+
+    def mark_gravity(self, name, gravity):
+        self.marks[name][1] = gravity
+
+    def mark_unset(self, name):
+        del self.marks[name]
+
+    def tag_add(self, name, index):
+        self.cells[self._offset(index)][1].add(name)
+
+    def tag_delete(self, name):
+        for _, tags in self.cells:
+            tags.discard(name)
+
+    def tag_names(self, index=None):
+        return tuple(self.cells[self.current if index == "current" else index][1])
+
+    def tag_bind(self, tag, sequence, func):
+        self.bindings[(tag, sequence)] = func
+
+    def config(self, **kwargs):
+        self.config_calls.append(kwargs)
+
+    def after_idle(self, func, *args):
+        self.idle.append((func, args))
+
+    def yview(self, *args):
+        pass
+
+    def run_idle(self):
+        while self.idle:
+            func, args = self.idle.pop(0)
+            func(*args)
+
+    def click(self, tag):
+        """Click the first character carrying `tag`, as on a copy action."""
+        self.current = next(i for i, (_, tags) in enumerate(self.cells) if tag in tags)
+        return self.bindings[("COPY", "<Button-1>")]()
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+def message(index):
+    return [("You: ", "user"), (f"message {index}\n", "")]
+
+
+def shown(view, copy="Copy"):
+    """What the widget should hold for the entries `view` has materialized."""
+    parts = []
+    for index in range(view.first, view.last):
+        entry = view.store[index]
+        parts.extend(text for text, _ in entry.segments)
+        if entry.copyable:
+            parts.append(f"\n{copy}\n\n")
+    return "".join(parts)
+
+
+def add_and_page():
+    display = FakeText()
+    view = transcript.TranscriptView(display, FakeScrollbar(), window=4, page=2)
+    for index in range(6):
+        view.add(message(index))
+    # only the newest `window` entries are in the widget
+    assert (view.first, view.last) == (2, 6) and view.following
+    assert display.text() == shown(view)
+    assert "entry0" not in display.marks and "entry1" not in display.marks
+
+    # scrolled to the top: the previous page is shown, the bottom is trimmed
+    view._on_scroll("0.0", "0.5")
+    view._on_scroll("0.0", "0.5")
+    assert len(display.idle) == 1
+    display.run_idle()
+    assert (view.first, view.last) == (0, 4) and not view.following
+    assert display.text() == shown(view)
+    assert display.config_calls[-1] == {"state": transcript.ttk.DISABLED}
+
+    # back at the bottom: the newer page returns
+    view._on_scroll("0.5", "1.0")
+    display.run_idle()
+    assert (view.first, view.last) == (2, 6) and view.following
+    assert display.text() == shown(view)
+
+    # a new message while paged back jumps to the newest entries first
+    view._on_scroll("0.0", "0.5")
+    display.run_idle()
+    view.add(message(6))
+    assert (view.first, view.last) == (3, 7)
+    assert display.text() == shown(view)
+
+
+def streaming():
+    display = FakeText()
+    view = transcript.TranscriptView(display, FakeScrollbar(), window=3, page=2)
+    for index in range(4):
+        view.add(message(index))
+
+    # paged back when the reply starts
+    view._on_scroll("0.0", "0.5")
+    display.run_idle()
+    assert not view.following
+    view.begin("Agent: ", "agent")
+    assert view.following and (view.first, view.last) == (2, 5)
+    view.write("Hello", "agent_text")
+    view.write(" there", "agent_text")
+
+    # paging back mid-stream keeps the streamed message in the widget
+    view._on_scroll("0.0", "0.5")
+    display.run_idle()
+    assert view.first == 0 and view.last == 5
+    view.write(", wait", "agent_text")
+    view.replace("Hello, fixed", "agent_text")
+    view.end()
+    assert view.store[-1].segments == [
+        ("Agent: ", "agent"),
+        ("Hello, fixed", "agent_text"),
+        ("\n", ""),
+    ]
+    assert display.text() == shown(view)
+    assert display.text().endswith("Agent: Hello, fixed\n")
+
+    # once the stream is over, the window limit applies again
+    view.add(message(5))
+    assert (view.first, view.last) == (3, 6)
+    assert display.text() == shown(view)
+
+
+def copy_actions():
+    copied = []
+    for image in (None, object()):
+        display = FakeText()
+        view = transcript.TranscriptView(
+            display, FakeScrollbar(), copy_image=image, on_copy=copied.append, window=3
+        )
+        for index in range(5):
+            view.begin("Agent: ", "agent")
+            view.write(f"answer {index}", "agent_text")
+            view.end()
+            view.attach_copy()
+            view.attach_copy()
+        copy = "Copy" if image is None else IMAGE
+        assert display.text() == shown(view, copy)
+
+        for index in range(view.first, view.last):
+            assert display.click(f"copy{index}") == "break"
+            assert copied[-1] == f"answer {index}"
+        # copy tags of entries trimmed from the widget are gone
+        assert not any("copy0" in tags for _, tags in display.cells)
+
+        # paged back in, an older entry's copy action works again
+        view._on_scroll("0.0", "0.5")
+        display.run_idle()
+        assert display.text() == shown(view, copy)
+        display.click(f"copy{view.first}")
+        assert copied[-1] == f"answer {view.first}"
+
+
+def run_tests():
+    add_and_page()
+    streaming()
+    copy_actions()
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+import httpx
+
+
+lib_path = Path(__file__).resolve().parents[1] / "usr" / "lib" / "Arxis-AI-Support"
+# transport.py and stub_server.py import their siblings journal.py, logconfig.py
+sys.path.insert(0, str(lib_path))
+
+
+def load(name):
+    spec = spec_from_file_location(name, str(lib_path / f"{name}.py"))
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+transport = load("transport")
+stub_server = load("stub_server")
+
+SCHEMA = {
+    "$defs": {
+        "DefaultResponse": {
+            "properties": {"content": {"type": "string"}},
+            "required": ["content"],
+            "type": "object",
+            "additionalProperties": False,
+        }
+    },
+    "properties": {
+        "response": {"$ref": "#/$defs/DefaultResponse"},
+        "next_state_key": {"enum": ["IDENTIFIED", "END"], "type": "string"},
+    },
+    "required": ["response", "next_state_key"],
+    "type": "object",
+    "additionalProperties": False,
+}
+
+
+def upstream(request):
+    if request.method == "HEAD":
+        return httpx.Response(200)
+    body = json.loads(request.content)
+    text = f"data: answer to {body['messages'][-1]['content']}\n\n"
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        stream=httpx.ByteStream(text.encode("utf-8")),
+    )
+
+
+async def post(client, message):
+    body = {"model": "m", "messages": [{"role": "user", "content": message}]}
+    response = await client.post("https://api.test/v1/chat/completions", json=body)
+    return response.status_code, response.text
+
+
+async def record_and_replay(path):
+    recorder = transport.RecordingTransport(httpx.MockTransport(upstream), path)
+    async with httpx.AsyncClient(transport=recorder) as client:
+        first = await post(client, "hello")
+        second = await post(client, "héllo again")
+        assert (await client.head("https://api.test/v1")).status_code == 200
+    assert first == (200, "data: answer to hello\n\n")
+
+    with open(path, encoding="utf-8") as f:
+        cassette = [json.loads(line) for line in f]
+    assert len(cassette) == 2
+    assert cassette[0]["headers"] == {"content-type": "text/event-stream"}
+    assert "authorization" not in json.dumps(cassette).lower()
+
+    player = transport.ReplayTransport(path, latency_scale=0)
+    assert len(player) == 2
+    async with httpx.AsyncClient(transport=player) as client:
+        assert (await client.head("https://api.test/v1")).status_code == 200
+        # matched by body, whatever the order
+        assert await post(client, "héllo again") == second
+        # an unrecorded request gets the next unused exchange for its path
+        assert await post(client, "something new") == first
+        assert player.misses == 1
+        status, text = await post(client, "hello")
+        assert status == 404 and "cassette_miss" in text
+
+
+async def stub_round_trip():
+    stub = stub_server.StubServer(delta_chars=5)
+    server = await stub.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    body = {
+        "model": "m",
+        "messages": [{"role": "user", "content": "hi"}],
+        "response_format": {"type": "json_schema", "json_schema": {"schema": SCHEMA}},
+    }
+    url = f"http://127.0.0.1:{port}/v1/chat/completions"
+    async with httpx.AsyncClient() as client:
+        completion = (await client.post(url, json=body)).json()
+        content = json.loads(completion["choices"][0]["message"]["content"])
+        assert content["next_state_key"] == "IDENTIFIED"
+
+        events = []
+        async with client.stream("POST", url, json=dict(body, stream=True)) as response:
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    events.append(line[6:])
+        assert events.pop() == "[DONE]"
+        streamed = [json.loads(event)["choices"][0]["delta"] for event in events]
+        streamed = [delta.get("content") or "" for delta in streamed]
+        assert json.loads("".join(streamed)) == content
+        assert (await client.get(url)).status_code == 404
+    assert stub.requests == 2
+    server.close()
+    await server.wait_closed()
+
+
+def run_tests():
+    value = stub_server.fill_schema(SCHEMA, "text")
+    assert value == {"response": {"content": "text"}, "next_state_key": "IDENTIFIED"}
+    assert (
+        stub_server.fill_schema(SCHEMA, "text", advance=True)["next_state_key"] == "END"
+    )
+
+    os.environ["ARXIS_TRANSPORT"] = "bogus"
+    assert transport.transport_mode() == "live"
+    os.environ["ARXIS_TRANSPORT"] = "stub"
+    assert transport.is_offline()
+    assert "base_url" in transport.client_options()
+    del os.environ["ARXIS_TRANSPORT"]
+    assert transport.create_transport(httpx.Limits()) is None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(record_and_replay(os.path.join(tmp, "cassette.jsonl")))
+    asyncio.run(stub_round_trip())
+
+
+if __name__ == "__main__":
+    run_tests()
+    print("All tests passed")
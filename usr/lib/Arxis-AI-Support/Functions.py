@@ -1,3 +1,6 @@
+from typing import Iterable, Iterator, List, Optional, Union
+
+
 Version_Number = "2.0.8"
 # Make Version a single string reference so imports using Version work correctly
 Version = Version_Number
@@ -13,23 +16,7 @@ def format_response_text(text: str) -> str:
     if not text:
         return text
 
-    formatted = text.replace("\\n", "\n")
-
-    lines = formatted.split("\n")
-    processed_lines = []
-
-    for line in lines:
-
-        if line.strip() and line.strip()[0].isdigit() and ")" in line[:5]:
-            processed_lines.append(line)
-
-        elif line.strip().startswith("-"):
-            processed_lines.append(line)
-
-        else:
-            processed_lines.append(line)
-
-    return "\n".join(processed_lines)
+    return text.replace("\\n", "\n")
 
 
 def split_text_for_streaming(text: str) -> list:
@@ -67,3 +54,128 @@ def split_text_for_streaming(text: str) -> list:
             chunks.append("\n")
 
     return chunks
+
+
+class StreamFormatter:
+    """Incremental, single-pass equivalent of format_response_text + split_text_for_streaming.
+
+    Feed raw text or streamed deltas with `feed` and call `close` once the text is
+    complete; both return display-ready chunks. Joining every chunk produced for a
+    text gives the same result as `split_text_for_streaming(format_response_text(text))`,
+    and so do the chunks themselves unless a word reaches `chunk_size` characters
+    before its end has arrived: such a word is sent in pieces rather than held back.
+    """
+
+    def __init__(self, chunk_size: int = 20):
+        self.chunk_size = chunk_size
+        self._tail = ""
+        self._chunk = ""
+        # after a word sent in pieces: "word" while it may go on, "space" once it
+        # has ended and the next word on its line needs a separating space
+        self._open: Optional[str] = None
+        # how much text can be held before a chunk may be complete
+        self._room = chunk_size
+
+    def feed(self, delta: str) -> List[str]:
+        """Consume a piece of raw text, returning every chunk that is now complete."""
+        text = self._tail + delta
+        # Until the held text could take the current chunk past chunk_size no
+        # chunk can complete, so most deltas are only appended, without a scan.
+        if len(text) < self._room and "\n" not in delta and "\\" not in text:
+            self._tail = text
+            return []
+        # the tail is shorter than chunk_size, so this costs O(len(delta))
+        text = text.replace("\\n", "\n")
+
+        # Hold back the trailing run of non-space characters: it may be an
+        # unfinished word or the backslash half of a "\\n" escape.
+        end = len(text)
+        if text and not text[-1].isspace():
+            end -= len(text.rsplit(None, 1)[-1])
+        out: List[str] = []
+        if end:
+            self._tokens(text, end, out)
+
+        run = text[end:]
+        if len(run) < self.chunk_size:
+            self._tail = run
+            return out
+        # A long run (a URL, code, text without spaces) is sent now; only a
+        # trailing backslash has to wait for the next delta.
+        self._tail = "\\" if run.endswith("\\") else ""
+        self._piece(run[: len(run) - len(self._tail)], out)
+        return out
+
+    def close(self) -> List[str]:
+        """Flush whatever is still buffered once the text is complete."""
+        tail, self._tail = self._tail, ""
+        out: List[str] = []
+        self._tokens(tail, len(tail), out)
+        self._open = None
+        if self._chunk:
+            out.append(self._chunk)
+            self._chunk = ""
+        self._room = self.chunk_size
+        return out
+
+    def _piece(self, piece: str, out: List[str]):
+        if not piece:
+            return
+        if self._open != "word":
+            chunk = self._chunk
+            if self._open == "space":
+                piece = " " + piece
+            elif len(chunk) > self.chunk_size:
+                out.append(chunk + " ")
+            elif chunk:
+                piece = f"{chunk} {piece}"
+            self._chunk = ""
+            self._open = "word"
+            self._room = 0
+        out.append(piece)
+
+    def _tokens(self, text: str, end: int, out: List[str]):
+        chunk = self._chunk
+        size = self.chunk_size
+        open_ = self._open
+        newline = False
+        for line in text[:end].split("\n"):
+            if newline:
+                if chunk:
+                    out.append(chunk)
+                    chunk = ""
+                out.append("\n")
+                open_ = None
+            newline = True
+            words = line.split()
+            if open_ == "word" and line:
+                if not line[0].isspace():
+                    # the rest of a word already sent in pieces
+                    out.append(words.pop(0))
+                open_ = "space"
+            for word in words:
+                if open_ == "space":
+                    chunk = " " + word
+                    open_ = None
+                elif not chunk:
+                    chunk = word
+                elif len(chunk) > size:
+                    # More words follow on this line, so keep the separating space.
+                    out.append(chunk + " ")
+                    chunk = word
+                else:
+                    chunk = f"{chunk} {word}"
+        self._chunk = chunk
+        self._open = open_
+        self._room = size - len(chunk) if open_ is None else 0
+
+
+def iter_stream_chunks(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Yield display-ready chunks for raw text or an iterable of streamed deltas."""
+    if isinstance(source, str):
+        source = (source,)
+
+    formatter = StreamFormatter()
+    for delta in source:
+        yield from formatter.feed(delta)
+    yield from formatter.close()
@@ -1,6 +1,39 @@
+import asyncio
 import logging
-from support import SupportBot
-from fsm_llm.state_models import FSMRun
+import os
+from typing import TYPE_CHECKING, AsyncIterator, NamedTuple, Optional
+from metrics import metrics
+
+
+if TYPE_CHECKING:
+    from fsm_llm.state_models import FSMRun
+
+
+DEFAULT_MODEL = "gpt-5-nano-2025-08-07"
+DEFAULT_TURN_TIMEOUT = 120.0
+
+
+class TurnTimeout(asyncio.TimeoutError):
+    """A turn did not finish before its deadline."""
+
+
+def _turn_timeout() -> Optional[float]:
+    try:
+        return float(os.getenv("ARXIS_TURN_TIMEOUT", DEFAULT_TURN_TIMEOUT)) or None
+    except ValueError:
+        logging.error("ARXIS_TURN_TIMEOUT is not a number, using the default")
+        return DEFAULT_TURN_TIMEOUT
+
+
+class StreamDelta(NamedTuple):
+    """A piece of agent text yielded by `BotRunner.stream`.
+
+    When `replace` is True the text supersedes everything streamed so far for
+    this turn (a state handler returned something other than the model's text).
+    """
+
+    text: str
+    replace: bool = False
 
 
 class BotRunner:
@@ -8,24 +41,161 @@ class BotRunner:
 
     Responsibilities:
     - Hold the SupportBot instance
-    - Provide an async `process` method returning the FSMRun
+    - Provide an async `process` method returning the FSMRun, bounded by a deadline
+    - Provide an async `stream` iterator yielding response text as it arrives
     - Expose simple helpers for state and completion checks
     """
 
-    def __init__(self):
+    def __init__(self, support_bot=None, turn_timeout: Optional[float] = None):
+        """Wrap `support_bot`, or a new SupportBot when none is given.
+
+        Any object exposing `fsm`, `ai_client` and `end` like SupportBot works, e.g.
+        `mock_bot.MockSupportBot` for offline runs. `turn_timeout` bounds a whole
+        turn, retries included (ARXIS_TURN_TIMEOUT, default 120 seconds).
+        """
         try:
-            self.support_bot = SupportBot()
+            if support_bot is None:
+                # only the real bot needs the OpenAI stack; the demo runs without it
+                from support import SupportBot
+
+                support_bot = SupportBot()
+            self.support_bot = support_bot
+            self.turn_timeout = (
+                turn_timeout if turn_timeout is not None else _turn_timeout()
+            )
+            self.last_run: Optional["FSMRun"] = None
+            self.last_model: Optional[str] = None
         except Exception as e:
             logging.error(f"Failed to initialize SupportBot: {e}")
             raise
 
-    async def process(
-        self, user_input: str, model: str = "gpt-5-nano-2025-08-07"
-    ) -> FSMRun:
-        """Run the FSM for a user input and return the FSMRun result."""
-        return await self.support_bot.fsm.run_state_machine(
-            self.support_bot.ai_client, user_input=user_input, model=model
-        )
+    async def process(self, user_input: str, model: str = DEFAULT_MODEL) -> "FSMRun":
+        """Run the FSM for a user input and return the FSMRun result.
+
+        Raises TurnTimeout when the turn misses its deadline. A timed out or
+        cancelled turn leaves the conversation state as it was before the turn.
+        The FSM run is recorded as the `fsm` span.
+        """
+        fsm = self.support_bot.fsm
+        saved = None
+        context = getattr(self.support_bot, "context", None)
+        if context is not None:
+            # run_state_machine only commits its histories once the turn is
+            # done, but the context policy rewrites the history before it starts
+            saved = (fsm._session_history, fsm._next_state)
+            context.prepare(fsm)
+
+        self.last_model = model
+        try:
+            with metrics.span("fsm"):
+                self.last_run = await asyncio.wait_for(
+                    fsm.run_state_machine(
+                        self.support_bot.ai_client, user_input=user_input, model=model
+                    ),
+                    self.turn_timeout,
+                )
+        except asyncio.TimeoutError as e:
+            if saved is not None:
+                fsm._session_history, fsm._next_state = saved
+            raise TurnTimeout("The support service did not respond in time") from e
+        except asyncio.CancelledError:
+            if saved is not None:
+                fsm._session_history, fsm._next_state = saved
+            raise
+        return self.last_run
+
+    async def stream(
+        self, user_input: str, model: str = DEFAULT_MODEL
+    ) -> AsyncIterator[StreamDelta]:
+        """Run the FSM for a user input, yielding response text as the API streams it.
+
+        The completed FSMRun is available as `last_run` once iteration finishes.
+        """
+        llm = getattr(self.support_bot, "llm", None)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        if llm is not None:
+            llm.on_delta = queue.put_nowait
+        task = asyncio.ensure_future(self.process(user_input, model=model))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+
+        streamed = []
+        try:
+            while True:
+                delta = await queue.get()
+                if delta is None:
+                    break
+                streamed.append(delta)
+                yield StreamDelta(delta)
+
+            run = task.result()
+            final = str(run.response or "")
+            sent = "".join(streamed)
+            if final.startswith(sent):
+                if len(final) > len(sent):
+                    yield StreamDelta(final[len(sent) :])
+            else:
+                yield StreamDelta(final, replace=True)
+        finally:
+            if llm is not None:
+                llm.on_delta = None
+            if not task.done():
+                task.cancel()
+
+    def cache_stats(self) -> Optional[dict]:
+        """Hit/miss statistics of the response cache, if one is in use."""
+        cache = getattr(getattr(self.support_bot, "llm", None), "cache", None)
+        return cache.stats() if cache is not None else None
+
+    def prompt_stats(self) -> Optional[dict]:
+        """Estimated tokens of the last turn's history and full prompt.
+
+        `prompt_tokens` is 0 when the turn was answered without calling the API.
+        """
+        context = getattr(self.support_bot, "context", None)
+        llm = getattr(self.support_bot, "llm", None)
+        if context is None or llm is None:
+            return None
+        return {
+            "history_tokens": context.last_history_tokens,
+            "prompt_tokens": llm.last_prompt_tokens,
+        }
+
+    def retry_stats(self) -> Optional[dict]:
+        """Retry, hedging and latency figures of the completion layer."""
+        retry = getattr(getattr(self.support_bot, "llm", None), "retry", None)
+        return retry.stats() if retry is not None else None
+
+    def fast_path_stats(self) -> Optional[dict]:
+        """How many turns the local transition classifier resolved or deferred."""
+        classifier = getattr(getattr(self.support_bot, "llm", None), "classifier", None)
+        return classifier.stats() if classifier is not None else None
+
+    def turn_info(self) -> dict:
+        """State, model and structured completion of the last turn, for the journal.
+
+        `source` says where the completion came from: api, cache or fast_path;
+        `api_latency` holds the API call's `ttfb` (streamed only) and `total`.
+        """
+        info = {
+            "state": self.get_state(),
+            "completed": self.is_completed(),
+            "model": self.last_model,
+        }
+        llm = getattr(self.support_bot, "llm", None)
+        if llm is not None:
+            info["source"] = llm.last_source
+            info["completion"] = llm.last_completion
+            info["prompt_tokens"] = llm.last_prompt_tokens
+            info["api_latency"] = llm.last_api_latency
+        return info
+
+    def end(self):
+        """Move the conversation to its END state, e.g. on "quit"."""
+        try:
+            self.support_bot.end()
+        except Exception as e:
+            logging.error(f"Error ending the conversation: {e}")
 
     def is_completed(self) -> bool:
         return self.support_bot.fsm.is_completed()
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Coroutine, Hashable, Optional
+
+
+POLL_MS = 16
+
+
+class TkAsyncBridge:
+    """The one crossing point between the Tk thread and the asyncio loop.
+
+    Owns a long-lived event loop running in a daemon thread; coroutines are
+    submitted to it with `submit`. UI work from any thread goes through
+    `call_soon`/`after` onto a single queue that one Tk-side poller drains every
+    `poll_ms`, running each batch in one Tk callback. Worker threads never call
+    into Tk themselves.
+
+    With a `watchdog` (tkwatchdog.TkWatchdog), each call in a batch is timed on
+    its own, so a stall names the call that blocked instead of the poller.
+
+    Calls given a `key` replace a still-queued call with the same key, so e.g.
+    several status changes within one frame only update the label once.
+    """
+
+    def __init__(self, root, poll_ms: int = POLL_MS, watchdog=None):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.watchdog = watchdog
+        self._queue: deque = deque()
+        self._delayed = []
+        self._after_id = None
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+        self._after_id = root.after(poll_ms, self._drain)
+
+    def _run_loop(self):
+        try:
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_forever()
+        except Exception as e:
+            logging.error(f"Background event loop stopped with error: {e}")
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule `coro` on the event loop; failures are logged."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def _log_failure(fut):
+            if not fut.cancelled() and fut.exception() is not None:
+                logging.error(f"Coroutine raised: {fut.exception()}")
+
+        future.add_done_callback(_log_failure)
+        return future
+
+    def call_soon(self, func: Callable, *args, key: Optional[Hashable] = None):
+        """Run `func(*args)` on the Tk thread with the next batch. Thread-safe."""
+        self._queue.append((key, func, args))
+
+    def after(self, ms: int, func: Callable, *args):
+        """Run `func(*args)` on the Tk thread in about `ms` milliseconds. Thread-safe.
+
+        Delays up to one poll interval run with the next batch.
+        """
+        if ms <= self.poll_ms:
+            self.call_soon(func, *args)
+            return
+        self._queue.append(
+            (None, self._delay, (time.perf_counter() + ms / 1000, func, args))
+        )
+
+    def _delay(self, due: float, func: Callable, args: tuple):
+        self._delayed.append((due, func, args))
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue) + len(self._delayed)
+
+    def _batch(self) -> list:
+        items = []
+        while self._queue:
+            items.append(self._queue.popleft())
+        latest = {
+            key: index for index, (key, _, _) in enumerate(items) if key is not None
+        }
+        return [
+            (func, args)
+            for index, (key, func, args) in enumerate(items)
+            if key is None or latest[key] == index
+        ]
+
+    def _drain(self):
+        try:
+            batch = self._batch()
+            if self._delayed:
+                now = time.perf_counter()
+                due = [item for item in self._delayed if item[0] <= now]
+                self._delayed = [item for item in self._delayed if item[0] > now]
+                batch.extend((func, args) for _, func, args in due)
+            for func, args in batch:
+                try:
+                    if self.watchdog is not None:
+                        self.watchdog.timed(func, func, *args)
+                    else:
+                        func(*args)
+                except Exception as e:
+                    logging.error(f"Error in UI callback {func!r}: {e}")
+        finally:
+            if self._after_id is not None:
+                self._after_id = self.root.after(self.poll_ms, self._drain)
+
+    def close(self, timeout: float = 2.0):
+        """Stop the poller and the event loop. Call on the Tk thread."""
+        after_id, self._after_id = self._after_id, None
+        if after_id is not None:
+            try:
+                self.root.after_cancel(after_id)
+            except Exception as e:
+                logging.error(f"Error cancelling the UI poller: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=timeout)
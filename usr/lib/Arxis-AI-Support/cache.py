@@ -0,0 +1,220 @@
+import copy
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+
+DEFAULT_CACHE_PATH = os.path.expanduser("~/.cache/arxis-ai-support/responses.sqlite3")
+
+
+# States whose responses carry text extracted from the input (START: the user's
+# name), so inputs differing only in case must not share an entry.
+CASE_SENSITIVE_STATES = ("START",)
+
+
+def normalize_input(text: str, casefold: bool = True) -> str:
+    """Normalise user input so trivially different phrasings share a cache entry."""
+    if casefold:
+        text = text.casefold()
+    return " ".join(text.split()).rstrip(".!?")
+
+
+def cache_key(state: str, user_input: str, model: str) -> str:
+    text = normalize_input(user_input, casefold=state not in CASE_SENSITIVE_STATES)
+    return "\x1f".join((model, state, text))
+
+
+class ResponseCache(ABC):
+    """Base class for caches of structured completions keyed by `cache_key`.
+
+    Subclasses implement `_get` and `_set`; hit and miss counts are kept here.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: dict):
+        self._set(key, value)
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[dict]:
+        """The stored value for `key`, or None."""
+
+    @abstractmethod
+    def _set(self, key: str, value: dict):
+        """Store `value` under `key`."""
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+
+class MemoryCache(ResponseCache):
+    """Bounded in-memory LRU cache with per-entry time-to-live."""
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = 3600.0):
+        super().__init__()
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(value)
+
+    def _set(self, key: str, value: dict):
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._entries[key] = (expires, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        super().clear()
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache(ResponseCache):
+    """SQLite-backed cache that survives restarts, bounded to `maxsize` rows."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        maxsize: int = 10000,
+        ttl: Optional[float] = 7 * 24 * 3600.0,
+    ):
+        super().__init__()
+        self.path = path
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if self.ttl and created + self.ttl < time.time():
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+        return json.loads(value)
+
+    def _set(self, key: str, value: dict):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+            self._db.commit()
+
+    def clear(self):
+        super().clear()
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def create_cache(kind: Optional[str] = None) -> Optional[ResponseCache]:
+    """Build the response cache selected by the deployment settings.
+
+    - ARXIS_CACHE: memory (default), disk or off
+    - ARXIS_CACHE_SIZE: maximum number of entries
+    - ARXIS_CACHE_TTL: entry lifetime in seconds (0 disables expiry)
+    - ARXIS_CACHE_PATH: database file for the disk cache
+    """
+    kind = (kind or os.getenv("ARXIS_CACHE") or "memory").strip().lower()
+    if kind in ("off", "none", "0", "false"):
+        return None
+
+    try:
+        size = int(os.getenv("ARXIS_CACHE_SIZE", 0)) or None
+        ttl = os.getenv("ARXIS_CACHE_TTL")
+        ttl = float(ttl) if ttl is not None else None
+    except ValueError:
+        logging.error("Invalid ARXIS_CACHE_SIZE or ARXIS_CACHE_TTL, using defaults")
+        size, ttl = None, None
+
+    options = {}
+    if size is not None:
+        options["maxsize"] = size
+    if ttl is not None:
+        options["ttl"] = ttl or None
+
+    if kind == "disk":
+        try:
+            return DiskCache(
+                os.getenv("ARXIS_CACHE_PATH", DEFAULT_CACHE_PATH), **options
+            )
+        except (OSError, sqlite3.Error) as e:
+            logging.error(f"Could not open disk cache, using memory cache: {e}")
+    elif kind != "memory":
+        logging.error(f"Unknown cache type '{kind}', using memory cache")
+    return MemoryCache(**options)
@@ -0,0 +1,149 @@
+import importlib.util
+import logging
+import os
+import threading
+from typing import Optional
+
+import httpx
+import openai
+
+from transport import client_options, create_transport
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logging.error(f"{name} is not an integer, using {default}")
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logging.error(f"{name} is not a number, using {default}")
+        return default
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class ClientManager:
+    """Owns the process-wide AsyncOpenAI client and its pooled HTTP transport.
+
+    Every BotRunner shares the client returned by `get`, so repeated turns reuse
+    warm keep-alive (and, when available, HTTP/2) connections instead of opening
+    new TLS sessions. Call `aclose` on shutdown, from the event loop that used the
+    client, to release the connections cleanly.
+
+    Pool settings default to the ARXIS_HTTP_* environment variables:
+    - ARXIS_HTTP_MAX_CONNECTIONS: total connections (default 100)
+    - ARXIS_HTTP_MAX_KEEPALIVE: idle connections kept open (default 20)
+    - ARXIS_HTTP_KEEPALIVE_EXPIRY: seconds an idle connection is kept (default 30)
+    - ARXIS_HTTP2: use HTTP/2 when the `h2` package is installed (default on)
+
+    ARXIS_TRANSPORT swaps the HTTP transport for a recording, replaying or stub
+    one; see transport.create_transport.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ):
+        # Unset values are read from the environment when the client is built,
+        # after the env files have been loaded.
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self._http = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    def _build_http_client(self):
+        max_connections = self.max_connections
+        if max_connections is None:
+            max_connections = _env_int("ARXIS_HTTP_MAX_CONNECTIONS", 100)
+        max_keepalive = self.max_keepalive
+        if max_keepalive is None:
+            max_keepalive = _env_int("ARXIS_HTTP_MAX_KEEPALIVE", 20)
+        keepalive_expiry = self.keepalive_expiry
+        if keepalive_expiry is None:
+            keepalive_expiry = _env_float("ARXIS_HTTP_KEEPALIVE_EXPIRY", 30.0)
+        http2 = self.http2
+        if http2 is None:
+            http2 = _env_flag("ARXIS_HTTP2", True)
+
+        if http2 and importlib.util.find_spec("h2") is None:
+            logging.info("HTTP/2 requested but the 'h2' package is missing")
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        transport = create_transport(limits, http2)
+        if transport is not None:
+            return openai.DefaultAsyncHttpxClient(transport=transport)
+        return openai.DefaultAsyncHttpxClient(limits=limits, http2=http2)
+
+    def get(self) -> openai.AsyncOpenAI:
+        """Return the shared client, creating it on first use."""
+        with self._lock:
+            if self._client is None:
+                # retries, backoff and timeouts are handled by retry.RetryPolicy
+                self._http = self._build_http_client()
+                self._client = openai.AsyncOpenAI(
+                    http_client=self._http, max_retries=0, **client_options()
+                )
+            return self._client
+
+    async def warm_up(self, timeout: float = 10.0) -> bool:
+        """Open a pooled connection to the API host ahead of the first request.
+
+        Any HTTP answer means DNS, TCP and TLS are done and the connection stays
+        in the keep-alive pool for the first completion.
+        """
+        client = self.get()
+        try:
+            await self._http.head(str(client.base_url), timeout=timeout)
+            return True
+        except Exception as e:
+            logging.info(f"Connection warm-up failed: {e}")
+            return False
+
+    async def aclose(self):
+        """Close the shared client and its connection pool."""
+        with self._lock:
+            client, self._client = self._client, None
+            self._http = None
+        if client is None:
+            return
+        try:
+            await client.close()
+        except Exception as e:
+            logging.error(f"Error closing OpenAI client: {e}")
+
+
+client_manager = ClientManager()
+
+
+def get_client() -> openai.AsyncOpenAI:
+    return client_manager.get()
+
+
+async def close_client():
+    await client_manager.aclose()
@@ -0,0 +1,366 @@
+import json
+import logging
+import re
+import time
+from typing import Callable, Iterable, List, Optional, Type
+
+import openai
+from fsm_llm.llm_handler import LLMUtilities
+from fsm_llm.state_models import FSMError, FSMState
+from fsm_llm.utils import _add_transitions
+from pydantic import BaseModel
+
+from cache import ResponseCache, cache_key
+from context import message_tokens
+from intent import TransitionClassifier
+from metrics import metrics
+from retry import RetryPolicy
+
+
+# States whose handlers turn the structured response into templated text, so a
+# completion for the same input can safely be replayed from the cache.
+CACHEABLE_STATES = ("START", "END")
+
+
+def _chat_completions(client: openai.AsyncOpenAI):
+    """Return the chat completions resource that supports structured streaming.
+
+    Older openai releases only expose `stream` under `client.beta`.
+    """
+    completions = client.chat.completions
+    if hasattr(completions, "stream"):
+        return completions
+    return client.beta.chat.completions
+
+
+def _content_of(parsed) -> Optional[str]:
+    """Pull the `response.content` string out of a (partial) structured response."""
+    if not isinstance(parsed, dict):
+        return None
+    response = parsed.get("response")
+    if not isinstance(response, dict):
+        return None
+    content = response.get("content")
+    return content if isinstance(content, str) else None
+
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class _ContentStream:
+    """Decode `response.content` from a structured reply as its JSON streams in.
+
+    `feed` takes each new piece of the raw JSON and returns the content text it
+    completes. The scan position is kept between pieces, so every delta is read
+    once however long the reply grows; a half-sent escape is held back until
+    the rest of it arrives.
+    """
+
+    def __init__(self):
+        # one entry per open container: [key, expecting_key] for objects,
+        # None for arrays
+        self._stack: list = []
+        self._string: Optional[str] = None  # "key", "content" or "value"
+        self._key: List[str] = []
+        self._pending = ""
+
+    def _in_content(self) -> bool:
+        stack = self._stack
+        return (
+            len(stack) == 2
+            and stack[0] is not None
+            and stack[0][0] == "response"
+            and stack[1] is not None
+            and stack[1][0] == "content"
+        )
+
+    def feed(self, delta: str) -> str:
+        text, self._pending = self._pending + delta, ""
+        out: List[str] = []
+        i, n = 0, len(text)
+        while i < n:
+            if self._string is None:
+                i = self._structure(text, i)
+                continue
+            match = _STRING_SPECIAL.search(text, i)
+            end = match.start() if match else n
+            if self._string == "content":
+                out.append(text[i:end])
+            elif self._string == "key":
+                self._key.append(text[i:end])
+            if match is None:
+                break
+            if text[end] == '"':
+                self._close_string()
+                i = end + 1
+                continue
+            size = _escape_size(text, end)
+            if end + size > n:
+                self._pending = text[end:]
+                break
+            if self._string != "value":
+                try:
+                    char = json.loads(f'"{text[end:end + size]}"')
+                except ValueError:
+                    char = ""
+                (out if self._string == "content" else self._key).append(char)
+            i = end + size
+        return "".join(out)
+
+    def _structure(self, text: str, i: int) -> int:
+        """Read one character outside strings; return the next position."""
+        char = text[i]
+        frame = self._stack[-1] if self._stack else None
+        if char == '"':
+            if frame is not None and frame[1]:
+                self._string = "key"
+            else:
+                self._string = "content" if self._in_content() else "value"
+        elif char == "{":
+            self._stack.append([None, True])
+        elif char == "[":
+            self._stack.append(None)
+        elif char in "}]":
+            if self._stack:
+                self._stack.pop()
+        elif char == "," and frame is not None:
+            frame[0], frame[1] = None, True
+        return i + 1
+
+    def _close_string(self):
+        if self._string == "key" and self._stack and self._stack[-1] is not None:
+            self._stack[-1][0] = "".join(self._key)
+            self._stack[-1][1] = False
+            self._key = []
+        self._string = None
+
+
+def _escape_size(text: str, at: int) -> int:
+    """Length of the escape sequence starting at the backslash `text[at]`."""
+    if at + 1 >= len(text) or text[at + 1] != "u":
+        return 2
+    high = text[at + 2 : at + 6]
+    # a high surrogate only decodes together with the low one after it
+    if len(high) == 4 and high[:2].lower() in ("d8", "d9", "da", "db"):
+        return 12
+    return 6
+
+
+class SupportLLMUtilities(LLMUtilities):
+    """LLM handler used by SupportBot's state machine.
+
+    Behaves exactly like fsm_llm's LLMUtilities unless `on_delta` is set, in which
+    case the completion is streamed and every new piece of `response.content` is
+    passed to `on_delta` as soon as the API sends it.
+
+    Before calling the API, a confident local `classifier` decision is used when
+    available, then completions for `cacheable_states` are looked up in `cache`
+    by state, normalised user input and model. API calls go through `retry` for
+    timeouts, retries and (non-streaming only) hedging. Every attempt records the
+    `api` span, and streamed ones `api_ttfb` too.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        cacheable_states: Iterable[str] = CACHEABLE_STATES,
+        classifier: Optional[TransitionClassifier] = None,
+        retry: Optional[RetryPolicy] = None,
+    ):
+        self.on_delta: Optional[Callable[[str], None]] = None
+        self.retry = retry if retry is not None else RetryPolicy(attempts=1)
+        self._emitted = 0
+        self.last_prompt_tokens = 0
+        # the structured response of the last completion and where it came from
+        self.last_completion: Optional[dict] = None
+        self.last_source: Optional[str] = None
+        # seconds to the first streamed event and to the whole API call, retries included
+        self.last_api_latency: Optional[dict] = None
+        self._ttfb: Optional[float] = None
+        self.cache = cache
+        self.cacheable_states = frozenset(cacheable_states)
+        self.classifier = classifier
+
+    @staticmethod
+    def build_messages(chat_history: list, current_state: Optional[FSMState]) -> list:
+        """Prepend the state's system prompt to the chat history."""
+        if not current_state:
+            return chat_history
+
+        processed_prompt = LLMUtilities.process_prompt_template(
+            current_state.prompt_template,
+            getattr(current_state, "user_defined_context", {}),
+            current_state.preprocess_prompt_template,
+        )
+        processed_prompt = _add_transitions(processed_prompt, current_state)
+
+        messages = [{"role": "system", "content": processed_prompt}] + chat_history
+
+        if current_state.preprocess_chat:
+            messages = current_state.preprocess_chat(messages)
+        return messages
+
+    @staticmethod
+    def _last_user_input(chat_history: list) -> Optional[str]:
+        if not chat_history or chat_history[-1].get("role") != "user":
+            return None
+        return chat_history[-1]["content"]
+
+    def _fast_path(
+        self, chat_history: list, current_state: Optional[FSMState]
+    ) -> Optional[dict]:
+        if self.classifier is None or current_state is None:
+            return None
+        user_input = self._last_user_input(chat_history)
+        if user_input is None:
+            return None
+
+        decision = self.classifier.classify(current_state.key, user_input)
+        if decision is None:
+            return None
+        next_state = decision.response_data.get("next_state_key")
+        if (
+            next_state != current_state.key
+            and next_state not in current_state.transitions
+        ):
+            return None
+        logging.debug("Fast path resolved %s: %s", current_state.key, decision.reason)
+        return decision.response_data
+
+    def _cache_key(
+        self, chat_history: list, llm_model: str, current_state: Optional[FSMState]
+    ) -> Optional[str]:
+        if self.cache is None or current_state is None:
+            return None
+        if current_state.key not in self.cacheable_states:
+            return None
+        user_input = self._last_user_input(chat_history)
+        if user_input is None:
+            return None
+        return cache_key(current_state.key, user_input, llm_model)
+
+    def _emit(self, text: str):
+        on_delta = self.on_delta
+        if on_delta is None or not text:
+            return
+        self._emitted += 1
+        try:
+            on_delta(text)
+        except Exception as e:
+            logging.error(f"Error forwarding streamed delta: {e}")
+
+    async def get_completion(
+        self,
+        async_openai_instance: openai.AsyncOpenAI,
+        chat_history: list,
+        response_model: Type[BaseModel],
+        llm_model: str,
+        current_state: Optional[FSMState] = None,
+    ) -> dict:
+        self.last_prompt_tokens = 0
+        self.last_completion = self.last_source = self.last_api_latency = None
+        local = self._fast_path(chat_history, current_state)
+        if local is not None:
+            self._emit(_content_of(local) or "")
+            self._remember(local, "fast_path")
+            return local
+
+        key = self._cache_key(chat_history, llm_model, current_state)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logging.debug("Response cache hit for state %s", current_state.key)
+                self._emit(_content_of(cached) or "")
+                self._remember(cached, "cache")
+                return cached
+
+        # rendered once: counted here and sent as is by _request
+        messages = self.build_messages(chat_history, current_state)
+        self.last_prompt_tokens = message_tokens(messages)
+        logging.debug(
+            "Prompt for state %s: ~%d tokens",
+            getattr(current_state, "key", None),
+            self.last_prompt_tokens,
+        )
+        self._ttfb = None
+        started = time.perf_counter()
+        response_data = await self._request(
+            async_openai_instance, messages, response_model, llm_model
+        )
+
+        if key is not None:
+            self.cache.set(key, response_data)
+        self.last_api_latency = {
+            "ttfb": self._ttfb,
+            "total": time.perf_counter() - started,
+        }
+        self._remember(response_data, "api")
+        return response_data
+
+    def _remember(self, response_data: dict, source: str):
+        self.last_completion = response_data
+        self.last_source = source
+
+    async def _request(
+        self,
+        async_openai_instance: openai.AsyncOpenAI,
+        messages: list,
+        response_model: Type[BaseModel],
+        llm_model: str,
+    ) -> dict:
+        """Call the API with `messages`, already including the state's system prompt."""
+        if self.on_delta is None:
+            return await self.retry.run(
+                lambda: self._complete(
+                    async_openai_instance, messages, response_model, llm_model
+                ),
+                hedge=True,
+            )
+
+        # Once text has reached the user a retry would show it twice.
+        self._emitted = 0
+        return await self.retry.run(
+            lambda: self._stream(
+                async_openai_instance, messages, response_model, llm_model
+            ),
+            retryable=lambda: self._emitted == 0,
+        )
+
+    @staticmethod
+    @metrics.timed("api")
+    async def _complete(*args) -> dict:
+        # with no current_state fsm_llm sends the messages as they are
+        return await LLMUtilities.get_completion(*args)
+
+    async def _stream(
+        self,
+        async_openai_instance: openai.AsyncOpenAI,
+        messages: list,
+        response_model: Type[BaseModel],
+        llm_model: str,
+    ) -> dict:
+        content = _ContentStream()
+        started = time.perf_counter()
+        first = True
+
+        async with _chat_completions(async_openai_instance).stream(
+            model=llm_model,
+            messages=messages,
+            response_format=response_model,
+        ) as stream:
+            async for event in stream:
+                if first:
+                    self._ttfb = time.perf_counter() - started
+                    metrics.observe("api_ttfb", self._ttfb)
+                    first = False
+                if event.type != "content.delta":
+                    continue
+                self._emit(content.feed(event.delta))
+            completion = await stream.get_final_completion()
+        metrics.observe("api", time.perf_counter() - started)
+
+        message = completion.choices[0].message
+        if not message.parsed:
+            raise FSMError(f"Error in parsing the completion: {message.refusal}")
+
+        return message.parsed.model_dump()
@@ -0,0 +1,180 @@
+import importlib.util
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import Iterable, Optional
+
+
+# Per-message overhead of the chat format (role, separators), in tokens.
+MESSAGE_OVERHEAD = 4
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+FACTS_PREFIX = "Known facts about this conversation:\n"
+
+
+@lru_cache(maxsize=None)
+def _encoding():
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+    import tiktoken
+
+    return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when installed, else estimate ~4 chars per token."""
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+def message_tokens(messages: Iterable[dict]) -> int:
+    return sum(
+        count_tokens(str(message.get("content", ""))) + MESSAGE_OVERHEAD
+        for message in messages
+    )
+
+
+def _is_note(message: dict) -> bool:
+    """True for the summary and facts notes added by ContextManager."""
+    content = str(message.get("content", ""))
+    return message.get("role") == "system" and content.startswith(
+        (SUMMARY_PREFIX, FACTS_PREFIX)
+    )
+
+
+class ContextPolicy:
+    """Decides which part of the session history is sent with the next turn.
+
+    `apply` receives the history without any summary or facts note added by a
+    previous turn and returns the messages to keep.
+    """
+
+    def __init__(self, max_tokens: int = 3000, keep_last: int = 4):
+        self.max_tokens = max_tokens
+        self.keep_last = keep_last
+
+    def apply(self, history: list) -> list:
+        return history
+
+
+class FullHistory(ContextPolicy):
+    """Send everything (the fsm_llm default)."""
+
+
+class SlidingWindow(ContextPolicy):
+    """Drop the oldest messages until the history fits `max_tokens`.
+
+    The last `keep_last` messages are always kept.
+    """
+
+    def apply(self, history: list) -> list:
+        start = 0
+        total = message_tokens(history)
+        while total > self.max_tokens and len(history) - start > self.keep_last:
+            total -= message_tokens(history[start : start + 1])
+            start += 1
+        return history[start:]
+
+
+class RollingSummary(ContextPolicy):
+    """Fold messages that no longer fit into a running summary note.
+
+    The summary is extractive (each folded message, clipped to one line), so
+    keeping it costs no extra model call. It is capped at a quarter of the
+    budget by dropping its oldest lines.
+    """
+
+    def __init__(self, max_tokens: int = 3000, keep_last: int = 4, clip: int = 160):
+        super().__init__(max_tokens, keep_last)
+        self.clip = clip
+        self.summary: list = []
+
+    def _line(self, message: dict) -> str:
+        text = " ".join(str(message.get("content", "")).split())
+        if len(text) > self.clip:
+            text = text[: self.clip - 3].rstrip() + "..."
+        return f"- {message.get('role', 'user')}: {text}"
+
+    def apply(self, history: list) -> list:
+        window = SlidingWindow(self.max_tokens, self.keep_last).apply(history)
+        folded = history[: len(history) - len(window)]
+        if folded:
+            self.summary.extend(self._line(message) for message in folded)
+            budget = self.max_tokens // 4
+            while (
+                len(self.summary) > 1 and count_tokens("\n".join(self.summary)) > budget
+            ):
+                self.summary.pop(0)
+        if not self.summary:
+            return window
+        note = {"role": "system", "content": SUMMARY_PREFIX + "\n".join(self.summary)}
+        return [note] + window
+
+
+POLICIES = {
+    "full": FullHistory,
+    "window": SlidingWindow,
+    "summary": RollingSummary,
+}
+
+
+class ContextManager:
+    """Bound the history an FSM sends to the model, before each turn.
+
+    fsm_llm builds every prompt from `fsm._session_history` and keeps the
+    complete transcript separately in `_full_session_history`, so `prepare`
+    only rewrites the former. Context data listed in `pinned` (for example
+    `verified_user`) is restated in a system note so it survives trimming.
+    """
+
+    def __init__(self, policy: ContextPolicy, pinned: Iterable[str] = ()):
+        self.policy = policy
+        self.pinned = tuple(pinned)
+        self.last_history_tokens = 0
+
+    def _facts(self, context_data: dict) -> Optional[dict]:
+        facts = {key: context_data[key] for key in self.pinned if key in context_data}
+        if not facts:
+            return None
+        lines = [
+            f"- {key}: {json.dumps(value, default=str)}" for key, value in facts.items()
+        ]
+        return {"role": "system", "content": FACTS_PREFIX + "\n".join(lines)}
+
+    def prepare(self, fsm) -> list:
+        """Apply the policy to `fsm`'s session history and return the new history."""
+        history = [message for message in fsm._session_history if not _is_note(message)]
+        history = self.policy.apply(history)
+
+        facts = self._facts(fsm.user_defined_context)
+        if facts is not None:
+            history = [facts] + history
+
+        fsm._session_history = history
+        self.last_history_tokens = message_tokens(history)
+        return history
+
+
+def create_context_manager(policy: Optional[str] = None) -> ContextManager:
+    """Build the context manager selected by the deployment settings.
+
+    - ARXIS_CONTEXT: full, window (default) or summary
+    - ARXIS_CONTEXT_TOKENS: history budget in tokens (default 3000)
+    - ARXIS_CONTEXT_PIN: comma-separated context keys to pin (default verified_user)
+    """
+    name = (policy or os.getenv("ARXIS_CONTEXT") or "window").strip().lower()
+    if name not in POLICIES:
+        logging.error(f"Unknown context policy '{name}', using window")
+        name = "window"
+    try:
+        max_tokens = int(os.getenv("ARXIS_CONTEXT_TOKENS", 3000))
+    except ValueError:
+        logging.error("ARXIS_CONTEXT_TOKENS is not an integer, using 3000")
+        max_tokens = 3000
+    pinned = os.getenv("ARXIS_CONTEXT_PIN", "verified_user")
+    return ContextManager(
+        POLICIES[name](max_tokens=max_tokens),
+        pinned=[key.strip() for key in pinned.split(",") if key.strip()],
+    )
@@ -0,0 +1,337 @@
+import asyncio
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Optional
+import ttkbootstrap as ttk
+from Functions import StreamFormatter, format_response_text, iter_stream_chunks
+from intent import is_end_command
+from journal import Journal
+from metrics import metrics
+from pacing import Pacer, create_pacer
+from render import StreamRenderer
+
+
+class ChatView(ABC):
+    """What ConversationController needs from a window; every method runs on the Tk thread.
+
+    `transcript` is the TranscriptView of the chat. Subclasses show the status
+    and re-enable input after a turn. `last_agent_response` and an optional
+    `copy_button` are updated when an agent message is complete.
+    """
+
+    transcript = None
+    copy_button = None
+    last_agent_response = ""
+
+    @abstractmethod
+    def update_status(self, status_text: str, show_progress: bool = False):
+        """Show `status_text`, with the progress bar running if `show_progress`."""
+
+    @abstractmethod
+    def enable_input(self):
+        """Let the user send the next message."""
+
+
+class ConversationController:
+    """The turn pipeline shared by the support window, the demo and the benchmarks.
+
+    Runs each turn on the bridge's event loop against `backend`, a BotRunner
+    (over SupportBot or `mock_bot.MockSupportBot`) or a Future resolving to
+    one, and sends what it produces to the `view` through the bridge and a
+    StreamRenderer. Nothing here touches a widget from the loop thread.
+
+    With `streaming` the reply is shown as the model produces it; otherwise the
+    whole reply is awaited and revealed by `pacer`, as the demo does. Every turn
+    is recorded in `journal`, when one is given.
+    """
+
+    def __init__(
+        self,
+        view: ChatView,
+        bridge,
+        backend,
+        pacer: Optional[Pacer] = None,
+        streaming: bool = True,
+        journal: Optional[Journal] = None,
+    ):
+        self.view = view
+        self.bridge = bridge
+        self.backend = backend
+        self.pacer = pacer if pacer is not None else create_pacer()
+        self.streaming = streaming
+        self.journal = journal
+        self.session_id = uuid.uuid4().hex
+        self.turns = 0
+        self.renderer = StreamRenderer(bridge, view.transcript)
+        self._turn_task: Optional[asyncio.Task] = None
+
+    async def runner(self):
+        """The BotRunner, once the background load has finished"""
+        if isinstance(self.backend, Future):
+            return await asyncio.wrap_future(self.backend)
+        return self.backend
+
+    # Tk thread
+
+    def submit(self, user_input: str) -> Optional[Future]:
+        """Show the user's message and run the turn; input is re-enabled when it ends"""
+        self.display_user_message(user_input)
+        try:
+            future = self.bridge.submit(
+                self.process_chat(user_input, submitted=time.perf_counter())
+            )
+        except Exception as e:
+            logging.error(f"Failed to schedule process_chat: {e}")
+            self.bridge.call_soon(self.handle_processing_error, str(e))
+            self.bridge.call_soon(self.view.enable_input)
+            return None
+
+        def _on_done(fut):
+            if not fut.cancelled() and fut.exception() is not None:
+                self.bridge.call_soon(
+                    self.handle_processing_error, str(fut.exception())
+                )
+            self.bridge.call_soon(self.view.enable_input)
+
+        future.add_done_callback(_on_done)
+        return future
+
+    def say(self, text: str) -> Future:
+        """Show an agent message that does not come from the backend, e.g. the welcome"""
+        return self.bridge.submit(self.simulate_streaming_response(text))
+
+    def close(self):
+        """Write out the journal; call when the window closes"""
+        if self.journal is not None:
+            self.journal.close()
+
+    def cancel_turn(self):
+        """Cancel the turn in progress (Stop button or Escape)"""
+        task = self._turn_task
+        if task is not None:
+            self.bridge.loop.call_soon_threadsafe(task.cancel)
+
+    def handle_processing_error(self, error_msg):
+        """Handle processing errors on main thread"""
+        try:
+            self.view.update_status("Error occurred", show_progress=False)
+            self.say(f"Sorry, I encountered an error: {error_msg}")
+        except Exception as e:
+            logging.error(f"Error handling processing error: {e}")
+
+    def display_message(self, message, tag):
+        """Display message in chat with proper error handling"""
+        try:
+            self.renderer.flush()
+            display = self.renderer.display
+            display.config(state=ttk.NORMAL)
+            self.view.transcript.add([(message + "\n", tag)])
+            display.config(state=ttk.DISABLED)
+            display.see(ttk.END)
+        except Exception as e:
+            logging.error(f"Error displaying message: {e}")
+
+    def display_user_message(self, user_input):
+        """Display user message with proper styling - only 'You:' is green"""
+        try:
+            self.renderer.flush()
+            display = self.renderer.display
+            display.config(state=ttk.NORMAL)
+            self.view.transcript.add(
+                [("You: ", "USER_NAME"), (user_input + "\n", "USER_MESSAGE")]
+            )
+            display.config(state=ttk.DISABLED)
+            display.see(ttk.END)
+        except Exception as e:
+            logging.error(f"Error displaying user message: {e}")
+
+    # any thread
+
+    def set_status(self, status_text, show_progress=False):
+        """Update the status from any thread; only the latest update per frame is shown"""
+        self.bridge.call_soon(
+            self.view.update_status, status_text, show_progress, key="status"
+        )
+
+    def start_agent_message(self):
+        """Start a new agent message; safe to call from any thread"""
+        self.renderer.begin("Agent: ", "BOT")
+
+    def stream_agent_text(self, text, is_final=False):
+        """Queue streamed agent text for the next frame; safe to call from any thread"""
+        self.renderer.write(text)
+        if is_final:
+            self.renderer.end()
+
+    def replace_agent_text(self, text):
+        """Replace the text streamed so far for the current agent message"""
+        self.renderer.replace(text)
+
+    def finish_agent_message(self, full_text):
+        """Terminate the current agent message and attach its copy action"""
+
+        def _attach_copy():
+            view = self.view
+            # store last response on the view for the copy action
+            view.last_agent_response = full_text
+            if getattr(view, "copy_button", None):
+                view.copy_button.config(state=ttk.NORMAL)
+            # give this message its copy action
+            view.transcript.attach_copy()
+
+        self.renderer.end(_attach_copy)
+
+    # event loop thread
+
+    async def process_chat(self, user_input, submitted=None):
+        self._turn_task = asyncio.current_task()
+        started = submitted if submitted is not None else time.perf_counter()
+        self.turns += 1
+        entry = {"session": self.session_id, "turn": self.turns, "user": user_input}
+        latency = entry["latency"] = {}
+        runner = None
+        try:
+
+            self.set_status("AI is thinking...", show_progress=True)
+
+            runner = await self.runner()
+            latency["queue"] = time.perf_counter() - started
+            metrics.observe("queue", latency["queue"])
+            entry["state_before"] = runner.get_state()
+
+            logging.debug("Current FSM state: %s", runner.get_state())
+            logging.debug("User input: %s", user_input)
+
+            if is_end_command(user_input):
+                entry["outcome"] = "ended"
+                runner.end()
+                self.set_status("Conversation ended")
+                self.bridge.call_soon(
+                    self.display_message, "Agent: Conversation ended. Thank you!", "BOT"
+                )
+                return
+
+            if self.streaming:
+                entry["reply"] = await self.stream_bot_response(
+                    runner, user_input, latency, started
+                )
+            else:
+                run = await runner.process(user_input)
+                entry["reply"] = str(run.response or "")
+                latency["first_delta"] = time.perf_counter() - started
+                await self.simulate_streaming_response(entry["reply"])
+            entry["outcome"] = "ok"
+
+            if runner.is_completed():
+                self.set_status("Conversation completed")
+                await self.simulate_streaming_response("Conversation ended. Thank you!")
+            else:
+                self.set_status("Waiting for your response...")
+
+        except asyncio.CancelledError:
+            logging.info("Turn cancelled by the user")
+            entry["outcome"] = "cancelled"
+            self.set_status("Request cancelled")
+            self.bridge.call_soon(
+                self.display_message, "Agent: Request cancelled.", "BOT"
+            )
+            raise
+
+        except asyncio.TimeoutError as e:
+            logging.error(f"Turn timed out: {e}")
+            entry.update(outcome="timeout", error=str(e))
+            self.set_status("Request timed out")
+            await self.simulate_streaming_response(
+                "Sorry, the request timed out. Please try again."
+            )
+
+        except Exception as e:
+            logging.error(f"Error in process_chat: {e}")
+            entry.update(outcome="error", error=str(e))
+            self.set_status("Error occurred")
+            await self.simulate_streaming_response(
+                f"Sorry, I encountered an error: {str(e)}"
+            )
+
+        finally:
+            self._turn_task = None
+            latency["turn"] = time.perf_counter() - started
+            metrics.observe("turn", latency["turn"])
+            if self.journal is not None:
+                self._record(entry, runner)
+
+    def _record(self, entry: dict, runner):
+        try:
+            if runner is not None:
+                entry.update(runner.turn_info())
+            self.journal.record(entry)
+        except Exception as e:
+            logging.error(f"Error recording turn in the journal: {e}")
+
+    async def stream_bot_response(
+        self, runner, user_input, latency=None, started=None
+    ) -> str:
+        """Stream the bot's reply into the chat as the model produces it.
+
+        Returns the unformatted reply. The time from `started` to its first
+        piece is stored in `latency["first_delta"]`.
+        """
+        if started is None:
+            started = time.perf_counter()
+        formatter = StreamFormatter()
+        begun = False
+        raw = []
+        formatting = 0.0
+        try:
+            async for delta in runner.stream(user_input=user_input):
+                if not begun:
+                    self.start_agent_message()
+                    begun = True
+                    if latency is not None:
+                        latency["first_delta"] = time.perf_counter() - started
+
+                tick = time.perf_counter()
+                if delta.replace:
+                    raw = [delta.text]
+                    formatter = StreamFormatter()
+                    chunks = list(formatter.feed(delta.text))
+                    self.replace_agent_text("".join(chunks))
+                else:
+                    raw.append(delta.text)
+                    for chunk in formatter.feed(delta.text):
+                        self.stream_agent_text(chunk)
+                formatting += time.perf_counter() - tick
+        finally:
+            if begun:
+                tick = time.perf_counter()
+                for chunk in formatter.close():
+                    self.stream_agent_text(chunk)
+                self.finish_agent_message(format_response_text("".join(raw)))
+                metrics.observe("format", formatting + time.perf_counter() - tick)
+        return "".join(raw)
+
+    async def simulate_streaming_response(self, response_text):
+        """Simulate streaming by displaying the response with proper formatting"""
+        try:
+
+            self.start_agent_message()
+
+            formatted_text = format_response_text(response_text)
+
+            await self.pacer.play(
+                iter_stream_chunks(response_text),
+                self.stream_agent_text,
+                total=len(formatted_text),
+            )
+
+            self.finish_agent_message(formatted_text)
+
+        except Exception as e:
+            logging.error(f"Error in streaming response: {e}")
+
+            formatted_fallback = format_response_text(response_text)
+            self.replace_agent_text(formatted_fallback)
+            self.finish_agent_message(formatted_fallback)
@@ -0,0 +1,44 @@
+import os
+import logging
+from functools import lru_cache
+
+
+SYSTEM_ENV = "/etc/arxis-ai-support/env"
+USER_ENV = "~/.config/arxis-ai-support/env"
+
+
+@lru_cache(maxsize=None)
+def load_environment():
+    """Load the env files once, before the first setting is read.
+
+    Called by every entry point instead of at import time, so importing a
+    module never touches the filesystem.
+    """
+    from dotenv import load_dotenv
+
+    # Load project-local .env first
+    load_dotenv()
+
+    # Also attempt to load a system-wide env file so packaged installs can provide
+    # the OPENAI_API_KEY via /etc/arxis-ai-support/env. Only try to load it if the
+    # current user can read the file to avoid noisy permission errors.
+    try:
+        if os.path.exists(SYSTEM_ENV) and os.access(SYSTEM_ENV, os.R_OK):
+            load_dotenv(SYSTEM_ENV, override=False)
+        else:
+            logging.debug(f"{SYSTEM_ENV} not found or not readable by current user")
+    except Exception as e:
+        logging.debug(f"Could not load system env file {SYSTEM_ENV}: {e}")
+
+    # Also attempt to read a per-user config which is commonly used for GUI apps. This
+    # allows end-users to put their API key in ~/.config/arxis-ai-support/env which is
+    # readable by the running user and avoids requiring root-owned files.
+    user_env = os.path.expanduser(USER_ENV)
+    try:
+        if os.path.exists(user_env) and os.access(user_env, os.R_OK):
+            load_dotenv(user_env, override=True)
+            logging.debug(f"Loaded user env from {user_env}")
+        else:
+            logging.debug(f"User env {user_env} not found or not readable")
+    except Exception as e:
+        logging.debug(f"Could not load user env file {user_env}: {e}")
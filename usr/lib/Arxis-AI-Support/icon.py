@@ -0,0 +1,39 @@
+import logging
+import tkinter as tk
+
+
+# (Tk interpreter, PhotoImage) of the last window the icon was loaded for.
+_cached = None
+
+
+def icon_data() -> str:
+    """Base64 PNG of the pre-scaled application icon, imported on first use."""
+    from icon_data import ICON_PNG
+
+    return ICON_PNG
+
+
+def load_icon(root) -> tk.PhotoImage:
+    """Return the application icon as a PhotoImage owned by `root`.
+
+    The image is decoded once per Tk interpreter. Tk reads PNG natively, so PIL
+    is only used when the running Tk cannot.
+    """
+    global _cached
+    if _cached is not None and _cached[0] is root.tk:
+        return _cached[1]
+
+    try:
+        photo = tk.PhotoImage(master=root, data=icon_data())
+    except tk.TclError as e:
+        logging.debug(f"Tk cannot decode the PNG icon, using PIL: {e}")
+        import base64
+        import io
+
+        from PIL import Image, ImageTk
+
+        image = Image.open(io.BytesIO(base64.b64decode(icon_data())))
+        photo = ImageTk.PhotoImage(image=image, master=root)
+
+    _cached = (root.tk, photo)
+    return photo
@@ -0,0 +1,78 @@
+"""Application icon, pre-scaled to 64x64 PNG and base64 encoded.
+
+Generated from usr/share/pixmaps/arxis.png (700x700) with PIL:
+Image.open(path).convert("RGBA").resize((64, 64), Image.LANCZOS), saved with
+optimize=True. Imported lazily by icon.load_icon.
+"""
+
+ICON_PNG = (
+    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABhGlDQ1BJQ0MgUHJvZmlsZQAAeJx9"
+    "kT1Iw0AcxV9bpaJVByuIOGSoTnZREXGqVShChVArtOpgcukXNGlIUlwcBdeCgx+LVQcXZ10dXAVB"
+    "8APE2cFJ0UVK/F9SaBHjwXE/3t173L0D/PUyU82OGKBqlpFKxIVMdlUIvqIHIQxiFn0SM/U5UUzC"
+    "c3zdw8fXuyjP8j735+hVciYDfAJxjOmGRbxBPL1p6Zz3icOsKCnE58TjBl2Q+JHrsstvnAsO+3lm"
+    "2Ein5onDxEKhjeU2ZkVDJZ4ijiiqRvn+jMsK5y3OarnKmvfkLwzltJVlrtMcQQKLWIIIATKqKKEM"
+    "C1FaNVJMpGg/7uEfdvwiuWRylcDIsYAKVEiOH/wPfndr5icn3KRQHOh8se2PUSC4CzRqtv19bNuN"
+    "EyDwDFxpLX+lDsx8kl5raZEjoH8buLhuafIecLkDDD3pkiE5UoCmP58H3s/om7LAwC3Qveb21tzH"
+    "6QOQpq6SN8DBITBWoOx1j3d3tff275lmfz+/t3LFLOyHvAAADV9JREFUeNrVm3mQHNV9xz+/190z"
+    "O7O7Wh27OpCWQxFIEadksDFHuBS7DFQsOZXkj9gVV4xTsSlSkHISXClXXMiJ+YOQgG1QBXBsCArG"
+    "ZUwSOwlFIYQC2AIdLAh0IglJKy3SSrvaa47u9375Y7qX1jC72mN0+FV19c7sdL/3/b3f/fs94TQO"
+    "VRUguUjdATR1VxHR07EmOQ2ATTyPExE3jmdN/KzGz+pvDAFU1QMQEVv1fQaYBcwGZgDNQABEwABw"
+    "FPgQ6BKR4ljeeVYRIF7k8G6pag64CrgBuBpYBMwBcqO8pgR0ATuA9cA6YL2I9I00zxkfqurF7J58"
+    "vkZVv6+qu7X2cKoaxVeY+tuN8PsDqvqEqt5ciyvOJHBJL0JVV6jq2hpgE5B2FJDp39sUcWzV/9er"
+    "6heTeVXVpIl/Wnc99feNqrquBmir9Rm13rdBVW8/I9ygqn58b1HVR1OLSlj5VA5bNcfTqjonva7T"
+    "Bf4aVd02wqJOx0jPuV9VP1dLH50q8H+qqqV48lDP7EjP/41TRoQU+L+tUlZnw7CptTxYdyKkwH87"
+    "RXWnZ9dwKW74QbLuSRMhBf6esxh8epTj+3cnrRhTtvb3fkPAVxPhjpOZSDlJMKLA+cDm2G8nDlDO"
+    "9qGAAyzwaRHZpKperTjCjCFO+BHQEr/UnD4Ek3Lzk7VngKdUtSEVnZ6cAClq3Qn8ThyteeOUnwmv"
+    "3qkik4/TvHjdi4FvxXjMSUUgxfozga3x7o+L9VUVFTkh8zHWYdXhRdBb6KMx10gQBPUQhQi4DNhZ"
+    "iag/ykvUAiVxmHkvMC1+gRnPzkeqlN7uIBwYGNdqI2fxQuGFPb/mzo2PcPh4N+ikxEFiImSBlTEu"
+    "GVEEVNWIiFXVucBX44fHx/oilAsF3JM/pNxzDDcGcVBVImfxy/D8zrXct+c5NhUO8KsP3wNX+f8k"
+    "hh9v4u+r6iUxPjMSBySf7wAaYy0q49l9B0RHDuNvfIPo0CHcGMTFqsMvOVbveJHv7PsPrBGyJuDV"
+    "3m1ExWI98jYu3si7qkXfVOXvrKpmgT+ZkMmLCeC6DuF37of3dxEBqBsVvFd0/Gj7CzzQ+T94vo9R"
+    "CIzPlsED7Ov7EINM1iokXPwHqjo95gKpBmhiGbkeuGDcsp8itXR2YkpFvHc2EzodEbxThaGQVdv+"
+    "i4cPvUjgBRgVHEogHkfsAJuO7aqHGEjMzdOAW9NEMTUswvKU9mQiHCD9fRAEZN7aRNR1CGe8E/SA"
+    "UjFzbrDEw1t/zqMfvkzGz3xsp1WE13q3EdZHDDS+lqfT8OYEC1RRDjfFs03c6VFFM1n8A/tg45uE"
+    "VWKgCv0Dfdz37mp+2P0aU4I8pkrbqzoaTEDH4H4+OH6oXmIgwHWq2piIgUlpf41Z/8IJZ4wlfsjz"
+    "QARxFv+VNZSsGy57qCpGhINDR9lTOEKzyXI8HKKM/ViVxBePo3aQt3p210sMNE7LX5KIvakCe2mc"
+    "p7cT47mK8+NmtKJG0IYcDa+9Qrj1PSLPA+cQEVSVC1vP4/Er7+J7C7/MV1qvp00aidBUyUgwCIjh"
+    "1Z5thIW6iEESCyxJpqkmwOKqMtXE1O28djSXB2Pwe4/hP/csBf3IHxARxBMyTXmuPPdS7l70BT7d"
+    "+FsUXRkRgwAhln5bJDAe7wwd4IO+uohBMi4eyQ+4YHJlFsGgSPu5RLPnIqUSrrGJ/C+fp9zxFmHM"
+    "BckOC2DFMaRFDka9mMqeU8bSblq4IbeAZjLsKXWzrvvdeolBGuewR5S8dfakKkYiiHUE06dT/sRV"
+    "SKmEBgF+fx/ZVQ8zUCjGAHR4Fg/D4aEedpcOkzEeApRsyLKpF/PPl93BDxZ/hb9qv42M7+O0IkJ1"
+    "GDMTq11NgCmTL7YJGSC6+TO4bAMSRbjmZvKvvIQ+u5ohz4MoYlgiFHb2ddIdDRKIh0XJS8Dl0+Zj"
+    "WnIsPmcBX7t0OV+86DPgMdkoMXm4ORbFj3FAdtIEMAbfObwlSyldvgQzNFT5PpejedXDFN5YT9EP"
+    "kCiqyHNo2XT8fUIcBkPZRZwTTGXR1HZUFCeKNQ71BSN1S0dkkiyRqeHI1aXimmtqonDH13FBBpxD"
+    "/QBvsJ/mv7uXgR3bKfk+xjqO9B9lfd/7BKaSuiu7iE82z2dG4zQcihGDJ6Ye+YFqnCc4QsnbC3V5"
+    "vTFkrCW49noGb1+O6esDETSXJ7NvD41/cze9+/bhPJ/Xu7awu9xNg/GJsDRKwLK2y5GMX2/Q6VFM"
+    "cgLVBOiZrBlME6HRQHjnPZQWLsYM9ldI39RMdsc2mv/yTrrWr+c/ezpAwCAUbMhl+XlcOmM+Thwm"
+    "rfBUJ5VlqsLVmziA1QQ4UDcai+ApNM2ZzeC3/4Fo6nSkVKwkTJqbyHd0sOvplWzQw+QJKuzuHLe1"
+    "LiWXbzphB9Q5StYSOjdZM5g8fLDaE0zGzroymjFkrSW/9BP0fecBXCYLYRkTWgpzZ/DYTedjQosR"
+    "Q8GGLGw5nxtmX4ZKFDs9gLUMGUP40D9SWLuGssiwLzGJsbPaEUoos6XuqW/PIxdF5G68ieP3P0TY"
+    "2IQ/OMTjn7+Yza3N5EOLFfBwfOlggCGg6PkoIGFI5HkUOzrI/fgxMt97kMHu7jFlmU5iBt+uJkBC"
+    "0neBPj5qTqrP8H3yUURw8y1EKx9izfJP8eMr5tBcCBGgP+Nx6/4BbvvuI5h7vsrQf/+C48d6GAgC"
+    "eiNL9l++j6gjs+M9zL8+xqAxYO1E2D/JFG9OcEtVPtCp6loqPT123PnAkyQ8/RBe7dzCvft+Sqlc"
+    "IKNC0TPMAJ56eB1te3tQDQEIL7iQoWWfRQcHmfrsv4HvV3bdOnr/6RGabryZrLWVyHPsps8A78UZ"
+    "YiciJ9TNTPyj/40JUBcOUBTrHL41vNH5Nit3/YSCG6LBBFgB48qsfHoDs/YcI2xqwNhKGjyzdxfZ"
+    "R7eCMbhcvgLeGKRUovHB+xn47Uvw21rxVGFs7nFCgBfjXIAPRKaGE/R8vXbfxWkvPxTW7d3AN3f9"
+    "O0d0iAaTwQEDrsiX8ktYOvNqQqP4x4/HCk7QbA43pQXX2JR6oUPzebI7tuI/sYpBEXBjFoUE68/S"
+    "ek9qpMWdqr4S5wbdRAihqjgUT4XSwBA/2bOWVV1rKIuSk4CyWoZskS+3XsPXFn6eUj6Le/1VGlY/"
+    "ScMbr2OKBVy+cVQTSzmk98FHaLpl2VhEwcVYt8Xsb5MWu2oC+CISqeofAc+MlxOUyo57GChbdhzZ"
+    "y6q9L/BS/1ZyXpZAPPpdibx6/Nnsm/jjBcvw8hlEldDzKJRDwo1vEjy7mqZ1L43M2sYgxQLl+Rcx"
+    "+PhTTJ0xAy8hzAgqKK4P3C0iDyU4axEgXVR8B1jAGIqiilZSXRgIHZ09XTzf+Sue697AMS2QN1lK"
+    "LqTkyizMzOLu827luvYl2ACMSCXEdQ6cY8D36VvzErPu+XPIZCqyL/JRvk2k8p3nYXqOMbj8D+G+"
+    "+2nyvRpuzQm73w1cBBxPIsGkapKuiWlMnZKqrgSejLnAjMbugkApYnfPfl7o2sQvjm5mb3gM33iI"
+    "wlBU4NxgOrfNvIIV7dfSNrUV6yleOrozgiJExSItzzyFOIf6PkQRYi1EYeVuLSqCej62eQrB5g1E"
+    "+z7ALViAqa0QXYzzARHpTe/+iImPODsswK+BK0cSBUVRp7x5YAs/2/8aG/r30BX1k/OzTDM5ZvhN"
+    "zM/N5Nppi7hqxkXMapmJBpXnPhbaOkvJeBR++gwtf/0X0JCr5AyCDHZKC661Dds2E9t+Hq69HZ19"
+    "Dsyegzd3HrmWFvxsthaYZPf3xPnOIlWd6CMRwItNxSdjIthUWvnEGZxj77FODgwcAYUAj4zxmZLJ"
+    "09YwlZaGJiQTgAFLJcCpGeWpUowi9L5vod1HCC9ciLbNROedC3PnIW1tmMYmvEyAF7Nkch/FCCay"
+    "f7uI/HKkJomRWDtpj/n7MbfDudQ13L7l1DqrbgydNTYMdahQ0H6nOqiqxbjXZbi/1lrVKKpc1lYu"
+    "507WPvdEGs9IvnEtAqSLIy/HZjGq1hvDolAVb1VEcYIRvXOx8kuKDZJ+6VjT317s2n8qZv2a3eVy"
+    "Ei5IYoLZVFrX2+vtIp+CkXh8vcDVIrI98W9G845G8DfExUXTQ8DtccLESxUYzlbwJWBFDN4b7aTK"
+    "ScPeWBl6IvJ2XFntSUVVZ9OwKfBfEJG1scmrz2alGiaXqOq+s6RPuFrhHU0OVZySzvEUEdpV9f9q"
+    "9OmeiR7hpGO8Q1UXnzLwNcxjoKoPVO2CPQN9waqqj6tq82jmrt5ESLfW3KKqm04TIWwV8O2quqLW"
+    "uk4HESTFDRlVvavqkFT6mIurA+g0UQ+q6jdVtSnZ9TNybqia5VR1iqp+XVU31gASVR2eslW+o606"
+    "LFXrBMoWVf2GqrbWmn8yWdJJc0PsL9jU5+uAFcDvUuk7mCh7bgfWAD8HXk4iuXqdHaz3wUkBvHS4"
+    "GX+3CFgKXBHH5POodGzlU45VIfbeOuO8fQewCdgqImGVJbL1OjR5qo7ODp8ZThOj6jdBXI32Yg+u"
+    "JCLlUczvKTlDLKdDWXJi19moQGLWlnQV91QekT0zmpPavftn4izw/wOhoKAjxjJQcQAAAABJRU5E"
+    "rkJggg=="
+)
@@ -0,0 +1,129 @@
+import os
+import re
+from typing import NamedTuple, Optional
+
+
+END_COMMANDS = ("quit", "exit")
+
+# Explicit farewells, and words that may surround them in a message that says
+# nothing else ("ok thanks, that's all!").
+_FAREWELL = re.compile(
+    r"\b(?:good ?bye|bye(?: bye)?|see (?:you|ya)(?: later)?|that'?s all"
+    r"|nothing else|no(?:pe)? thanks?|no thank you|quit|exit)\b"
+)
+# "Done" and the like also answer a support instruction ("restart it and tell me
+# when you're done"), so on their own they are left to the model.
+_WRAP_UP = re.compile(
+    r"\b(?:that'?s it|i'?m (?:all )?(?:done|finished)|all done|done|finished)\b"
+)
+_FILLER = frozenset(
+    "ok okay thanks thank you so much very great cool perfect for your help the and "
+    "all now then cheers that's thats it no nope i'm im good that".split()
+)
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+
+# Explicit self-introductions in the START state.
+_NAME = re.compile(
+    r"^(?:hi|hello|hey)?[ ,!.]*(my name is|my name's|name:|call me)\s+"
+    r"([a-z][a-z'-]*(?: [a-z][a-z'-]*)?)[ !.]*$",
+    re.IGNORECASE,
+)
+# "Call me" also asks for a call ("call me back", "call me later"), so there it
+# only names a capitalised word that is not one of these.
+_NOT_NAMES = frozenset(
+    "back later now soon today tonight tomorrow again asap please when if "
+    "anytime maybe instead first".split()
+)
+
+
+class Decision(NamedTuple):
+    """A locally resolved turn: the structured response the LLM would have returned."""
+
+    response_data: dict
+    confidence: float
+    reason: str
+
+
+class TransitionClassifier:
+    """Resolve obvious FSM transitions locally before calling the LLM.
+
+    Uses precompiled patterns, so a decision costs microseconds. Only decisions
+    at or above `threshold` are acted on; everything else goes to the model.
+    """
+
+    def __init__(self, threshold: float = 0.9):
+        self.threshold = threshold
+        self.resolved = 0
+        self.deferred = 0
+
+    def score(self, state: str, user_input: str) -> Optional[Decision]:
+        """Return the best local guess for this turn, whatever its confidence."""
+        text = " ".join(user_input.lower().split())
+        if not text:
+            return None
+
+        if state == "END":
+            return Decision(_content("END"), 1.0, "conversation already ended")
+
+        if text in END_COMMANDS:
+            if state == "IDENTIFIED":
+                return Decision(_content("END"), 1.0, "end command")
+            return None
+
+        if state == "IDENTIFIED":
+            if "?" in text:
+                return None
+            words = _PUNCTUATION.sub(" ", text)
+            farewell = _FAREWELL.search(words)
+            if not farewell and not _WRAP_UP.search(words):
+                return None
+            rest = _WRAP_UP.sub(" ", _FAREWELL.sub(" ", words)).split()
+            if not all(word in _FILLER for word in rest):
+                return Decision(_content("END"), 0.5, "closing keyword")
+            if farewell:
+                return Decision(_content("END"), 0.95, "farewell")
+            return Decision(_content("END"), 0.6, "wrap-up phrase")
+
+        if state == "START":
+            match = _NAME.match(user_input.strip())
+            if match:
+                # as typed: capitalize() would turn Anne-Marie into Anne-marie
+                name = " ".join(match.group(2).split())
+                confidence = 0.95
+                if match.group(1).lower() == "call me":
+                    first = name.split()[0]
+                    if not first[0].isupper() or first.lower() in _NOT_NAMES:
+                        confidence = 0.6
+                return Decision(
+                    {"response": {"user_name": name}, "next_state_key": "IDENTIFIED"},
+                    confidence,
+                    "explicit introduction",
+                )
+        return None
+
+    def classify(self, state: str, user_input: str) -> Optional[Decision]:
+        """Return a decision only when it is confident enough to skip the LLM."""
+        decision = self.score(state, user_input)
+        if decision is not None and decision.confidence >= self.threshold:
+            self.resolved += 1
+            return decision
+        self.deferred += 1
+        return None
+
+    def stats(self) -> dict:
+        return {"resolved": self.resolved, "deferred": self.deferred}
+
+
+def _content(next_state: str) -> dict:
+    return {"response": {"content": ""}, "next_state_key": next_state}
+
+
+def is_end_command(user_input: str) -> bool:
+    return user_input.strip().lower() in END_COMMANDS
+
+
+def create_classifier() -> Optional[TransitionClassifier]:
+    """Build the fast-path classifier unless ARXIS_FAST_PATH is set to off."""
+    if os.getenv("ARXIS_FAST_PATH", "on").strip().lower() in ("off", "0", "false"):
+        return None
+    return TransitionClassifier()
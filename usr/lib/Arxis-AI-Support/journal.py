@@ -0,0 +1,168 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import List, Optional
+
+
+DEFAULT_JOURNAL_PATH = os.path.expanduser(
+    "~/.local/share/arxis-ai-support/journal.jsonl"
+)
+# the offline mock backends, kept apart so replay only sees real turns
+DEMO_JOURNAL_PATH = os.path.expanduser(
+    "~/.local/share/arxis-ai-support/demo-journal.jsonl"
+)
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUPS = 5
+DEFAULT_SYNC_INTERVAL = 1.0
+
+_STOP = object()
+_OFF = ("off", "none", "0", "false")
+
+
+class Journal:
+    """Append-only JSON-lines record of conversation turns.
+
+    `record` only puts the entry on a queue, so the Tk and event loop threads
+    never wait for the disk. A writer thread serializes whatever has queued up,
+    writes it in one batch and fsyncs at most every `sync_interval` seconds.
+    Once the file would grow past `max_bytes` it is rotated to `path.1`,
+    `path.2`... keeping `backups` old files.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_JOURNAL_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = max(0, backups)
+        self.sync_interval = sync_interval
+        self.written = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+        self._thread = threading.Thread(
+            target=self._run, name="journal-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, entry: dict):
+        """Queue `entry` to be written; it must not be changed afterwards."""
+        if not self._closed:
+            entry.setdefault("ts", time.time())
+            self._queue.put(entry)
+
+    def close(self, timeout: float = 2.0):
+        """Write out queued entries and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout)
+
+    def _run(self):
+        last_sync = time.monotonic()
+        dirty = False
+        stopping = False
+        while not stopping:
+            batch: List[dict] = []
+            try:
+                item = self._queue.get(timeout=self.sync_interval)
+                while item is not _STOP:
+                    batch.append(item)
+                    item = self._queue.get_nowait()
+                stopping = True
+            except queue.Empty:
+                pass
+
+            if batch:
+                dirty = self._write(batch) or dirty
+            now = time.monotonic()
+            if dirty and (stopping or now - last_sync >= self.sync_interval):
+                self._sync()
+                dirty = False
+                last_sync = now
+        self._file.close()
+
+    def _write(self, batch: List[dict]) -> bool:
+        lines = "".join(json.dumps(entry, default=str) + "\n" for entry in batch)
+        data = lines.encode("utf-8")
+        try:
+            if self.max_bytes and self._file.tell() + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self.written += len(batch)
+            return True
+        except (OSError, ValueError) as e:
+            logging.error(f"Error writing conversation journal {self.path}: {e}")
+            return False
+
+    def _sync(self):
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except (OSError, ValueError) as e:
+            logging.error(f"Error syncing conversation journal {self.path}: {e}")
+
+    def _rotate(self):
+        if self._file.tell() == 0:
+            return
+        self._sync()
+        self._file.close()
+        try:
+            if self.backups:
+                for index in range(self.backups - 1, 0, -1):
+                    older = f"{self.path}.{index}"
+                    if os.path.exists(older):
+                        os.replace(older, f"{self.path}.{index + 1}")
+                os.replace(self.path, f"{self.path}.1")
+            else:
+                os.remove(self.path)
+        finally:
+            self._file = open(self.path, "ab")
+
+
+def create_journal(path: Optional[str] = None, demo: bool = False) -> Optional[Journal]:
+    """Open the conversation journal selected by the deployment settings.
+
+    - ARXIS_JOURNAL: file to append turns to (default
+      ~/.local/share/arxis-ai-support/journal.jsonl), or off
+    - ARXIS_DEMO_JOURNAL: the same for the mock backend, with `demo` (default
+      ~/.local/share/arxis-ai-support/demo-journal.jsonl)
+    - ARXIS_JOURNAL_MAX_BYTES: rotate the file beyond this size (default 10 MB)
+    - ARXIS_JOURNAL_BACKUPS: rotated files to keep (default 5)
+    """
+    setting = os.getenv("ARXIS_JOURNAL") or DEFAULT_JOURNAL_PATH
+    if setting.strip().lower() in _OFF:
+        return None
+    if demo:
+        setting = os.getenv("ARXIS_DEMO_JOURNAL") or DEMO_JOURNAL_PATH
+    path = path or setting
+    if path.strip().lower() in _OFF:
+        return None
+
+    try:
+        max_bytes = int(os.getenv("ARXIS_JOURNAL_MAX_BYTES", DEFAULT_MAX_BYTES))
+        backups = int(os.getenv("ARXIS_JOURNAL_BACKUPS", DEFAULT_BACKUPS))
+    except ValueError:
+        logging.error(
+            "Invalid ARXIS_JOURNAL_MAX_BYTES or ARXIS_JOURNAL_BACKUPS, using defaults"
+        )
+        max_bytes, backups = DEFAULT_MAX_BYTES, DEFAULT_BACKUPS
+
+    try:
+        return Journal(os.path.expanduser(path), max_bytes=max_bytes, backups=backups)
+    except OSError as e:
+        logging.error(f"Could not open conversation journal {path}: {e}")
+        return None
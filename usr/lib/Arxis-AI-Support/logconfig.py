@@ -0,0 +1,99 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Union
+
+from Functions import DEBUG
+
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, for log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def _level(value: Union[str, int, None]) -> int:
+    if isinstance(value, int):
+        return value
+    if value:
+        level = logging.getLevelName(value.strip().upper())
+        if isinstance(level, int):
+            return level
+        logging.error(f"Unknown log level '{value}', using the default")
+    return logging.DEBUG if DEBUG else logging.INFO
+
+
+def set_level(level: Union[str, int]):
+    """Change the level of the root logger at runtime."""
+    logging.getLogger().setLevel(_level(level))
+
+
+def stop_logging():
+    """Write out queued records and stop the writer thread."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def configure_logging(level: Union[str, int, None] = None):
+    """Route all logging through a queue to a background writer thread.
+
+    The calling threads (Tk, asyncio) only build the message and put the record
+    on the queue; a QueueListener thread formats and writes it. Records below
+    the level are dropped before their arguments are formatted. Safe to call
+    more than once; later calls only change the level.
+
+    - ARXIS_LOG_LEVEL: debug, info, warning... (default debug when
+      Functions.DEBUG is set, else info); `level` takes precedence
+    - ARXIS_LOG_FORMAT: text (default) or json
+    - ARXIS_LOG_FILE: also append the log to this file
+    """
+    global _listener
+    root = logging.getLogger()
+    root.setLevel(_level(level or os.getenv("ARXIS_LOG_LEVEL")))
+    if _listener is not None:
+        return
+
+    if os.getenv("ARXIS_LOG_FORMAT", "text").strip().lower() == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
+
+    handlers = [logging.StreamHandler(sys.stderr)]
+    path = os.getenv("ARXIS_LOG_FILE")
+    if path:
+        try:
+            handlers.append(logging.FileHandler(path, encoding="utf-8"))
+        except OSError as e:
+            logging.error(f"Cannot open log file {path}: {e}")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(records))
+
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
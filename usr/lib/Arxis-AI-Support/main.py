@@ -1,17 +1,20 @@
+from startup import profiler
 import ttkbootstrap as ttk
-from bot import BotRunner
+from environment import load_environment
 import asyncio
-from Gui import create_widgets, insert_copy_button
-from fsm_llm.state_models import FSMRun
-import threading
+from Gui import create_widgets, copy_to_clipboard, update_status
+from transcript import TranscriptView
+from pacing import create_pacer
 import logging
-from Functions import format_response_text, split_text_for_streaming
+from metrics import export_metrics
+from logconfig import configure_logging
+from tkwatchdog import create_watchdog
+from bridge import TkAsyncBridge
+from controller import ChatView, ConversationController
+from journal import create_journal
 
 
-logging.basicConfig(level=logging.DEBUG)
-
-
-class CustomerSupportBot(ttk.Window):
+class CustomerSupportBot(ttk.Window, ChatView):
 
     chat_entry: ttk.Entry
     chat_display: ttk.Text
@@ -19,102 +22,133 @@ class CustomerSupportBot(ttk.Window):
     progress_bar: ttk.Progressbar
     button: ttk.Button
 
-    def __init__(self, themename="darkly"):
+    def __init__(self, themename="darkly", pacing=None):
         super().__init__()
         try:
-
-            create_widgets(self)
+            # installed first so the widget bindings are timed too
+            self.watchdog = create_watchdog(self)
+            if self.watchdog is not None:
+                self.watchdog.start()
+
+            # every Tk <-> asyncio crossing goes through the bridge
+            self.bridge = TkAsyncBridge(self, watchdog=self.watchdog)
+            self.loop = self.bridge.loop
+
+            with profiler.phase("create widgets"):
+                create_widgets(self)
+                self.transcript = TranscriptView(
+                    self.chat_display,
+                    self.chat_scrollbar,
+                    copy_image=self.copy_icon,
+                    on_copy=lambda text: copy_to_clipboard(self, text),
+                )
 
             self.protocol("WM_DELETE_WINDOW", self.on_closing)
-
-            self.loop = asyncio.new_event_loop()
-            self.loop_thread = threading.Thread(
-                target=self.start_event_loop, daemon=True
+            self.bind("<Escape>", lambda event: self.cancel_turn())
+
+            # The SupportBot/OpenAI stack loads in the background while the
+            # window and welcome message appear.
+            self.bot = None
+            self._warm_up_future = None
+            self._bot_future = self.bridge.submit(self._load_bot())
+            self._bot_future.add_done_callback(self._on_bot_loaded)
+            self.controller = ConversationController(
+                self,
+                self.bridge,
+                self._bot_future,
+                create_pacer(pacing),
+                journal=create_journal(),
             )
-            self.loop_thread.start()
-
-            self.bot = BotRunner()
-            self.conversation_log = []
 
-            self.after(100, self.show_welcome_message)
+            self.after_idle(self.show_welcome_message)
 
         except Exception as e:
             logging.error(f"Error initializing CustomerSupportBot: {e}")
             self.destroy()
 
+    async def _load_bot(self):
+        """Import and build the BotRunner off the Tk thread, then warm it up"""
+        bot = await asyncio.get_running_loop().run_in_executor(None, self._create_bot)
+        # kept so it is not collected mid-way and can be cancelled on close
+        self._warm_up_future = self.bridge.submit(self._warm_up(bot))
+        return bot
+
+    async def _warm_up(self, bot):
+        """Pre-build the FSM schemas and open a pooled API connection"""
+        from warmup import warm_up
+
+        def report(text):
+            self.bridge.call_soon(self.show_warm_up_status, text)
+
+        with profiler.phase("warm-up"):
+            ready = await warm_up(bot, report)
+        profiler.mark("warm-up done")
+        report(
+            "Ready to chat..." if ready else "Ready to chat (connection not warmed up)"
+        )
+
+    def show_warm_up_status(self, text):
+        """Report warm-up progress unless a turn in progress owns the status bar"""
+        if str(self.chat_entry.cget("state")) != "disabled":
+            self.update_status(text, show_progress=False)
+
+    def _create_bot(self):
+        with profiler.phase("load AI backend"):
+            from bot import BotRunner
+
+            self.bot = BotRunner()
+        profiler.mark("backend ready")
+        return self.bot
+
+    def _on_bot_loaded(self, future):
+        if future.cancelled() or future.exception() is None:
+            return
+        logging.error(f"Failed to initialize the AI backend: {future.exception()}")
+        self.bridge.call_soon(
+            self.update_status, "AI services unavailable", key="status"
+        )
+
     def on_closing(self):
         """Handle window closing"""
         try:
 
-            if hasattr(self, "loop") and hasattr(self, "loop_thread"):
-                try:
+            if hasattr(self, "bridge"):
+                if getattr(self, "_warm_up_future", None) is not None:
+                    self._warm_up_future.cancel()
+                if self.bot is not None:
+                    try:
+                        from client import close_client
 
-                    self.loop.call_soon_threadsafe(self.loop.stop)
-                    self.loop_thread.join(timeout=2)
+                        # release pooled connections before the loop goes away
+                        self.bridge.submit(close_client()).result(timeout=2)
+                    except Exception as e:
+                        logging.error(f"Error closing OpenAI client: {e}")
+                try:
+                    self.bridge.close()
                 except Exception:
                     pass
         except Exception:
             pass
+        if getattr(self, "watchdog", None) is not None:
+            self.watchdog.stop()
+        if hasattr(self, "controller"):
+            self.controller.close()
+        export_metrics()
         self.destroy()
 
     def show_welcome_message(self):
         """Show welcome message after GUI is fully initialized"""
+        profiler.mark("welcome shown")
         welcome_msg = "Hello! Welcome to Arxis AI Support. I'm here to help you. May I please have your name?"
 
         try:
-            self.run_async_in_thread(self.simulate_streaming_response(welcome_msg))
+            self.controller.say(welcome_msg)
         except Exception as e:
             logging.error(f"Failed to schedule welcome message: {e}")
 
-    def run_async_in_thread(self, coro):
-        """Run an async coroutine in a thread"""
-        try:
-
-            future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-
-            def _done_callback(fut):
-                try:
-                    fut.result()
-                except Exception as exc:
-                    logging.error(f"Coroutine raised: {exc}")
-
-            future.add_done_callback(_done_callback)
-            return future
-        except Exception as e:
-            logging.error(f"Error in async thread: {e}")
-
-    def start_event_loop(self):
-
-        try:
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_forever()
-        except Exception as e:
-            logging.error(f"Background event loop stopped with error: {e}")
-
     def update_status(self, status_text, show_progress=False):
         """Update the status label and optionally show progress indicator"""
-        try:
-            if hasattr(self, "statusLabel"):
-                self.statusLabel.config(text=status_text)
-
-            if hasattr(self, "progress_bar"):
-                if show_progress:
-
-                    self.progress_bar.pack(
-                        side=ttk.BOTTOM,
-                        fill=ttk.X,
-                        padx=10,
-                        pady=2,
-                        before=self.statusLabel,
-                    )
-                    self.progress_bar.start(10)
-                else:
-                    self.progress_bar.stop()
-                    self.progress_bar.pack_forget()
-
-            self.update_idletasks()
-        except Exception as e:
-            logging.error(f"Error updating status: {e}")
+        update_status(self, status_text, show_progress)
 
     def on_submit(self, event=None):
         user_input = self.chat_entry.get().strip()
@@ -123,236 +157,31 @@ class CustomerSupportBot(ttk.Window):
             return
 
         self.chat_entry.delete(0, ttk.END)
-        self.display_user_message(user_input)
-
         self.chat_entry.config(state="disabled")
+        self.button.config(text="Stop", command=self.cancel_turn)
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                self.process_chat(user_input), self.loop
-            )
-
-            def _on_done(fut):
-                exc = fut.exception()
-                if exc:
-                    logging.error(f"Error in process_chat: {exc}")
-                    self.after(0, lambda: self.handle_processing_error(str(exc)))
+        self.controller.submit(user_input)
 
-                self.after(0, self.enable_input)
-
-            future.add_done_callback(_on_done)
-        except Exception as e:
-            logging.error(f"Failed to schedule process_chat: {e}")
-            self.after(0, self.handle_processing_error, str(e))
-            self.after(0, self.enable_input)
+    def cancel_turn(self):
+        """Cancel the turn in progress (Stop button or Escape)"""
+        self.controller.cancel_turn()
 
     def enable_input(self):
         """Re-enable input field"""
         try:
+            self.button.config(text="Send", command=lambda: self.on_submit(None))
             self.chat_entry.config(state="normal")
             self.chat_entry.focus()
         except Exception as e:
             logging.error(f"Error enabling input: {e}")
 
-    def handle_processing_error(self, error_msg):
-        """Handle processing errors on main thread"""
-        try:
-            self.update_status("Error occurred", show_progress=False)
-
-            threading.Thread(
-                target=self.run_async_in_thread,
-                args=(
-                    self.simulate_streaming_response(
-                        f"Sorry, I encountered an error: {error_msg}"
-                    ),
-                ),
-                daemon=True,
-            ).start()
-        except Exception as e:
-            logging.error(f"Error handling processing error: {e}")
-
-    def handle_exception(self, exc: Exception, user_message: str = "An error occurred"):
-        """Centralized exception handler: log and notify user"""
-        try:
-            logging.exception("Unhandled exception: %s", exc)
-            self.update_status(user_message, show_progress=False)
-            self.after(0, lambda: self.display_message(f"Agent: {user_message}", "BOT"))
-        except Exception:
-            logging.error("Error while handling exception")
-
-    async def process_chat(self, user_input):
-        try:
-
-            self.after(
-                0, lambda: self.update_status("AI is thinking...", show_progress=True)
-            )
-
-            logging.debug(f"Current FSM state: {self.bot.get_state()}")
-            logging.debug(f"User input: {user_input}")
-
-            if user_input.lower() in ["quit", "exit"]:
-                try:
-
-                    getattr(
-                        self.bot.support_bot.fsm, "set_next_state", lambda *_: None
-                    )("END")
-                except Exception:
-                    pass
-                self.after(
-                    0,
-                    lambda: self.update_status(
-                        "Conversation ended", show_progress=False
-                    ),
-                )
-                self.after(
-                    0,
-                    lambda: self.display_message(
-                        "Agent: Conversation ended. Thank you!", "BOT"
-                    ),
-                )
-                return
-
-            run_state: FSMRun = await self.bot.process(
-                user_input=user_input, model="gpt-5-nano-2025-08-07"
-            )
-
-            await self.simulate_streaming_response(run_state.response)
-
-            if self.bot.is_completed():
-                self.after(
-                    0,
-                    lambda: self.update_status(
-                        "Conversation completed", show_progress=False
-                    ),
-                )
-                await self.simulate_streaming_response("Conversation ended. Thank you!")
-            else:
-                self.after(
-                    0,
-                    lambda: self.update_status(
-                        "Waiting for your response...", show_progress=False
-                    ),
-                )
-
-        except Exception as e:
-            logging.error(f"Error in process_chat: {e}")
-            self.after(
-                0, lambda: self.update_status("Error occurred", show_progress=False)
-            )
-            await self.simulate_streaming_response(
-                f"Sorry, I encountered an error: {str(e)}"
-            )
-
-    def display_message(self, message, tag):
-        """Display message in chat with proper error handling"""
-        try:
-            self.chat_display.config(state=ttk.NORMAL)
-            self.chat_display.insert(ttk.END, message + "\n", tag)
-            self.chat_display.config(state=ttk.DISABLED)
-            self.chat_display.see(ttk.END)
-        except Exception as e:
-            logging.error(f"Error displaying message: {e}")
-
-    def display_user_message(self, user_input):
-        """Display user message with proper styling - only 'You:' is green"""
-        try:
-            self.chat_display.config(state=ttk.NORMAL)
-
-            self.chat_display.insert(ttk.END, "You: ", "USER_NAME")
-
-            self.chat_display.insert(ttk.END, user_input + "\n", "USER_MESSAGE")
-            self.chat_display.config(state=ttk.DISABLED)
-            self.chat_display.see(ttk.END)
-        except Exception as e:
-            logging.error(f"Error displaying user message: {e}")
-
-    def start_agent_message(self):
-        """Start a new agent message and return the starting position"""
-        try:
-            self.chat_display.config(state=ttk.NORMAL)
-
-            start_pos = self.chat_display.index(ttk.END)
-            self.chat_display.insert(ttk.END, "Agent: ", "BOT")
-            return start_pos
-        except Exception as e:
-            logging.error(f"Error starting agent message: {e}")
-            return None
-
-    def stream_agent_text(self, text, is_final=False):
-        """Stream text as the agent response, word by word"""
-        try:
-            self.chat_display.config(state=ttk.NORMAL)
-
-            self.chat_display.insert(ttk.END, text, "BOT_STREAMING")
-
-            if is_final:
-                self.chat_display.insert(ttk.END, "\n")
-
-            self.chat_display.config(state=ttk.DISABLED)
-            self.chat_display.see(ttk.END)
-            self.update_idletasks()
-        except Exception as e:
-            logging.error(f"Error streaming agent text: {e}")
-
-    async def simulate_streaming_response(self, response_text):
-        """Simulate streaming by displaying the response with proper formatting"""
-        try:
-
-            self.after(0, self.start_agent_message)
-            await asyncio.sleep(0.1)
-
-            formatted_text = format_response_text(response_text)
-
-            chunks = split_text_for_streaming(formatted_text)
-
-            for chunk in chunks:
-                self.after(0, lambda text=chunk: self.stream_agent_text(text))
-                await asyncio.sleep(0.03)
-
-            # mark final and store the full response for copying
-            self.after(0, lambda: self.stream_agent_text("", is_final=True))
-            try:
-                # store last response on window for copy action
-                full = formatted_text
-                self.after(0, lambda: setattr(self, "last_agent_response", full))
-                # enable copy button if present
-                self.after(
-                    0,
-                    lambda: getattr(self, "copy_button", None)
-                    and self.copy_button.config(state=ttk.NORMAL),
-                )
-                # insert an inline copy button for this message
-                try:
-                    self.after(0, lambda: insert_copy_button(self, full))
-                except Exception:
-                    pass
-            except Exception:
-                pass
-
-        except Exception as e:
-            logging.error(f"Error in streaming response: {e}")
-
-            formatted_fallback = format_response_text(response_text)
-            self.after(
-                0, lambda: self.display_message(f"Agent: {formatted_fallback}", "BOT")
-            )
-            try:
-                self.after(
-                    0, lambda: setattr(self, "last_agent_response", formatted_fallback)
-                )
-                self.after(
-                    0,
-                    lambda: getattr(self, "copy_button", None)
-                    and self.copy_button.config(state=ttk.NORMAL),
-                )
-                try:
-                    self.after(0, lambda: insert_copy_button(self, formatted_fallback))
-                except Exception:
-                    pass
-            except Exception:
-                pass
-
 
 if __name__ == "__main__":
-    app = CustomerSupportBot()
+    profiler.mark("imports done")
+    profiler.report_when("welcome shown", "backend ready", "warm-up done")
+    with profiler.phase("load environment"):
+        load_environment()
+        configure_logging()
+    with profiler.phase("create window"):
+        app = CustomerSupportBot()
     app.mainloop()
@@ -0,0 +1,151 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+# Spans recorded for every turn, in pipeline order:
+# queue       submit (GUI) or lock wait (server) until the turn starts running
+# api_ttfb    request sent until the first byte of the completion arrives
+# api         request sent until the completion is complete
+# fsm_handler time spent in the state handler after the completion
+# fsm         the whole run_state_machine call, API included
+# format      StreamFormatter work for the turn's deltas
+# render      one StreamRenderer flush to the Text widget
+# turn        the whole turn as the user experiences it
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class LatencyTracker:
+    """Rolling window of latencies, in seconds."""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(q * len(samples)))
+        return samples[index]
+
+
+class Metrics:
+    """Named latency spans with rolling percentiles over the last `window` samples.
+
+    Recording costs a clock read and a deque append, so spans can stay on in
+    production. Totals (`count`, `sum`) cover the whole process lifetime.
+    Safe to use from the Tk thread and the event loop thread at once.
+    """
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._counts: Dict[str, int] = {}
+        self._sums: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            tracker = self._trackers.get(name)
+            if tracker is None:
+                tracker = self._trackers[name] = LatencyTracker(self.window)
+            self._counts[name] = self._counts.get(name, 0) + 1
+            self._sums[name] = self._sums.get(name, 0.0) + seconds
+        tracker.record(seconds)
+
+    @contextmanager
+    def span(self, name: str):
+        """Record how long the `with` block takes, also when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def timed(self, name: str):
+        """Decorate a coroutine function so every call is recorded as `name`."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Count, sum and rolling percentiles of every span, keyed by name."""
+        with self._lock:
+            names = sorted(self._trackers)
+            totals = {name: (self._counts[name], self._sums[name]) for name in names}
+        result = {}
+        for name in names:
+            count, total = totals[name]
+            entry = {"count": count, "sum": total}
+            for q in QUANTILES:
+                entry[f"p{int(q * 100)}"] = self._trackers[name].percentile(q)
+            result[name] = entry
+        return result
+
+    def to_jsonl(self) -> str:
+        """One JSON object per span, stamped with the current time."""
+        now = time.time()
+        return "".join(
+            json.dumps({"ts": now, "span": name, **values}) + "\n"
+            for name, values in self.snapshot().items()
+        )
+
+    def to_prometheus(self, prefix: str = "arxis") -> str:
+        """Every span as a Prometheus summary in the text exposition format."""
+        lines = []
+        for name, values in self.snapshot().items():
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for q in QUANTILES:
+                value = values[f"p{int(q * 100)}"]
+                if value is not None:
+                    lines.append(f'{metric}{{quantile="{q}"}} {value:.6f}')
+            lines.append(f"{metric}_sum {values['sum']:.6f}")
+            lines.append(f"{metric}_count {values['count']}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def export(self, path: str):
+        """Write the spans to `path`: Prometheus text for *.prom, else append JSON lines."""
+        if path.endswith(".prom"):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+        else:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(self.to_jsonl())
+
+
+# Process-wide registry used by the GUI, the server and the completion layer.
+metrics = Metrics()
+
+
+def export_metrics():
+    """Export `metrics` to ARXIS_METRICS_FILE, if that is set."""
+    path = os.getenv("ARXIS_METRICS_FILE")
+    if not path:
+        return
+    try:
+        metrics.export(path)
+    except OSError as e:
+        logging.error(f"Error exporting metrics to {path}: {e}")
@@ -0,0 +1,117 @@
+"""Mock SupportBot backend that simulates AI responses without needing the OpenAI API"""
+
+import asyncio
+import random
+
+
+class MockSupportBot:
+    """Mock version that simulates the real SupportBot without API calls"""
+
+    class MockFSM:
+        def __init__(self, latency=(1.0, 3.0)):
+            self.current_state = "START"
+            self.completed = False
+            self.latency = latency
+
+        def is_completed(self):
+            return self.completed
+
+        def get_curr_state(self):
+            return self.current_state
+
+        def set_next_state(self, state):
+            self.current_state = state
+            if state == "END":
+                self.completed = True
+
+        async def run_state_machine(
+            self, client, user_input, model="gpt-5-nano-2025-08-07"
+        ):
+
+            await asyncio.sleep(random.uniform(*self.latency))
+
+            class MockRun:
+                def __init__(self, response):
+                    self.response = response
+
+            if self.current_state == "START":
+                if "name" in user_input.lower() or any(
+                    word
+                    for word in user_input.split()
+                    if len(word) > 2 and word.isalpha()
+                ):
+                    self.set_next_state("IDENTIFIED")
+                    return MockRun(
+                        "Thank you! You provided your name. How can I help you today?"
+                    )
+                else:
+                    return MockRun("Please provide your name to get started.")
+
+            elif self.current_state == "CONFIRM":
+                user_input_lower = user_input.lower().strip()
+
+                positive_indicators = [
+                    "yes",
+                    "y",
+                    "correct",
+                    "true",
+                    "confirm",
+                    "confirmed",
+                    "right",
+                    "accurate",
+                ]
+                negative_indicators = [
+                    "no",
+                    "n",
+                    "incorrect",
+                    "false",
+                    "wrong",
+                    "not correct",
+                    "not right",
+                ]
+
+                if any(
+                    indicator in user_input_lower for indicator in positive_indicators
+                ):
+
+                    if not any(
+                        neg_word in user_input_lower
+                        for neg_word in ["not", "no", "isn't", "aren't", "don't"]
+                    ):
+                        self.set_next_state("IDENTIFIED")
+                        return MockRun(
+                            "Thank you for confirming your details. How can I help you today?"
+                        )
+
+                if any(
+                    indicator in user_input_lower for indicator in negative_indicators
+                ):
+                    self.set_next_state("START")
+                    return MockRun("Let's try again. Please provide your name.")
+
+                return MockRun(
+                    "I didn't understand your response. Please reply with 'yes' if the information is correct, or 'no' if it needs to be changed."
+                )
+
+            elif self.current_state == "IDENTIFIED":
+                if any(
+                    word in user_input.lower()
+                    for word in ["bye", "goodbye", "done", "finished", "quit", "exit"]
+                ):
+                    self.set_next_state("END")
+                    return MockRun("Thank you for contacting us! Have a great day!")
+                else:
+                    return MockRun(
+                        "I understand your concern. Is there anything else I can help you with today?"
+                    )
+
+            else:
+                return MockRun("Goodbye!")
+
+    def __init__(self, latency=(1.0, 3.0)):
+        """`latency` is the (min, max) range in seconds of the simulated API delay."""
+        self.fsm = self.MockFSM(latency=latency)
+        self.ai_client = None
+
+    def end(self):
+        self.fsm.set_next_state("END")
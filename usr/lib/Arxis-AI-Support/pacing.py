@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import os
+from typing import Callable, Iterable, Optional
+
+
+DEFAULT_CPS = 700.0
+
+
+class Pacer:
+    """Base pacing strategy for the typewriter effect.
+
+    Subclasses decide how long to wait before the first chunk (`start_delay`)
+    and after each chunk (`delay`), given how many characters are still queued.
+    """
+
+    name = "base"
+    start_delay = 0.0
+
+    def delay(self, chunk: str, backlog: int) -> float:
+        return 0.0
+
+    async def play(
+        self,
+        chunks: Iterable[str],
+        emit: Callable[[str], None],
+        total: Optional[int] = None,
+    ) -> None:
+        """Emit `chunks` one by one, sleeping between them as the strategy dictates.
+
+        `total` is the expected number of characters; pass it to consume `chunks`
+        lazily instead of materialising them to measure the backlog.
+        """
+        if total is None:
+            chunks = list(chunks)
+            total = sum(len(chunk) for chunk in chunks)
+        backlog = total
+
+        if self.start_delay > 0:
+            await asyncio.sleep(self.start_delay)
+
+        for chunk in chunks:
+            emit(chunk)
+            backlog = max(0, backlog - len(chunk))
+            wait = self.delay(chunk, backlog)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+
+class InstantPacer(Pacer):
+    """No artificial delay at all: text is shown as soon as it is available."""
+
+    name = "instant"
+
+
+class FixedRatePacer(Pacer):
+    """Reveal text at a constant number of characters per second."""
+
+    name = "fixed"
+
+    def __init__(self, cps: float = DEFAULT_CPS, start_delay: float = 0.0):
+        if cps <= 0:
+            raise ValueError("cps must be positive")
+        self.cps = cps
+        self.start_delay = start_delay
+
+    def delay(self, chunk: str, backlog: int) -> float:
+        return len(chunk) / self.cps
+
+
+class AdaptivePacer(FixedRatePacer):
+    """Fixed-rate pacing that speeds up when a backlog builds.
+
+    Once more than `catch_up_chars` characters are waiting, the rate scales up
+    proportionally so long answers finish in roughly the same time as short ones.
+    Delays are never longer than `max_delay`.
+    """
+
+    name = "adaptive"
+
+    def __init__(
+        self,
+        cps: float = DEFAULT_CPS,
+        catch_up_chars: int = 200,
+        max_delay: float = 0.05,
+        start_delay: float = 0.0,
+    ):
+        super().__init__(cps=cps, start_delay=start_delay)
+        self.catch_up_chars = max(1, catch_up_chars)
+        self.max_delay = max_delay
+
+    def delay(self, chunk: str, backlog: int) -> float:
+        speedup = max(1.0, backlog / self.catch_up_chars)
+        return min(self.max_delay, len(chunk) / (self.cps * speedup))
+
+
+PACERS = {
+    InstantPacer.name: InstantPacer,
+    FixedRatePacer.name: FixedRatePacer,
+    AdaptivePacer.name: AdaptivePacer,
+}
+
+
+def create_pacer(name: Optional[str] = None, cps: Optional[float] = None) -> Pacer:
+    """Build a pacer by strategy name, falling back to the deployment settings.
+
+    - ARXIS_PACING selects the strategy: instant, fixed or adaptive (default).
+    - ARXIS_PACING_CPS sets the characters-per-second rate.
+    """
+    name = (name or os.getenv("ARXIS_PACING") or AdaptivePacer.name).strip().lower()
+    pacer_cls = PACERS.get(name)
+    if pacer_cls is None:
+        logging.error(f"Unknown pacing strategy '{name}', using adaptive")
+        pacer_cls = AdaptivePacer
+
+    if pacer_cls is InstantPacer:
+        return InstantPacer()
+
+    if cps is None:
+        try:
+            cps = float(os.getenv("ARXIS_PACING_CPS", DEFAULT_CPS))
+        except ValueError:
+            logging.error("ARXIS_PACING_CPS is not a number, using default")
+            cps = DEFAULT_CPS
+    try:
+        return pacer_cls(cps=cps)
+    except ValueError as e:
+        logging.error(f"Invalid pacing settings: {e}")
+        return pacer_cls()
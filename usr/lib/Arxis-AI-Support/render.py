@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+import ttkbootstrap as ttk
+from metrics import metrics
+
+
+FRAME_MS = 16
+
+
+class StreamRenderer:
+    """Frame-coalesced writer for the chat transcript.
+
+    Streamed text is gathered in a buffer and flushed to the TranscriptView at
+    most once per display frame, with a single state toggle and scroll per flush
+    instead of one Tk callback, insert and redraw per chunk.
+
+    All public methods except `flush` are safe to call from any thread. Each
+    flush that writes something is recorded as the `render` span. Flushes are
+    scheduled with `root.after`, so `root` can be the window or a TkAsyncBridge.
+    """
+
+    def __init__(self, root, view, frame_ms: int = FRAME_MS):
+        self.root = root
+        self.view = view
+        self.display = view.display
+        self.frame_ms = frame_ms
+        self._lock = threading.Lock()
+        self._ops = []
+        self._scheduled = False
+
+    def begin(self, label: str = "Agent: ", tag: str = "BOT"):
+        """Start a new agent message; streamed text is written after `label`."""
+        self._push("begin", (label, tag))
+
+    def write(self, text: str, tag: str = "BOT_STREAMING"):
+        """Queue text for the current agent message."""
+        if text:
+            self._push("text", tag, text)
+
+    def replace(self, text: str, tag: str = "BOT_STREAMING"):
+        """Replace everything written since the last `begin`."""
+        self._push("replace", (text, tag))
+
+    def end(self, callback=None):
+        """Terminate the current message, then run `callback` on the Tk thread."""
+        self._push("end", callback)
+
+    def _push(self, kind, payload, text=None):
+        with self._lock:
+            if kind == "text":
+                last = self._ops[-1] if self._ops else None
+                if last is not None and last[0] == "text" and last[1] == payload:
+                    last[2].append(text)
+                else:
+                    self._ops.append(("text", payload, [text]))
+            else:
+                self._ops.append((kind, payload))
+
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        try:
+            self.root.after(self.frame_ms, self.flush)
+        except Exception as e:
+            logging.error(f"Error scheduling render flush: {e}")
+            with self._lock:
+                self._scheduled = False
+
+    def flush(self):
+        """Apply all pending operations to the widget. Must run on the Tk thread."""
+        with self._lock:
+            ops, self._ops = self._ops, []
+            self._scheduled = False
+
+        if not ops:
+            return
+
+        display = self.display
+        view = self.view
+        started = time.perf_counter()
+        try:
+            display.config(state=ttk.NORMAL)
+            for op in ops:
+                kind = op[0]
+                if kind == "text":
+                    view.write("".join(op[2]), op[1])
+                elif kind == "begin":
+                    view.begin(*op[1])
+                elif kind == "replace":
+                    view.replace(*op[1])
+                elif kind == "end":
+                    view.end()
+                    callback = op[1]
+                    if callback is not None:
+                        try:
+                            callback()
+                        except Exception as e:
+                            logging.error(f"Error in render end callback: {e}")
+                        display.config(state=ttk.NORMAL)
+        except Exception as e:
+            logging.error(f"Error flushing streamed text: {e}")
+        finally:
+            try:
+                display.config(state=ttk.DISABLED)
+                display.see(ttk.END)
+            except Exception as e:
+                logging.error(f"Error finishing render flush: {e}")
+            metrics.observe("render", time.perf_counter() - started)
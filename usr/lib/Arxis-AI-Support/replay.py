@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""Replay recorded conversations through the real state machine without the API.
+
+Reads conversation journals (see journal.py), rebuilds every session's user
+turns and runs them through BotRunner and SupportBot, many sessions at once.
+A JournalTransport under the OpenAI client answers each completion with the
+one recorded for that turn, streamed through the SDK's own parsing, after the
+recorded API latency times `--latency-scale` (0 replays as fast as the CPU
+allows):
+
+    python3 replay.py ~/.local/share/arxis-ai-support/journal.jsonl* --concurrency 50
+
+Reports throughput, per-turn latency and how many replies differ from the
+recording, so FSM or formatting changes can be tried on production-shaped
+traffic. Set ARXIS_CACHE=off and ARXIS_FAST_PATH=off to send every turn
+through the recorded completions.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import openai
+
+from bot import BotRunner, DEFAULT_MODEL
+from environment import load_environment
+from intent import is_end_command
+from logconfig import configure_logging
+from metrics import metrics
+from stub_server import StubTransport
+from support import SupportBot
+from transport import OFFLINE_API_KEY
+
+
+# characters of the completion's JSON per streamed event, roughly two tokens
+DELTA_CHARS = 8
+REPLAY_URL = "http://replay.invalid/v1"
+
+
+class JournalTransport(StubTransport):
+    """Serve the completions recorded in a journal to a real openai.AsyncOpenAI.
+
+    Set `turn` to the journal entry being replayed before running it. Its
+    `completion` is sent back as the API would, streamed or not, so the SDK's
+    own parsing runs. It takes the recorded `api_latency`, or the turn's own
+    latency for older entries, times `latency_scale`.
+    """
+
+    def __init__(self, latency_scale: float = 1.0, delta_chars: int = DELTA_CHARS):
+        super().__init__(delta_chars=delta_chars)
+        self.latency_scale = latency_scale
+        self.turn: Optional[dict] = None
+
+    def respond(self, request: dict) -> Optional[str]:
+        entry = self.turn or {}
+        data = entry.get("completion")
+        if data is None:
+            return None
+        content = json.dumps(data)
+
+        api = entry.get("api_latency") or {}
+        latency = entry.get("latency") or {}
+        total = api.get("total") or latency.get("turn") or 0.0
+        ttfb = min(api.get("ttfb") or latency.get("first_delta") or total, total)
+        pieces = -(-len(content) // self.delta_chars)
+        self.ttfb = ttfb * self.latency_scale
+        self.delta_delay = (total - ttfb) * self.latency_scale / max(1, pieces - 1)
+        return content
+
+    def missing(self, path: str) -> str:
+        entry = self.turn or {}
+        return (
+            f"No recorded completion for turn {entry.get('turn')} "
+            f"of session {entry.get('session')}"
+        )
+
+
+def replay_client(transport: JournalTransport) -> openai.AsyncOpenAI:
+    """An OpenAI client whose requests are answered by `transport`."""
+    return openai.AsyncOpenAI(
+        api_key=OFFLINE_API_KEY,
+        base_url=REPLAY_URL,
+        http_client=openai.DefaultAsyncHttpxClient(transport=transport),
+        max_retries=0,
+    )
+
+
+def load_sessions(paths: Iterable[str]) -> Dict[str, List[dict]]:
+    """Journal entries grouped by session, each session in turn order."""
+    sessions: Dict[str, List[dict]] = defaultdict(list)
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                    sessions[str(entry["session"])].append(entry)
+                except (ValueError, KeyError, TypeError) as e:
+                    logging.error(f"Skipping {path}:{number}: {e}")
+    for turns in sessions.values():
+        turns.sort(key=lambda entry: (entry.get("turn") or 0, entry.get("ts") or 0))
+    return dict(sessions)
+
+
+class ReplayStats:
+    """What the replayed turns took and how they compare with the recording."""
+
+    def __init__(self):
+        self.sessions = 0
+        self.turns = 0
+        self.mismatches = 0
+        self.errors = 0
+        self.latencies: List[float] = []
+        self.first_delta: List[float] = []
+
+
+async def replay_session(
+    turns: List[dict],
+    stats: ReplayStats,
+    latency_scale: float = 1.0,
+    stream: bool = True,
+):
+    """Replay one recorded conversation on a fresh SupportBot."""
+    transport = JournalTransport(latency_scale)
+    client = replay_client(transport)
+    runner = BotRunner(SupportBot(ai_client=client))
+    stats.sessions += 1
+    try:
+        await _replay_turns(runner, transport, turns, stats, stream)
+    finally:
+        await client.close()
+
+
+async def _replay_turns(
+    runner: BotRunner,
+    transport: JournalTransport,
+    turns: List[dict],
+    stats: ReplayStats,
+    stream: bool,
+):
+    for entry in turns:
+        message = str(entry.get("user") or "")
+        if is_end_command(message):
+            runner.end()
+            continue
+        # cancelled and failed turns left the conversation as it was
+        if entry.get("outcome", "ok") != "ok":
+            continue
+
+        transport.turn = entry
+        model = entry.get("model") or DEFAULT_MODEL
+        started = time.perf_counter()
+        reply = []
+        try:
+            if stream:
+                async for delta in runner.stream(user_input=message, model=model):
+                    if not reply:
+                        stats.first_delta.append(time.perf_counter() - started)
+                    if delta.replace:
+                        reply.clear()
+                    reply.append(delta.text)
+            else:
+                run = await runner.process(message, model=model)
+                reply.append(str(run.response or ""))
+        except Exception as e:
+            stats.errors += 1
+            logging.error(f"Replay of session {entry.get('session')} failed: {e}")
+            return
+        stats.latencies.append(time.perf_counter() - started)
+        stats.turns += 1
+
+        recorded = entry.get("reply")
+        if recorded is not None and "".join(reply) != recorded:
+            stats.mismatches += 1
+            logging.debug(
+                "Reply differs in session %s turn %s",
+                entry.get("session"),
+                entry.get("turn"),
+            )
+
+
+async def replay(
+    sessions: Dict[str, List[dict]],
+    concurrency: int = 20,
+    repeat: int = 1,
+    latency_scale: float = 1.0,
+    stream: bool = True,
+) -> ReplayStats:
+    """Replay every session `repeat` times, at most `concurrency` at once."""
+    stats = ReplayStats()
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(turns):
+        async with slots:
+            await replay_session(turns, stats, latency_scale, stream)
+
+    await asyncio.gather(
+        *(run(turns) for _ in range(repeat) for turns in sessions.values())
+    )
+    return stats
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(stats: ReplayStats, elapsed: float):
+    print(f"sessions:        {stats.sessions} ({stats.errors} failed)")
+    print(f"turns:           {stats.turns} in {elapsed:.2f}s")
+    print(f"throughput:      {stats.turns / elapsed if elapsed else 0.0:.1f} turns/s")
+    print(
+        f"turn latency:    p50 {percentile(stats.latencies, 50) * 1000:.1f} ms, "
+        f"p95 {percentile(stats.latencies, 95) * 1000:.1f} ms, "
+        f"p99 {percentile(stats.latencies, 99) * 1000:.1f} ms"
+    )
+    if stats.first_delta:
+        print(
+            f"first delta:     p50 {percentile(stats.first_delta, 50) * 1000:.1f} ms, "
+            f"p95 {percentile(stats.first_delta, 95) * 1000:.1f} ms"
+        )
+    print(f"changed replies: {stats.mismatches}")
+    for name, values in metrics.snapshot().items():
+        if values["p50"] is None:
+            continue
+        print(
+            f"span {name:<11} n={values['count']:<6} "
+            f"p50 {values['p50'] * 1000:8.2f} ms  p99 {values['p99'] * 1000:8.2f} ms"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("journals", nargs="+", help="journal files to replay")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="replay every session this many times"
+    )
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="multiply the recorded API latencies (0: no waiting)",
+    )
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="run turns without streaming, as BotRunner.process does",
+    )
+    parser.add_argument(
+        "--log-level",
+        help="debug, info, warning or error (default: ARXIS_LOG_LEVEL or info)",
+    )
+    args = parser.parse_args(argv)
+
+    load_environment()
+    configure_logging(args.log_level)
+    sessions = load_sessions(args.journals)
+    started = time.perf_counter()
+    stats = asyncio.run(
+        replay(
+            sessions,
+            concurrency=args.concurrency,
+            repeat=args.repeat,
+            latency_scale=args.latency_scale,
+            stream=not args.no_stream,
+        )
+    )
+    report(stats, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
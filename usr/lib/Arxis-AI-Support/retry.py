@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Awaitable, Callable, Optional
+
+import openai
+
+from metrics import LatencyTracker
+
+
+# Failures worth another attempt: the request may succeed if sent again.
+RETRYABLE_ERRORS = (
+    asyncio.TimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+class RetryPolicy:
+    """Per-request timeout, retries with exponential backoff and full jitter.
+
+    With `hedge` enabled, a request that has not finished after the observed p95
+    latency is sent a second time and whichever copy answers first is used; the
+    other is cancelled. Hedging only starts once `hedge_min_samples` latencies
+    have been recorded.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        timeout: Optional[float] = 60.0,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        hedge: bool = False,
+        hedge_min_samples: int = 20,
+    ):
+        self.attempts = max(1, attempts)
+        self.timeout = timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.latency = LatencyTracker()
+        self.retries = 0
+        self.hedged = 0
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (0-based), with full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def hedge_after(self) -> Optional[float]:
+        if not self.hedge or len(self.latency) < self.hedge_min_samples:
+            return None
+        return self.latency.percentile(0.95)
+
+    async def _attempt(self, call: Callable[[], Awaitable]):
+        if self.timeout:
+            return await asyncio.wait_for(call(), self.timeout)
+        return await call()
+
+    async def _hedged(self, call: Callable[[], Awaitable], delay: float):
+        pending = {asyncio.ensure_future(self._attempt(call))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                self.hedged += 1
+                logging.debug("Request slower than p95 (%.2fs), hedging", delay)
+                pending.add(asyncio.ensure_future(self._attempt(call)))
+
+            error = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable],
+        hedge: bool = False,
+        retryable: Callable[[], bool] = lambda: True,
+    ):
+        """Await `call()` under this policy and return its result.
+
+        `call` must start a fresh request each time it is invoked. Retries stop
+        early once `retryable()` is False, e.g. after part of a stream was shown.
+        """
+        for attempt in range(self.attempts):
+            started = time.monotonic()
+            try:
+                delay = self.hedge_after() if hedge else None
+                if delay is None:
+                    result = await self._attempt(call)
+                else:
+                    result = await self._hedged(call, delay)
+            except RETRYABLE_ERRORS as e:
+                if attempt + 1 >= self.attempts or not retryable():
+                    raise
+                wait = self.backoff(attempt)
+                self.retries += 1
+                logging.warning(
+                    "Request failed (%s), retrying in %.2fs", type(e).__name__, wait
+                )
+                await asyncio.sleep(wait)
+                continue
+            self.latency.record(time.monotonic() - started)
+            return result
+
+    def stats(self) -> dict:
+        return {
+            "retries": self.retries,
+            "hedged": self.hedged,
+            "p50": self.latency.percentile(0.5),
+            "p95": self.latency.percentile(0.95),
+        }
+
+
+def create_retry_policy() -> RetryPolicy:
+    """Build the retry policy selected by the deployment settings.
+
+    - ARXIS_RETRIES: attempts per request, including the first (default 3)
+    - ARXIS_REQUEST_TIMEOUT: seconds per attempt, 0 disables (default 60)
+    - ARXIS_HEDGE: send a second request after the p95 latency (default off)
+    """
+    try:
+        attempts = int(os.getenv("ARXIS_RETRIES", 3))
+        timeout = float(os.getenv("ARXIS_REQUEST_TIMEOUT", 60)) or None
+    except ValueError:
+        logging.error("Invalid ARXIS_RETRIES or ARXIS_REQUEST_TIMEOUT, using defaults")
+        attempts, timeout = 3, 60.0
+    hedge = os.getenv("ARXIS_HEDGE", "off").strip().lower()
+    hedge = hedge in ("1", "true", "yes", "on")
+    return RetryPolicy(attempts=attempts, timeout=timeout, hedge=hedge)
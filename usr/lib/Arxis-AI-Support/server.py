@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""Headless multi-session chat server for Arxis AI Support.
+
+Speaks a JSON-lines protocol over TCP so many users can be served from one
+process and one event loop. Each request is a single line:
+
+    {"session": "<id>", "message": "<user text>"}
+
+and is answered with zero or more delta lines followed by a done line:
+
+    {"session": "<id>", "delta": "<text>"}
+    {"session": "<id>", "delta": "<text>", "replace": true}
+    {"session": "<id>", "done": true, "state": "IDENTIFIED", "completed": false,
+     "prompt_tokens": 412}
+
+`prompt_tokens` is an estimate and is only present for backends that report it.
+
+Failures are reported as {"session": "<id>", "error": "<message>"}. A connection
+may carry requests for several sessions; turns within a session run in order.
+A request line longer than 1 MiB is answered with an error and the connection
+is closed.
+
+Latency spans (see metrics.py) are answered for {"metrics": "json"} with
+{"metrics": {"<span>": {"count": ..., "p50": ...}}} and for
+{"metrics": "prometheus"} with {"metrics": "<exposition text>"}.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from bot import BotRunner, DEFAULT_MODEL
+from client import close_client
+from environment import load_environment
+from intent import is_end_command
+from logconfig import configure_logging
+from journal import Journal, create_journal
+from metrics import metrics, export_metrics
+
+
+# longest request line accepted, well above any chat message
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+class Session:
+    """Per-conversation state held by the pool."""
+
+    def __init__(self, session_id: str, runner: BotRunner):
+        self.session_id = session_id
+        self.runner = runner
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+        self.turns = 0
+
+
+class SessionPool:
+    """Pool of per-session BotRunners keyed by session id.
+
+    Sessions are created on first use with `factory`, evicted least-recently-used
+    first once `max_sessions` is reached and dropped after `idle_timeout` seconds
+    without a turn.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], BotRunner],
+        max_sessions: int = 1000,
+        idle_timeout: float = 1800.0,
+    ):
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            while len(self._sessions) >= self.max_sessions:
+                self._evict()
+            session = Session(session_id, self.factory())
+            self._sessions[session_id] = session
+        else:
+            self._sessions.move_to_end(session_id)
+        session.last_used = time.monotonic()
+        return session
+
+    def _evict(self):
+        """Drop the least recently used session, preferring ones not mid-turn."""
+        victim = next(iter(self._sessions))
+        for key, session in self._sessions.items():
+            if not session.lock.locked():
+                victim = key
+                break
+        del self._sessions[victim]
+        logging.info("Evicted session %s: pool is full", victim)
+
+    def drop(self, session_id: str):
+        self._sessions.pop(session_id, None)
+
+    def prune(self) -> int:
+        """Drop idle sessions, returning how many were removed."""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [
+            key
+            for key, session in self._sessions.items()
+            if session.last_used < cutoff and not session.lock.locked()
+        ]
+        for key in idle:
+            del self._sessions[key]
+        return len(idle)
+
+
+class ChatServer:
+    """JSON-lines TCP front end driving a SessionPool on a single event loop.
+
+    Every turn is recorded in `journal`, when one is given.
+    """
+
+    def __init__(
+        self,
+        pool: SessionPool,
+        model: str = DEFAULT_MODEL,
+        journal: Optional[Journal] = None,
+    ):
+        self.pool = pool
+        self.model = model
+        self.journal = journal
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765):
+        self._server = await asyncio.start_server(
+            self._handle_client, host, port, limit=MAX_REQUEST_BYTES
+        )
+        return self._server
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765):
+        server = await self.start(host, port)
+        sockets = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        logging.info(f"Arxis AI Support server listening on {sockets}")
+        prune_task = asyncio.ensure_future(self._prune_loop())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            prune_task.cancel()
+            await close_client()
+            if self.journal is not None:
+                self.journal.close()
+            export_metrics()
+
+    async def _prune_loop(self):
+        interval = max(1.0, min(60.0, self.pool.idle_timeout / 2))
+        while True:
+            await asyncio.sleep(interval)
+            removed = self.pool.prune()
+            if removed:
+                logging.info("Pruned %d idle sessions", removed)
+
+    async def _handle_client(self, reader, writer):
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def send(payload: dict):
+            async with write_lock:
+                writer.write((json.dumps(payload) + "\n").encode("utf-8"))
+                await writer.drain()
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # the rest of an overlong line cannot be told from new requests
+                    await send({"session": None, "error": "Request line too long"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.ensure_future(self._handle_request(line, send))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            logging.debug("Client connection closed: %s", e)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _handle_request(self, line: bytes, send):
+        session_id = None
+        try:
+            request = json.loads(line)
+            if "metrics" in request:
+                await send({"metrics": self.metrics_report(request["metrics"])})
+                return
+            session_id = str(request["session"])
+            message = str(request.get("message", "")).strip()
+        except (ValueError, KeyError, TypeError) as e:
+            await send({"session": session_id, "error": f"Bad request: {e}"})
+            return
+
+        if not message:
+            await send({"session": session_id, "error": "Empty message"})
+            return
+
+        try:
+            with metrics.span("turn"):
+                await self.run_turn(session_id, message, send)
+        except Exception as e:
+            logging.error(f"Error in session {session_id}: {e}")
+            await send({"session": session_id, "error": str(e)})
+
+    @staticmethod
+    def metrics_report(fmt: str):
+        """The latency spans as a dict, or as Prometheus text for "prometheus"."""
+        if fmt == "prometheus":
+            return metrics.to_prometheus()
+        return metrics.snapshot()
+
+    async def run_turn(self, session_id: str, message: str, send):
+        """Run one conversation turn for `session_id`, sending deltas as they arrive."""
+        session = self.pool.get(session_id)
+        queued = time.perf_counter()
+        async with session.lock:
+            started = time.perf_counter()
+            metrics.observe("queue", started - queued)
+            runner = session.runner
+            session.turns += 1
+            entry = {"session": session_id, "turn": session.turns, "user": message}
+            entry["latency"] = {"queue": started - queued}
+            entry["state_before"] = runner.get_state()
+            try:
+                await self._run_turn(session, message, send, entry, started)
+            except asyncio.CancelledError:
+                entry["outcome"] = "cancelled"
+                raise
+            except Exception as e:
+                entry.update(outcome="error", error=str(e))
+                raise
+            finally:
+                entry["latency"]["turn"] = time.perf_counter() - queued
+                if self.journal is not None:
+                    self._record(entry, runner)
+
+    def _record(self, entry: dict, runner: BotRunner):
+        try:
+            entry.update(runner.turn_info())
+            self.journal.record(entry)
+        except Exception as e:
+            logging.error(f"Error recording turn in the journal: {e}")
+
+    async def _run_turn(self, session: Session, message: str, send, entry, started):
+        """The turn itself; `entry` collects what the journal records about it."""
+        session_id = session.session_id
+        runner = session.runner
+        if is_end_command(message):
+            entry["outcome"] = "ended"
+            runner.end()
+            self.pool.drop(session_id)
+            await send(
+                {"session": session_id, "delta": "Conversation ended. Thank you!"}
+            )
+            await send(
+                {
+                    "session": session_id,
+                    "done": True,
+                    "state": "END",
+                    "completed": True,
+                }
+            )
+            return
+
+        reply = []
+        async for delta in runner.stream(user_input=message, model=self.model):
+            if not reply:
+                entry["latency"]["first_delta"] = time.perf_counter() - started
+            payload = {"session": session_id, "delta": delta.text}
+            if delta.replace:
+                payload["replace"] = True
+                reply.clear()
+            reply.append(delta.text)
+            await send(payload)
+        entry.update(reply="".join(reply), outcome="ok")
+
+        completed = runner.is_completed()
+        done = {
+            "session": session_id,
+            "done": True,
+            "state": runner.get_state(),
+            "completed": completed,
+        }
+        prompt = runner.prompt_stats()
+        if prompt is not None:
+            done["prompt_tokens"] = prompt["prompt_tokens"]
+        await send(done)
+        if completed:
+            self.pool.drop(session_id)
+        session.last_used = time.monotonic()
+
+
+def build_factory(demo: bool, latency=(1.0, 3.0)) -> Callable[[], BotRunner]:
+    """Return a factory creating one BotRunner per session."""
+    if demo:
+        from mock_bot import MockSupportBot
+
+        return lambda: BotRunner(MockSupportBot(latency=latency))
+    return BotRunner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arxis AI Support headless server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--max-sessions", type=int, default=1000)
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=1800.0,
+        help="seconds before an idle session is dropped",
+    )
+    parser.add_argument(
+        "--demo",
+        action="store_true",
+        help="serve the offline MockSupportBot backend instead of OpenAI",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        nargs=2,
+        default=(1.0, 3.0),
+        metavar=("MIN", "MAX"),
+        help="simulated API latency range in seconds for --demo",
+    )
+    parser.add_argument(
+        "--log-level",
+        help="debug, info, warning or error (default: ARXIS_LOG_LEVEL or info)",
+    )
+    args = parser.parse_args(argv)
+
+    load_environment()
+    configure_logging(args.log_level)
+    pool = SessionPool(
+        build_factory(args.demo, tuple(args.latency)),
+        max_sessions=args.max_sessions,
+        idle_timeout=args.idle_timeout,
+    )
+    server = ChatServer(pool, model=args.model, journal=create_journal(demo=args.demo))
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import builtins
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Taken when this module is imported; main.py imports it before anything heavy.
+PROCESS_START = time.perf_counter()
+
+
+def _requested() -> bool:
+    if "--profile-startup" in sys.argv:
+        return True
+    value = os.getenv("ARXIS_PROFILE_STARTUP", "").strip().lower()
+    return value in ("1", "true", "yes", "on")
+
+
+class StartupProfiler:
+    """Record how long each import and init phase of startup takes.
+
+    When enabled, every outermost `import` statement is timed (nested imports
+    count towards the statement that triggered them) until `stop_imports`, and
+    `phase`/`mark` record init steps. `report` logs the whole table once the
+    milestones given to `report_when` have all been marked.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.imports = []
+        self.phases = []
+        self.marks = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._original_import = None
+        self._pending = None
+        if enabled:
+            self._install()
+
+    def _install(self):
+        self._original_import = builtins.__import__
+
+        def timed_import(name, *args, **kwargs):
+            depth = getattr(self._local, "depth", 0)
+            self._local.depth = depth + 1
+            started = time.perf_counter()
+            try:
+                return self._original_import(name, *args, **kwargs)
+            finally:
+                self._local.depth = depth
+                if depth == 0:
+                    elapsed = time.perf_counter() - started
+                    if elapsed >= 0.001:
+                        with self._lock:
+                            self.imports.append((name, elapsed))
+
+        builtins.__import__ = timed_import
+
+    def stop_imports(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                with self._lock:
+                    self.phases.append((name, time.perf_counter() - started))
+
+    def mark(self, name: str):
+        """Record a milestone, measured from process start."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.marks.setdefault(name, time.perf_counter() - PROCESS_START)
+        self._report_if_done()
+
+    def report_when(self, *milestones: str):
+        """Report once all `milestones` have been marked."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._pending = set(milestones)
+        self._report_if_done()
+
+    def _report_if_done(self):
+        with self._lock:
+            done = self._pending is not None and self._pending.issubset(self.marks)
+            if done:
+                self._pending = None
+        if done:
+            self.report()
+
+    def report(self):
+        self.stop_imports()
+        with self._lock:
+            imports = sorted(self.imports, key=lambda item: -item[1])
+            phases = list(self.phases)
+            marks = sorted(self.marks.items(), key=lambda item: item[1])
+        lines = ["Startup profile (ms):", "  imports:"]
+        lines += [f"    {elapsed * 1000:8.1f}  {name}" for name, elapsed in imports]
+        lines.append("  phases:")
+        lines += [f"    {elapsed * 1000:8.1f}  {name}" for name, elapsed in phases]
+        lines.append("  since process start:")
+        lines += [f"    {elapsed * 1000:8.1f}  {name}" for name, elapsed in marks]
+        logging.info("\n".join(lines))
+
+
+profiler = StartupProfiler(enabled=_requested())
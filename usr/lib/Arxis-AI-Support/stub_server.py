@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""Local OpenAI-compatible chat completions server for offline runs.
+
+Answers POST /v1/chat/completions, streamed (server-sent events) or not, with a
+reply built from the request's JSON schema: every required field is filled in,
+strings with "Stub reply to: <last user message>", and an enum with its first
+value, which for the state machine's next_state_key is the current state. Point
+the bot at it with
+
+    python3 stub_server.py --port 8787 --ttfb 0.3 &
+    ARXIS_TRANSPORT=stub ARXIS_STUB_URL=http://127.0.0.1:8787/v1 python3 server.py
+
+and the whole fsm_llm and OpenAI SDK path runs without an API key or a network.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import List, Optional
+
+import httpx
+
+from logconfig import configure_logging
+
+
+DEFAULT_PORT = 8787
+# characters per streamed delta, roughly two tokens
+DELTA_CHARS = 8
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found"}
+
+
+def _resolve(schema: dict, defs: dict) -> dict:
+    while "$ref" in schema:
+        schema = defs.get(schema["$ref"].rsplit("/", 1)[-1], {})
+    return schema
+
+
+def fill_schema(schema: dict, text: str, advance: bool = False, defs=None):
+    """A value satisfying the strict JSON schema `schema`.
+
+    With `advance`, enums take their second value when there is one, which moves
+    the state machine on to its first transition.
+    """
+    defs = schema.get("$defs", {}) if defs is None else defs
+    schema = _resolve(schema, defs)
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        values = schema["enum"]
+        return values[1] if advance and len(values) > 1 else values[0]
+    for key in ("anyOf", "oneOf", "allOf"):
+        if schema.get(key):
+            options = [_resolve(option, defs) for option in schema[key]]
+            options = [option for option in options if option.get("type") != "null"]
+            return fill_schema((options or [{}])[0], text, advance, defs)
+
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((item for item in kind if item != "null"), None)
+    if kind == "object":
+        properties = schema.get("properties", {})
+        required = schema.get("required", list(properties))
+        return {
+            name: fill_schema(properties.get(name, {}), text, advance, defs)
+            for name in required
+        }
+    if kind == "array":
+        return []
+    if kind in ("integer", "number"):
+        return 0
+    if kind == "boolean":
+        return False
+    if kind == "null":
+        return None
+    return text
+
+
+def stub_content(body: dict, advance: bool = False) -> str:
+    """The assistant message content the stub answers `body` with."""
+    user = ""
+    for message in reversed(body.get("messages") or []):
+        if message.get("role") == "user":
+            user = message.get("content") or ""
+            if isinstance(user, list):
+                user = " ".join(part.get("text", "") for part in user)
+            break
+    text = f"Stub reply to: {user}"
+
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        schema = response_format.get("json_schema", {}).get("schema", {})
+        return json.dumps(fill_schema(schema, text, advance))
+    if response_format.get("type") == "json_object":
+        return json.dumps({"content": text})
+    return text
+
+
+def completion_payload(request: dict, content: str) -> dict:
+    """The non-streamed chat.completion answering `request` with `content`."""
+    # roughly four characters per token, like the context manager's estimate
+    prompt = sum(len(str(m.get("content") or "")) for m in request.get("messages", []))
+    return {
+        "id": f"chatcmpl-stub-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get("model") or "stub",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content, "refusal": None},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt // 4,
+            "completion_tokens": len(content) // 4,
+            "total_tokens": (prompt + len(content)) // 4,
+        },
+    }
+
+
+def completion_events(
+    request: dict, content: str, delta_chars: int = DELTA_CHARS
+) -> List[str]:
+    """The server-sent events streaming `content`, `delta_chars` at a time.
+
+    A role event, one event per piece of content, a stop event and [DONE].
+    """
+    chunk = {
+        "id": f"chatcmpl-stub-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": request.get("model") or "stub",
+    }
+
+    def event(delta: dict, finish_reason=None) -> str:
+        choice = {"index": 0, "delta": delta, "finish_reason": finish_reason}
+        return f"data: {json.dumps(dict(chunk, choices=[choice]))}\n\n"
+
+    size = max(1, delta_chars)
+    events = [event({"role": "assistant", "content": ""})]
+    events += [
+        event({"content": content[start : start + size]})
+        for start in range(0, len(content), size)
+    ]
+    events.append(event({}, "stop"))
+    events.append("data: [DONE]\n\n")
+    return events
+
+
+async def paced(events: List[str], delta_delay: float):
+    """Yield `events`, waiting `delta_delay` between the content events."""
+    for index, text in enumerate(events):
+        if delta_delay > 0 and 2 <= index < len(events) - 2:
+            await asyncio.sleep(delta_delay)
+        yield text
+
+
+class _Stub:
+    """Timing and content shared by the stub server and the stub transport."""
+
+    def __init__(
+        self,
+        ttfb: float = 0.0,
+        delta_delay: float = 0.0,
+        delta_chars: int = DELTA_CHARS,
+        advance: bool = False,
+    ):
+        self.ttfb = ttfb
+        self.delta_delay = delta_delay
+        self.delta_chars = max(1, delta_chars)
+        self.advance = advance
+        self.requests = 0
+
+    def respond(self, request: dict) -> Optional[str]:
+        """The content answering `request`, or None for a 404."""
+        return stub_content(request, self.advance)
+
+    def missing(self, path: str) -> str:
+        """The error message when `respond` has nothing for a request to `path`."""
+        return f"No response for {path}"
+
+    def generation_time(self, content: str) -> float:
+        """How long streaming `content` takes; a non-streamed reply waits as long."""
+        pieces = -(-len(content) // self.delta_chars)
+        return self.ttfb + self.delta_delay * max(0, pieces - 1)
+
+
+class StubServer(_Stub):
+    """HTTP/1.1 keep-alive server speaking enough of the chat completions API."""
+
+    async def start(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        return await asyncio.start_server(self._handle_client, host, port)
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        server = await self.start(host, port)
+        sockets = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        logging.info(f"OpenAI stub listening on {sockets}")
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, body = request
+                await self._respond(writer, method, path, body)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            logging.error(f"Error in stub connection: {e}")
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        method, path, _ = line.decode("latin-1").split(" ", 2)
+        length = 0
+        while True:
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value.strip())
+        body = await reader.readexactly(length) if length else b""
+        return method, path.split("?", 1)[0], body
+
+    @staticmethod
+    def _head(status: int, headers: dict) -> bytes:
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _send_json(self, writer, status: int, payload: Optional[dict]):
+        data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        headers = {"Content-Type": "application/json", "Content-Length": len(data)}
+        writer.write(self._head(status, headers) + data)
+        await writer.drain()
+
+    async def _respond(self, writer, method: str, path: str, body: bytes):
+        if method == "HEAD":
+            await self._send_json(writer, 200, None)
+            return
+        status, request, content = _route(self, method, path, body)
+        if content is None:
+            await self._send_json(writer, status, request)
+            return
+
+        if not request.get("stream"):
+            await asyncio.sleep(self.generation_time(content))
+            await self._send_json(writer, 200, completion_payload(request, content))
+            return
+
+        if self.ttfb > 0:
+            await asyncio.sleep(self.ttfb)
+        headers = {"Content-Type": "text/event-stream", "Transfer-Encoding": "chunked"}
+        writer.write(self._head(200, headers))
+        events = completion_events(request, content, self.delta_chars)
+        async for text in paced(events, self.delta_delay):
+            data = text.encode("utf-8")
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+
+def _route(stub: _Stub, method: str, path: str, body: bytes):
+    """(200, request, content) for a chat completion, else (status, error, None)."""
+    if method != "POST" or not path.endswith("/chat/completions"):
+        error = {"message": f"{method} {path} is not stubbed", "type": "not_found"}
+        return 404, {"error": error}, None
+    try:
+        request = json.loads(body)
+    except ValueError as e:
+        error = {"message": f"Invalid JSON body: {e}", "type": "invalid_request"}
+        return 400, {"error": error}, None
+    content = stub.respond(request)
+    if content is None:
+        error = {"message": stub.missing(path), "type": "not_found"}
+        return 404, {"error": error}, None
+    stub.requests += 1
+    return 200, request, content
+
+
+class _EventStream(httpx.AsyncByteStream):
+    def __init__(self, events: List[str], delta_delay: float):
+        self._events = events
+        self._delta_delay = delta_delay
+
+    async def __aiter__(self):
+        async for text in paced(self._events, self._delta_delay):
+            yield text.encode("utf-8")
+
+    async def aclose(self):
+        pass
+
+
+class StubTransport(_Stub, httpx.AsyncBaseTransport):
+    """The stub server in-process, as an httpx transport with no socket.
+
+    Pass it to `openai.DefaultAsyncHttpxClient(transport=...)` and the OpenAI
+    SDK's own streaming and parsing run on what `respond` returns. Subclasses
+    override `respond`, and may set `ttfb` and `delta_delay` per request there.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(200)
+        body = await request.aread()
+        status, body, content = _route(self, request.method, request.url.path, body)
+        if content is None:
+            return httpx.Response(status, json=body)
+
+        if not body.get("stream"):
+            await asyncio.sleep(self.generation_time(content))
+            return httpx.Response(200, json=completion_payload(body, content))
+        if self.ttfb > 0:
+            await asyncio.sleep(self.ttfb)
+        events = completion_events(body, content, self.delta_chars)
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            stream=_EventStream(events, self.delta_delay),
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--ttfb", type=float, default=0.0, help="seconds before the first byte"
+    )
+    parser.add_argument(
+        "--delta-delay",
+        type=float,
+        default=0.0,
+        help="seconds between streamed deltas",
+    )
+    parser.add_argument(
+        "--advance",
+        action="store_true",
+        help="answer with the first transition instead of staying in the state",
+    )
+    parser.add_argument(
+        "--log-level",
+        help="debug, info, warning or error (default: ARXIS_LOG_LEVEL or info)",
+    )
+    args = parser.parse_args(argv)
+
+    configure_logging(args.log_level)
+    server = StubServer(args.ttfb, args.delta_delay, advance=args.advance)
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
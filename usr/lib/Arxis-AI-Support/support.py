@@ -1,40 +1,21 @@
 import os
 import openai
 import logging
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 from fsm_llm.fsm import LLMStateMachine
-from fsm_llm.state_models import DefaultResponse
+from fsm_llm.state_models import DefaultResponse, FSMState
 from pydantic import BaseModel
-from dotenv import load_dotenv
-
-
-logging.basicConfig(level=logging.DEBUG)
-# Load project-local .env first
-load_dotenv()
-
-# Also attempt to load a system-wide env file so packaged installs can provide
-# the OPENAI_API_KEY via /etc/arxis-ai-support/env. Only try to load it if the
-# current user can read the file to avoid noisy permission errors.
-SYSTEM_ENV = "/etc/arxis-ai-support/env"
-try:
-    if os.path.exists(SYSTEM_ENV) and os.access(SYSTEM_ENV, os.R_OK):
-        load_dotenv(SYSTEM_ENV, override=False)
-    else:
-        logging.debug(f"{SYSTEM_ENV} not found or not readable by current user")
-except Exception as e:
-    logging.debug(f"Could not load system env file {SYSTEM_ENV}: {e}")
-
-# Also attempt to read a per-user config which is commonly used for GUI apps. This
-# allows end-users to put their API key in ~/.config/arxis-ai-support/env which is
-# readable by the running user and avoids requiring root-owned files.
-try:
-    user_env = os.path.expanduser("~/.config/arxis-ai-support/env")
-    if os.path.exists(user_env) and os.access(user_env, os.R_OK):
-        load_dotenv(user_env, override=True)
-        logging.debug(f"Loaded user env from {user_env}")
-    else:
-        logging.debug(f"User env {user_env} not found or not readable")
-except Exception as e:
-    logging.debug(f"Could not load user env file {user_env}: {e}")
+from cache import ResponseCache, create_cache
+from client import get_client
+from intent import create_classifier
+from retry import RetryPolicy, create_retry_policy
+from completions import SupportLLMUtilities
+from context import ContextManager, create_context_manager
+from environment import load_environment
+from metrics import metrics
+from transport import is_offline
 
 
 class UserIdentificationResponse(BaseModel):
@@ -44,114 +25,177 @@ class UserIdentificationResponse(BaseModel):
 # ConfirmationResponse removed: confirmation step was removed and is no longer used.
 
 
-class SupportBot:
-    def __init__(self):
-        try:
+@lru_cache(maxsize=None)
+def _configure_openai():
+    """Validate the OpenAI settings from the environment once per process."""
+    load_environment()
+    api_key = os.getenv("OPENAI_API_KEY")
+    organization = os.getenv("OPENAI_ORGANIZATION")
+
+    # replay and stub transports answer without the API
+    if not api_key and not is_offline():
+        raise ValueError("OPENAI_API_KEY environment variable is not set")
+
+    if api_key:
+        openai.api_key = api_key
+    if organization:
+        openai.organization = organization
+
+
+def shared_client() -> openai.AsyncOpenAI:
+    """Return the process-wide async client with its pooled HTTP transport."""
+    _configure_openai()
+    return get_client()
+
+
+@lru_cache(maxsize=None)
+def shared_retry_policy() -> RetryPolicy:
+    """Retry policy shared by all sessions, so p95 latency is measured across them."""
+    return create_retry_policy()
+
+
+@lru_cache(maxsize=None)
+def shared_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache configured by ARXIS_CACHE."""
+    return create_cache()
+
+
+async def start_state(
+    fsm: LLMStateMachine,
+    response: UserIdentificationResponse,
+    will_transition: bool,
+):
+    try:
+        logging.debug("START state: %s", response)
+        if will_transition and fsm.get_next_state() == "IDENTIFIED":
+            fsm.set_context_data(
+                "verified_user",
+                {"user_name": response.user_name},
+            )
+            return (
+                f"Thank you! You provided your name as: {response.user_name}.\n"
+                f"How can I help you today?"
+            )
+        return "Please provide your name to get started."
+    except Exception as e:
+        logging.error(f"Error in start_state: {e}")
+        return (
+            "I'm sorry, there was an error processing your request. Please try again."
+        )
 
-            self.ai_client = openai.AsyncOpenAI()
 
-            api_key = os.getenv("OPENAI_API_KEY")
-            organization = os.getenv("OPENAI_ORGANIZATION")
+async def identified_state(
+    fsm: LLMStateMachine, response: DefaultResponse, will_transition: bool
+):
+    try:
+        logging.debug("IDENTIFIED state: %s", response)
+        if will_transition and fsm.get_next_state() == "END":
+            return "Thank you! Have a great day!"
+        return (
+            response.content
+            or "You have been identified successfully. How can I assist you further?"
+        )
+    except Exception as e:
+        logging.error(f"Error in identified_state: {e}")
+        return (
+            "I'm sorry, there was an error processing your request. Please try again."
+        )
 
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY environment variable is not set")
 
-            openai.api_key = api_key
-            if organization:
-                openai.organization = organization
+async def end_state(
+    fsm: LLMStateMachine, response: DefaultResponse, will_transition: bool
+):
+    try:
+        logging.debug("END state: %s", response)
+        return "Goodbye! If you need further assistance, feel free to reach out again."
+    except Exception as e:
+        logging.error(f"Error in end_state: {e}")
+        return "Goodbye!"
+
+
+@lru_cache(maxsize=None)
+def state_definitions() -> Mapping[str, FSMState]:
+    """Compile the FSM state definitions once and share them read-only.
+
+    Prompt templates, response models, transitions and handlers are the same for
+    every conversation, so sessions reuse this registry instead of re-running the
+    `define_state` decorators.
+    """
+    template = LLMStateMachine(initial_state="START", end_state="END")
+
+    # START state for user identification.
+    template.define_state(
+        state_key="START",
+        prompt_template=(
+            "You are a customer support bot. Your first task is to ask the user for their "
+            "name. Please ensure the user provides their name before proceeding."
+        ),
+        response_model=UserIdentificationResponse,
+        transitions={"IDENTIFIED": "Once the user provides their name"},
+    )(metrics.timed("fsm_handler")(start_state))
 
-            self.fsm = LLMStateMachine(initial_state="START", end_state="END")
-            self._define_states()
+    # Confirmation step removed: asking for the user's name is sufficient.
 
-        except Exception as e:
-            logging.error(f"Error initializing SupportBot: {e}")
-            raise
+    # IDENTIFIED state for ongoing conversation.
+    template.define_state(
+        state_key="IDENTIFIED",
+        prompt_template=(
+            "Thank you for identifying yourself. Is there anything else you need help with?"
+        ),
+        response_model=DefaultResponse,
+        transitions={"END": "When the user indicates the conversation is over"},
+    )(metrics.timed("fsm_handler")(identified_state))
 
-    def _define_states(self):
-        """Define all FSM states by delegating to individual state definition methods."""
-        try:
-            self._define_start_state()
-            self._define_identified_state()
-            self._define_end_state()
-        except Exception as e:
-            logging.error(f"Error defining states: {e}")
-            raise
+    # END state for conversation termination.
+    template.define_state(
+        state_key="END",
+        prompt_template="Thank you! Goodbye.",
+        response_model=DefaultResponse,
+    )(metrics.timed("fsm_handler")(end_state))
 
-    def _define_start_state(self):
-        """Define the START state for user identification."""
-
-        @self.fsm.define_state(
-            state_key="START",
-            prompt_template=(
-                "You are a customer support bot. Your first task is to ask the user for their "
-                "name. Please ensure the user provides their name before proceeding."
-            ),
-            response_model=UserIdentificationResponse,
-            transitions={"IDENTIFIED": "Once the user provides their name"},
-        )
-        async def start_state(
-            fsm: LLMStateMachine,
-            response: UserIdentificationResponse,
-            will_transition: bool,
-        ):
-            try:
-                logging.debug(f"START state: {response}")
-                if will_transition and fsm.get_next_state() == "IDENTIFIED":
-                    fsm.set_context_data(
-                        "verified_user",
-                        {"user_name": response.user_name},
-                    )
-                    return (
-                        f"Thank you! You provided your name as: {response.user_name}.\n"
-                        f"How can I help you today?"
-                    )
-                return "Please provide your name to get started."
-            except Exception as e:
-                logging.error(f"Error in start_state: {e}")
-                return "I'm sorry, there was an error processing your request. Please try again."
+    return MappingProxyType(dict(template._state_registry))
 
-    # Confirmation step removed: asking for the user's name is sufficient.
 
-    def _define_identified_state(self):
-        """Define the IDENTIFIED state for ongoing conversation."""
+class SupportBot:
+    """One support conversation: a small per-session state machine over shared parts.
+
+    The OpenAI client and the compiled state definitions are created once per
+    process; each instance only allocates its own FSM (current state, history and
+    context data).
+    """
+
+    def __init__(
+        self,
+        ai_client: Optional[openai.AsyncOpenAI] = None,
+        states: Optional[Mapping[str, FSMState]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        context: Optional[ContextManager] = None,
+    ):
+        try:
+            load_environment()
+            self.ai_client = ai_client if ai_client is not None else shared_client()
 
-        @self.fsm.define_state(
-            state_key="IDENTIFIED",
-            prompt_template=(
-                "Thank you for identifying yourself. Is there anything else you need help with?"
-            ),
-            response_model=DefaultResponse,
-            transitions={"END": "When the user indicates the conversation is over"},
-        )
-        async def identified_state(
-            fsm: LLMStateMachine, response: DefaultResponse, will_transition: bool
-        ):
-            try:
-                logging.debug(f"IDENTIFIED state: {response}")
-                if will_transition and fsm.get_next_state() == "END":
-                    return "Thank you! Have a great day!"
-                return (
-                    response.content
-                    or "You have been identified successfully. How can I assist you further?"
-                )
-            except Exception as e:
-                logging.error(f"Error in identified_state: {e}")
-                return "I'm sorry, there was an error processing your request. Please try again."
-
-    def _define_end_state(self):
-        """Define the END state for conversation termination."""
-
-        @self.fsm.define_state(
-            state_key="END",
-            prompt_template="Thank you! Goodbye.",
-            response_model=DefaultResponse,
-        )
-        async def end_state(
-            fsm: LLMStateMachine, response: DefaultResponse, will_transition: bool
-        ):
-            try:
-                logging.debug(f"END state: {response}")
-                return "Goodbye! If you need further assistance, feel free to reach out again."
-            except Exception as e:
-                logging.error(f"Error in end_state: {e}")
-                return "Goodbye!"
+            self.fsm = LLMStateMachine(initial_state="START", end_state="END")
+            self.fsm._state_registry = (
+                states if states is not None else state_definitions()
+            )
+            # fsm_llm has no hook for swapping the completion handler, so replace
+            # its instance to get streamed deltas out of run_state_machine.
+            self.llm = SupportLLMUtilities(
+                cache=response_cache if response_cache is not None else shared_cache(),
+                classifier=create_classifier(),
+                retry=shared_retry_policy(),
+            )
+            self.fsm._llm_utils = self.llm
+            # per session: a rolling summary keeps state between turns
+            self.context = context if context is not None else create_context_manager()
+
+        except Exception as e:
+            logging.error(f"Error initializing SupportBot: {e}")
+            raise
+
+    def end(self):
+        """Put the state machine in its end state without another turn."""
+        # set_next_state only takes effect at the end of a run_state_machine
+        self.fsm._state = self.fsm._end_state
+        self.fsm._next_state = None
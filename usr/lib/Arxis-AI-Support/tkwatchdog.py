@@ -0,0 +1,159 @@
+import logging
+import os
+import time
+import tkinter
+from typing import Callable, Optional
+
+from metrics import metrics
+
+
+DEFAULT_INTERVAL_MS = 100
+DEFAULT_THRESHOLD_MS = 200
+
+
+def describe(func) -> str:
+    """Name a Tk callback as `qualname (file:line)`, looking through `after` wrappers."""
+    code = getattr(func, "__code__", None)
+    if code is not None and code.co_name == "callit" and "func" in code.co_freevars:
+        func = func.__closure__[code.co_freevars.index("func")].cell_contents
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return name
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class _TimedCallWrapper(tkinter.CallWrapper):
+    """tkinter.CallWrapper that reports every callback's duration to the watchdog."""
+
+    watchdog: Optional["TkWatchdog"] = None
+
+    def __call__(self, *args):
+        watchdog = _TimedCallWrapper.watchdog
+        if watchdog is None:
+            return super().__call__(*args)
+        return watchdog.timed(self.func, super().__call__, *args)
+
+
+class TkWatchdog:
+    """Measure how late the Tk event loop runs and name the callbacks that block it.
+
+    A heartbeat is scheduled every `interval_ms`; the difference between when it
+    was due and when it ran is the loop lag, recorded as the `tk_lag` span.
+    While started, every Tk callback (after, bindings, commands) registered from
+    then on is timed, and one running longer than `threshold_ms` is logged as a
+    stall with its name and recorded as the `tk_stall` span. A lag over the
+    threshold with no slow callback to blame (e.g. layout or redraw) is logged
+    as well, naming the slowest callback since the previous heartbeat.
+
+    Callbacks that run others, like TkAsyncBridge's poller, pass each one to
+    `timed` so a stall is blamed on it rather than on the dispatcher.
+
+    Everything except `start` and `stop` runs on the Tk thread.
+    """
+
+    def __init__(
+        self,
+        root,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        threshold_ms: int = DEFAULT_THRESHOLD_MS,
+    ):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.threshold = threshold_ms / 1000
+        self.ticks = 0
+        self.stalls = 0
+        self.max_lag = 0.0
+        self._due = 0.0
+        self._slowest = (None, 0.0)
+        # time taken by callbacks nested in the one running now
+        self._nested = 0.0
+        self._after_id = None
+        self._original_wrapper = None
+
+    def start(self):
+        """Install the callback timer and schedule the first heartbeat."""
+        if self._original_wrapper is None:
+            self._original_wrapper = tkinter.CallWrapper
+            tkinter.CallWrapper = _TimedCallWrapper
+        _TimedCallWrapper.watchdog = self
+        self._schedule()
+
+    def stop(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception as e:
+                logging.error(f"Error cancelling watchdog heartbeat: {e}")
+            self._after_id = None
+        if self._original_wrapper is not None:
+            tkinter.CallWrapper = self._original_wrapper
+            self._original_wrapper = None
+        if _TimedCallWrapper.watchdog is self:
+            _TimedCallWrapper.watchdog = None
+
+    def _schedule(self):
+        self._due = time.perf_counter() + self.interval_ms / 1000
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        lag = max(0.0, time.perf_counter() - self._due)
+        self.ticks += 1
+        self.max_lag = max(self.max_lag, lag)
+        metrics.observe("tk_lag", lag)
+
+        func, seconds = self._slowest
+        self._slowest = (None, 0.0)
+        if lag >= self.threshold and seconds < self.threshold:
+            self.stalls += 1
+            culprit = describe(func) if func is not None else "none"
+            logging.warning(
+                "Tk event loop lagged %.0f ms; slowest callback: %s (%.0f ms)",
+                lag * 1000,
+                culprit,
+                seconds * 1000,
+            )
+        self._schedule()
+
+    def timed(self, func, call: Callable, *args):
+        """Run `call(*args)` and account its time to `func`, less nested callbacks."""
+        outer, self._nested = self._nested, 0.0
+        started = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            inner, self._nested = self._nested, outer + elapsed
+            self.callback_done(func, elapsed - inner)
+
+    def callback_done(self, func, seconds: float):
+        """Account one finished Tk callback; called by `timed`."""
+        if seconds > self._slowest[1]:
+            self._slowest = (func, seconds)
+        if seconds >= self.threshold:
+            self.stalls += 1
+            metrics.observe("tk_stall", seconds)
+            logging.warning(
+                "Tk callback %s blocked the event loop for %.0f ms",
+                describe(func),
+                seconds * 1000,
+            )
+
+    def stats(self) -> dict:
+        return {"ticks": self.ticks, "stalls": self.stalls, "max_lag": self.max_lag}
+
+
+def create_watchdog(root) -> Optional[TkWatchdog]:
+    """Build the Tk watchdog selected by the deployment settings.
+
+    - ARXIS_WATCHDOG: on (default) or off
+    - ARXIS_WATCHDOG_MS: stall threshold in milliseconds (default 200)
+    """
+    if os.getenv("ARXIS_WATCHDOG", "on").strip().lower() in ("off", "0", "false"):
+        return None
+    try:
+        threshold = int(os.getenv("ARXIS_WATCHDOG_MS", DEFAULT_THRESHOLD_MS))
+    except ValueError:
+        logging.error("ARXIS_WATCHDOG_MS is not an integer, using 200")
+        threshold = DEFAULT_THRESHOLD_MS
+    return TkWatchdog(root, threshold_ms=threshold)
@@ -0,0 +1,264 @@
+import logging
+import ttkbootstrap as ttk
+from typing import Callable, List, Optional, Tuple
+
+
+# A run of text and the Text tag it is displayed with.
+Segment = Tuple[str, str]
+
+TRANSCRIPT_WINDOW = 120
+TRANSCRIPT_PAGE = 30
+
+
+class Entry:
+    """One message of the transcript: its label and text segments."""
+
+    __slots__ = ("segments", "copyable")
+
+    def __init__(self, segments: List[Segment]):
+        self.segments = segments
+        self.copyable = False
+
+    def text(self) -> str:
+        """The message text without its label, as the copy action copies it."""
+        return "".join(text for text, _ in self.segments[1:]).rstrip("\n")
+
+
+class TranscriptStore:
+    """Every message of the conversation, held as plain strings."""
+
+    def __init__(self):
+        self.entries: List[Entry] = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getitem__(self, index: int) -> Entry:
+        return self.entries[index]
+
+    def append(self, segments: List[Segment]) -> int:
+        self.entries.append(Entry(list(segments)))
+        return len(self.entries) - 1
+
+
+class TranscriptView:
+    """Show a sliding window of a TranscriptStore in the chat Text widget.
+
+    Only entries `first` to `last` (exclusive) exist in the widget, so its size
+    stays bounded however long the conversation gets. Older entries are paged
+    in when the user scrolls to the top, newer ones when scrolling back to the
+    bottom, and entries scrolled far out of view are removed again.
+
+    Copy actions are not widgets: each copyable entry shows the shared
+    `copy_image` (or a "Copy" label) tagged with COPY_TAG and the entry's id tag,
+    and one click binding on COPY_TAG passes the entry's text to `on_copy`.
+
+    Every method must run on the Tk thread. Edit methods expect the widget to be
+    writable; the caller toggles its state, as StreamRenderer.flush does.
+    """
+
+    STREAM_MARK = "agent_stream"
+    ANCHOR_MARK = "transcript_anchor"
+    COPY_TAG = "COPY"
+
+    def __init__(
+        self,
+        display,
+        scrollbar=None,
+        copy_image=None,
+        on_copy: Optional[Callable[[str], None]] = None,
+        window: int = TRANSCRIPT_WINDOW,
+        page: int = TRANSCRIPT_PAGE,
+    ):
+        self.display = display
+        self.scrollbar = scrollbar
+        self.copy_image = copy_image
+        self.on_copy = on_copy
+        self.window = max(2, window)
+        self.page = max(1, page)
+        self.store = TranscriptStore()
+        self.first = 0
+        self.last = 0
+        self._open = False
+        self._paging = False
+
+        if scrollbar is not None:
+            display.config(yscrollcommand=self._on_scroll)
+        display.tag_bind(self.COPY_TAG, "<Button-1>", self._on_copy_click)
+        display.tag_bind(
+            self.COPY_TAG, "<Enter>", lambda event: display.config(cursor="hand2")
+        )
+        display.tag_bind(
+            self.COPY_TAG, "<Leave>", lambda event: display.config(cursor="arrow")
+        )
+
+    @staticmethod
+    def _mark(index: int) -> str:
+        return f"entry{index}"
+
+    @staticmethod
+    def _id_tag(index: int) -> str:
+        return f"copy{index}"
+
+    @property
+    def following(self) -> bool:
+        """True when the newest entry is materialized."""
+        return self.last == len(self.store)
+
+    def _pieces(self, index: int):
+        """Yield what entry `index` puts in the widget, in display order."""
+        entry = self.store[index]
+        for text, tag in entry.segments:
+            yield text, tag
+        if entry.copyable:
+            yield "\n", ""
+            yield None, None
+            yield "\n\n", ""
+
+    def _put(self, position: str, text: Optional[str], tag: str, index: int):
+        display = self.display
+        if text is not None:
+            display.insert(position, text, tag)
+            return
+        tags = (self.COPY_TAG, self._id_tag(index))
+        if self.copy_image is None:
+            display.insert(position, "Copy", tags)
+            return
+        start = display.index("end-1c") if position == ttk.END else position
+        display.image_create(position, image=self.copy_image)
+        for name in tags:
+            display.tag_add(name, start)
+
+    def _render_bottom(self, index: int):
+        start = self.display.index("end-1c")
+        for text, tag in self._pieces(index):
+            self._put(ttk.END, text, tag, index)
+        self.display.mark_set(self._mark(index), start)
+
+    def _render_top(self, index: int):
+        for text, tag in reversed(list(self._pieces(index))):
+            self._put("1.0", text, tag, index)
+        self.display.mark_set(self._mark(index), "1.0")
+
+    def _release(self, index: int):
+        self.display.mark_unset(self._mark(index))
+        if self.store[index].copyable:
+            self.display.tag_delete(self._id_tag(index))
+
+    def _drop_top(self):
+        index = self.first
+        self.display.delete("1.0", self._mark(index + 1))
+        self._release(index)
+        self.first += 1
+
+    def _drop_bottom(self):
+        index = self.last - 1
+        self.display.delete(self._mark(index), ttk.END)
+        self._release(index)
+        self.last -= 1
+
+    def _trim_top(self):
+        while self.last - self.first > self.window:
+            self._drop_top()
+
+    def show_end(self):
+        """Materialize the newest `window` entries, e.g. after scrolling far up."""
+        if self.following:
+            return
+        for index in range(self.first, self.last):
+            self._release(index)
+        self.display.delete("1.0", ttk.END)
+        self.first = self.last = max(0, len(self.store) - self.window)
+        while self.last < len(self.store):
+            self._render_bottom(self.last)
+            self.last += 1
+
+    def add(self, segments: List[Segment]):
+        """Append a finished message."""
+        self.show_end()
+        index = self.store.append(segments)
+        self._render_bottom(index)
+        self.last = index + 1
+        self._trim_top()
+
+    def begin(self, label: str, tag: str):
+        """Append a message whose text is streamed in by `write` until `end`."""
+        self.add([(label, tag)])
+        self.display.mark_set(self.STREAM_MARK, "end-1c")
+        self.display.mark_gravity(self.STREAM_MARK, ttk.LEFT)
+        self._open = True
+
+    def write(self, text: str, tag: str):
+        segments = self.store[-1].segments
+        if segments[-1][1] == tag:
+            segments[-1] = (segments[-1][0] + text, tag)
+        else:
+            segments.append((text, tag))
+        self.display.insert(ttk.END, text, tag)
+
+    def replace(self, text: str, tag: str):
+        """Replace everything written since `begin`."""
+        entry = self.store[-1]
+        entry.segments = [entry.segments[0], (text, tag)]
+        self.display.delete(self.STREAM_MARK, "end-1c")
+        self.display.insert(ttk.END, text, tag)
+
+    def end(self):
+        self.write("\n", "")
+        self._open = False
+
+    def attach_copy(self):
+        """Give the newest message a copy action."""
+        index = len(self.store) - 1
+        if index < 0 or self.store[index].copyable:
+            return
+        self.store[index].copyable = True
+        if self.following:
+            for piece, tag in list(self._pieces(index))[-3:]:
+                self._put(ttk.END, piece, tag, index)
+
+    def _on_copy_click(self, event=None):
+        for name in self.display.tag_names("current"):
+            if name.startswith("copy") and name[4:].isdigit():
+                index = int(name[4:])
+                if self.on_copy is not None and index < len(self.store):
+                    self.on_copy(self.store[index].text())
+                return "break"
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self._paging:
+            return
+        if float(first) <= 0.0 and self.first > 0:
+            self._paging = True
+            self.display.after_idle(self._page, self._page_older)
+        elif float(last) >= 1.0 and not self.following:
+            self._paging = True
+            self.display.after_idle(self._page, self._page_newer)
+
+    def _page(self, step):
+        display = self.display
+        try:
+            display.mark_set(self.ANCHOR_MARK, "@0,0")
+            display.config(state=ttk.NORMAL)
+            step()
+            display.yview(self.ANCHOR_MARK)
+        except Exception as e:
+            logging.error(f"Error paging transcript: {e}")
+        finally:
+            display.config(state=ttk.DISABLED)
+            self._paging = False
+
+    def _page_older(self):
+        for _ in range(min(self.page, self.first)):
+            self.first -= 1
+            self._render_top(self.first)
+        # the message being streamed always stays in the widget
+        while self.last - self.first > self.window and not self._open:
+            self._drop_bottom()
+
+    def _page_newer(self):
+        for _ in range(min(self.page, len(self.store) - self.last)):
+            self._render_bottom(self.last)
+            self.last += 1
+        self._trim_top()
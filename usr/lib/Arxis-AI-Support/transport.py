@@ -0,0 +1,252 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Optional
+
+import httpx
+
+from journal import Journal
+
+
+MODES = ("live", "record", "replay", "stub")
+DEFAULT_CASSETTE = os.path.expanduser("~/.cache/arxis-ai-support/cassette.jsonl")
+DEFAULT_STUB_URL = "http://127.0.0.1:8787/v1"
+# the client insists on a key; offline modes never send it anywhere real
+OFFLINE_API_KEY = "sk-offline"
+
+# response headers a replay needs to decode the body like the original
+_KEPT_HEADERS = ("content-type", "content-encoding")
+
+
+def transport_mode() -> str:
+    """The OpenAI transport selected by ARXIS_TRANSPORT (default live)."""
+    mode = (os.getenv("ARXIS_TRANSPORT") or "live").strip().lower()
+    if mode not in MODES:
+        logging.error(f"Unknown ARXIS_TRANSPORT '{mode}', using live")
+        return "live"
+    return mode
+
+
+def is_offline() -> bool:
+    """True when completions are served without the OpenAI API (replay or stub)."""
+    return transport_mode() in ("replay", "stub")
+
+
+def request_key(method: str, path: str, body: bytes) -> str:
+    """Identify a request by method, path and JSON body, ignoring key order."""
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True).encode("utf-8")
+    except ValueError:
+        pass
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return f"{method} {path} {digest}"
+
+
+def _text(chunk: bytes) -> str:
+    # surrogateescape keeps a multi-byte character split across chunks intact
+    return chunk.decode("utf-8", "surrogateescape")
+
+
+class _RecordingStream(httpx.AsyncByteStream):
+    """Pass a response body through while noting each chunk and when it arrived."""
+
+    def __init__(self, stream, started: float, on_close):
+        self._stream = stream
+        self._started = started
+        self._on_close = on_close
+        self.chunks: List[list] = []
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self.chunks.append([time.perf_counter() - self._started, _text(chunk)])
+            yield chunk
+
+    async def aclose(self):
+        await self._stream.aclose()
+        self._on_close(self.chunks)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forward requests to `transport` and append every POST exchange to a cassette.
+
+    The cassette is a JSON-lines file written in the background by a Journal.
+    It holds the request path and body, the status, the content headers and the
+    body chunks with their arrival times, never the request headers, so API keys
+    stay out of it. Bodies stream through to the caller as they arrive.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, path: str):
+        self.transport = transport
+        self.path = path
+        self.cassette = Journal(path, max_bytes=0)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        if request.method != "POST":
+            return response
+
+        body = await request.aread()
+        interaction = {
+            "key": request_key(request.method, request.url.path, body),
+            "method": request.method,
+            "path": request.url.path,
+            "request": _text(body),
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in _KEPT_HEADERS
+                if name in response.headers
+            },
+            "headers_at": time.perf_counter() - started,
+        }
+
+        def _save(chunks):
+            interaction["chunks"] = chunks
+            self.cassette.record(interaction)
+
+        response.stream = _RecordingStream(response.stream, started, _save)
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+        self.cassette.close()
+
+
+class _ReplayStream(httpx.AsyncByteStream):
+    """Send recorded body chunks at their recorded times, scaled."""
+
+    def __init__(self, chunks: List[list], headers_at: float, scale: float):
+        self._chunks = chunks
+        self._headers_at = headers_at
+        self._scale = scale
+
+    async def __aiter__(self):
+        elapsed = self._headers_at
+        for at, text in self._chunks:
+            wait = (at - elapsed) * self._scale
+            if wait > 0:
+                await asyncio.sleep(wait)
+            elapsed = max(elapsed, at)
+            yield text.encode("utf-8", "surrogateescape")
+
+    async def aclose(self):
+        pass
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answer requests from a cassette written by RecordingTransport, without a network.
+
+    A request gets the oldest unused exchange recorded for the same method, path
+    and body. Failing that, e.g. after a prompt change, it gets the next unused
+    exchange for the same path in recording order, so a conversation still runs.
+    Recorded timings are replayed times `latency_scale` (0: no waiting).
+    """
+
+    def __init__(self, path: str, latency_scale: float = 1.0):
+        self.path = path
+        self.latency_scale = latency_scale
+        self.misses = 0
+        self._by_key: Dict[str, deque] = defaultdict(deque)
+        self._by_path: Dict[str, deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    interaction = json.loads(line)
+                    interaction["used"] = False
+                    self._by_key[interaction["key"]].append(interaction)
+                    self._by_path[interaction["path"]].append(interaction)
+                except (ValueError, KeyError, TypeError) as e:
+                    logging.error(f"Skipping {path}:{number}: {e}")
+
+    def __len__(self):
+        return sum(len(interactions) for interactions in self._by_path.values())
+
+    def _take(self, queue: deque) -> Optional[dict]:
+        while queue:
+            interaction = queue.popleft()
+            if not interaction["used"]:
+                interaction["used"] = True
+                return interaction
+        return None
+
+    def _match(self, method: str, path: str, body: bytes) -> Optional[dict]:
+        with self._lock:
+            key = request_key(method, path, body)
+            interaction = self._take(self._by_key.get(key, deque()))
+            if interaction is None:
+                interaction = self._take(self._by_path.get(path, deque()))
+                if interaction is not None:
+                    self.misses += 1
+                    logging.debug("No exact recording for %s, replaying in order", key)
+            return interaction
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(200)
+        body = await request.aread()
+        interaction = self._match(request.method, request.url.path, body)
+        if interaction is None:
+            message = f"No recorded response left for {request.url.path} in {self.path}"
+            return httpx.Response(
+                404, json={"error": {"message": message, "type": "cassette_miss"}}
+            )
+
+        headers_at = interaction.get("headers_at", 0.0)
+        if headers_at * self.latency_scale > 0:
+            await asyncio.sleep(headers_at * self.latency_scale)
+        return httpx.Response(
+            interaction["status"],
+            headers=interaction.get("headers", {}),
+            stream=_ReplayStream(
+                interaction.get("chunks", []), headers_at, self.latency_scale
+            ),
+        )
+
+
+def client_options() -> dict:
+    """Extra AsyncOpenAI arguments for the selected transport.
+
+    Offline modes work without OPENAI_API_KEY; stub mode points the client at
+    ARXIS_STUB_URL.
+    """
+    mode = transport_mode()
+    options = {}
+    if mode in ("replay", "stub") and not os.getenv("OPENAI_API_KEY"):
+        options["api_key"] = OFFLINE_API_KEY
+    if mode == "stub":
+        options["base_url"] = os.getenv("ARXIS_STUB_URL", DEFAULT_STUB_URL)
+    return options
+
+
+def create_transport(
+    limits: httpx.Limits, http2: bool = False
+) -> Optional[httpx.AsyncBaseTransport]:
+    """Build the transport under the OpenAI client, or None for the default one.
+
+    - ARXIS_TRANSPORT: live (default), record, replay or stub
+    - ARXIS_CASSETTE: cassette file for record and replay (default
+      ~/.cache/arxis-ai-support/cassette.jsonl)
+    - ARXIS_REPLAY_LATENCY: scale of the recorded timings in replay (default 1,
+      0 answers at once)
+    - ARXIS_STUB_URL: base URL of stub_server.py (default http://127.0.0.1:8787/v1)
+    """
+    mode = transport_mode()
+    path = os.path.expanduser(os.getenv("ARXIS_CASSETTE", DEFAULT_CASSETTE))
+    if mode == "record":
+        inner = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        return RecordingTransport(inner, path)
+    if mode == "replay":
+        try:
+            scale = float(os.getenv("ARXIS_REPLAY_LATENCY", 1.0))
+        except ValueError:
+            logging.error("ARXIS_REPLAY_LATENCY is not a number, using 1")
+            scale = 1.0
+        return ReplayTransport(path, latency_scale=scale)
+    return None
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from fsm_llm.utils import _generate_response_schema
+
+from client import client_manager
+from context import count_tokens
+
+try:
+    # private to the SDK: the conversion `parse`/`stream` run for response_format
+    from openai.lib._parsing._completions import type_to_response_format_param
+except ImportError:
+    type_to_response_format_param = None
+
+
+def prepare_states(fsm) -> int:
+    """Run the per-turn schema work of fsm_llm and openai once for every state.
+
+    The first call pays for lazy imports and pydantic/JSON-schema setup; later
+    calls do not. Returns the number of states prepared.
+    """
+    states = getattr(fsm, "_state_registry", {})
+    for state in states.values():
+        model = _generate_response_schema(
+            state.response_model, state.transitions, state.key
+        )
+        if type_to_response_format_param is not None:
+            type_to_response_format_param(model)
+        else:
+            model.model_json_schema()
+    count_tokens("warm up")
+    return len(states)
+
+
+async def warm_up(runner, report: Optional[Callable[[str], None]] = None) -> bool:
+    """Prepare `runner`'s backend so its first turn is as fast as later ones.
+
+    Builds the per-state response schemas off the event loop, loads the chat
+    resources of the client and opens a pooled connection to the API host.
+    `report` receives short progress messages. Returns True when everything,
+    including the connection, is ready.
+    """
+    report = report or (lambda text: None)
+    support_bot = runner.support_bot
+    fsm = getattr(support_bot, "fsm", None)
+    loop = asyncio.get_running_loop()
+
+    try:
+        report("Preparing conversation...")
+        await loop.run_in_executor(None, prepare_states, fsm)
+
+        # only the shared, pooled client keeps a warmed connection around
+        client = getattr(support_bot, "ai_client", None)
+        if not client_manager.is_open or client is not client_manager.get():
+            return True
+        # the chat resources are built, and their modules imported, on first use
+        client.chat.completions
+        client.beta.chat.completions
+
+        report("Connecting to AI service...")
+        return await client_manager.warm_up()
+    except Exception as e:
+        logging.error(f"Error during warm-up: {e}")
+        return False